@@ -0,0 +1,45 @@
+"""add chat_room activity indexes
+
+Revision ID: 3f9c1b7d2e64
+Revises: a2acedeedd03
+Create Date: 2026-10-19 10:12:41.508213
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "3f9c1b7d2e64"
+down_revision: Union[str, Sequence[str], None] = "a2acedeedd03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 회사/학생 입장별 최근 활동순 목록 인덱스
+    # (UNION ALL 각 가지가 인덱스 순서 그대로 스캔되도록 정렬식까지 포함)
+    op.create_index(
+        "ix_chat_rooms_company_activity",
+        "chat_rooms",
+        [
+            "company_id",
+            sa.text("coalesce(last_message_at, created_at) DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+    op.create_index(
+        "ix_chat_rooms_student_activity",
+        "chat_rooms",
+        [
+            "student_id",
+            sa.text("coalesce(last_message_at, created_at) DESC"),
+            sa.text("id DESC"),
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_rooms_student_activity", table_name="chat_rooms")
+    op.drop_index("ix_chat_rooms_company_activity", table_name="chat_rooms")
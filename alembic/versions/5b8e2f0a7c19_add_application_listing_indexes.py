@@ -0,0 +1,36 @@
+"""add application listing indexes
+
+Revision ID: 5b8e2f0a7c19
+Revises: c41a7e95b2d8
+Create Date: 2026-10-19 15:20:54.118306
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "5b8e2f0a7c19"
+down_revision: Union[str, Sequence[str], None] = "c41a7e95b2d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 회사 받은 지원 목록: 회사 + 상태 필터 + 최신순
+    op.create_index(
+        "ix_applications_company_status_created",
+        "applications",
+        ["company_id", "status", "created_at"],
+    )
+    # 학생 내 지원 목록: 최신순
+    op.create_index(
+        "ix_applications_student_created",
+        "applications",
+        ["student_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_student_created", table_name="applications")
+    op.drop_index("ix_applications_company_status_created", table_name="applications")
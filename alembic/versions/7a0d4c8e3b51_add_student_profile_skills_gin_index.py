@@ -0,0 +1,30 @@
+"""add student_profile skills gin index
+
+Revision ID: 7a0d4c8e3b51
+Revises: e6f3a9d1c582
+Create Date: 2026-10-19 18:41:12.603947
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "7a0d4c8e3b51"
+down_revision: Union[str, Sequence[str], None] = "e6f3a9d1c582"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기술 검색: @>(모두 포함)와 ?|(하나라도 포함)를 모두 지원하는 기본 jsonb_ops GIN
+    op.create_index(
+        "ix_student_profiles_skills",
+        "student_profiles",
+        ["skills"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_student_profiles_skills", table_name="student_profiles")
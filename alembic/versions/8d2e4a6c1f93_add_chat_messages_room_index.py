@@ -0,0 +1,29 @@
+"""add chat_messages room index
+
+Revision ID: 8d2e4a6c1f93
+Revises: 3f9c1b7d2e64
+Create Date: 2026-10-19 11:03:27.914520
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "8d2e4a6c1f93"
+down_revision: Union[str, Sequence[str], None] = "3f9c1b7d2e64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 재접속 재전송: 방별 id 이후 메시지 범위 조회
+    op.create_index(
+        "ix_chat_messages_room_id",
+        "chat_messages",
+        ["chat_room_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_messages_room_id", table_name="chat_messages")
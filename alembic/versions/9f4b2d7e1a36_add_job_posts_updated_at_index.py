@@ -0,0 +1,25 @@
+"""add job_posts updated_at index
+
+Revision ID: 9f4b2d7e1a36
+Revises: 7a0d4c8e3b51
+Create Date: 2026-10-19 19:52:37.418205
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "9f4b2d7e1a36"
+down_revision: Union[str, Sequence[str], None] = "7a0d4c8e3b51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 챗봇 공고 스냅샷의 변경분 조회 (updated_at >= 기준 시각)
+    op.create_index("ix_job_posts_updated_at", "job_posts", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_posts_updated_at", table_name="job_posts")
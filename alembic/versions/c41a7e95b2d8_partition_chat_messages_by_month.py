@@ -0,0 +1,121 @@
+"""partition chat_messages by month
+
+Revision ID: c41a7e95b2d8
+Revises: 8d2e4a6c1f93
+Create Date: 2026-10-19 13:47:09.226731
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c41a7e95b2d8"
+down_revision: Union[str, Sequence[str], None] = "8d2e4a6c1f93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 월 파티션 생성 함수 (chat_messages_pYYYYMM, UTC 기준 경계)
+# app/services/chat_partitions.py 의 ensure 명령과 앱 시작 시 주기 작업이 호출한다
+ENSURE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION ensure_chat_messages_partitions(
+    from_month timestamptz,
+    months_ahead integer
+) RETURNS integer AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', from_month AT TIME ZONE 'UTC');
+    last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+                            + make_interval(months => months_ahead);
+    partition_name text;
+    created integer := 0;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        partition_name := 'chat_messages_p' || to_char(month_start, 'YYYYMM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF chat_messages FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                month_start AT TIME ZONE 'UTC',
+                (month_start + interval '1 month') AT TIME ZONE 'UTC'
+            );
+            created := created + 1;
+        END IF;
+        month_start := month_start + interval '1 month';
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # 1. 기존 힙 테이블을 옆으로 치우기 (스키마 단위로 유일해야 하는 PK/인덱스 이름도 변경)
+    op.execute("ALTER TABLE chat_messages RENAME TO chat_messages_legacy")
+    op.execute("ALTER TABLE chat_messages_legacy RENAME CONSTRAINT chat_messages_pkey TO chat_messages_legacy_pkey")
+    op.execute("ALTER INDEX ix_chat_messages_room_id RENAME TO ix_chat_messages_legacy_room_id")
+
+    # 2. created_at 범위 파티션 테이블 (파티션 키는 PK에 포함되어야 함)
+    op.execute(
+        """
+        CREATE TABLE chat_messages (
+            id BIGINT NOT NULL DEFAULT nextval('chat_messages_id_seq'),
+            chat_room_id BIGINT NOT NULL REFERENCES chat_rooms (id) ON DELETE CASCADE,
+            sender_id BIGINT NOT NULL REFERENCES users (id) ON DELETE RESTRICT,
+            content TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT chat_messages_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE chat_messages_id_seq OWNED BY chat_messages.id")
+
+    # 3. 기존 데이터가 있는 달부터 3개월 뒤까지 파티션 생성 + 누락 대비 기본 파티션
+    op.execute(ENSURE_PARTITIONS_FUNCTION)
+    op.execute(
+        "SELECT ensure_chat_messages_partitions("
+        "coalesce((SELECT min(created_at) FROM chat_messages_legacy), now()), 3)"
+    )
+    op.execute("CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT")
+
+    # 4. 데이터 이관 후 기존 테이블 제거
+    op.execute(
+        "INSERT INTO chat_messages (id, chat_room_id, sender_id, content, created_at) "
+        "SELECT id, chat_room_id, sender_id, content, created_at FROM chat_messages_legacy"
+    )
+    op.execute("DROP TABLE chat_messages_legacy")
+
+    # 5. 파티션 테이블 인덱스 (각 파티션으로 전파)
+    op.create_index("ix_chat_messages_room_id", "chat_messages", ["chat_room_id", "id"])
+    op.create_index("ix_chat_messages_room_created", "chat_messages", ["chat_room_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    # 1. 일반 힙 테이블로 되돌리기 (보관 처리로 분리된 파티션 데이터는 복구하지 않음)
+    op.execute("ALTER TABLE chat_messages RENAME TO chat_messages_partitioned")
+    op.execute("ALTER TABLE chat_messages_partitioned RENAME CONSTRAINT chat_messages_pkey TO chat_messages_partitioned_pkey")
+    op.execute("ALTER INDEX ix_chat_messages_room_id RENAME TO ix_chat_messages_partitioned_room_id")
+    op.execute("ALTER INDEX ix_chat_messages_room_created RENAME TO ix_chat_messages_partitioned_room_created")
+    op.execute(
+        """
+        CREATE TABLE chat_messages (
+            id BIGINT NOT NULL DEFAULT nextval('chat_messages_id_seq'),
+            chat_room_id BIGINT NOT NULL REFERENCES chat_rooms (id) ON DELETE CASCADE,
+            sender_id BIGINT NOT NULL REFERENCES users (id) ON DELETE RESTRICT,
+            content TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT chat_messages_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE chat_messages_id_seq OWNED BY chat_messages.id")
+
+    # 2. 데이터 이관 후 파티션 테이블/함수 제거
+    op.execute(
+        "INSERT INTO chat_messages (id, chat_room_id, sender_id, content, created_at) "
+        "SELECT id, chat_room_id, sender_id, content, created_at FROM chat_messages_partitioned"
+    )
+    op.execute("DROP TABLE chat_messages_partitioned")
+    op.execute("DROP FUNCTION ensure_chat_messages_partitions(timestamptz, integer)")
+
+    op.create_index("ix_chat_messages_room_id", "chat_messages", ["chat_room_id", "id"])
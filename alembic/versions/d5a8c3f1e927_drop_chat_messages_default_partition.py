@@ -0,0 +1,37 @@
+"""drop chat_messages default partition
+
+Revision ID: d5a8c3f1e927
+Revises: 9f4b2d7e1a36
+Create Date: 2026-10-19 21:14:52.630418
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d5a8c3f1e927"
+down_revision: Union[str, Sequence[str], None] = "9f4b2d7e1a36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기본 파티션이 있으면 created_at 정렬 Append가 불가능해 최근 이력 조회가 전 파티션 MergeAppend가 된다
+    # 1. 기본 파티션 분리 (분리 상태에서 해당 월 파티션 생성 가능)
+    op.execute("ALTER TABLE chat_messages DETACH PARTITION chat_messages_default")
+
+    # 2. 기본 파티션에 들어간 달부터 월 파티션 생성 후 데이터 이관
+    op.execute(
+        "SELECT ensure_chat_messages_partitions("
+        "coalesce((SELECT min(created_at) FROM chat_messages_default), now()), 3)"
+    )
+    op.execute(
+        "INSERT INTO chat_messages (id, chat_room_id, sender_id, content, created_at) "
+        "SELECT id, chat_room_id, sender_id, content, created_at FROM chat_messages_default"
+    )
+    op.execute("DROP TABLE chat_messages_default")
+
+
+def downgrade() -> None:
+    op.execute("CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT")
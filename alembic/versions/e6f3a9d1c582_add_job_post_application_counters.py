@@ -0,0 +1,58 @@
+"""add job_post application counters
+
+Revision ID: e6f3a9d1c582
+Revises: 5b8e2f0a7c19
+Create Date: 2026-10-19 17:05:33.870142
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e6f3a9d1c582"
+down_revision: Union[str, Sequence[str], None] = "5b8e2f0a7c19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. 공고별 지원 상태 카운터 컬럼
+    for column in ("requested_count", "accepted_count", "rejected_count"):
+        op.add_column(
+            "job_posts",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    # 2. 기존 지원 데이터로 채우기
+    op.execute(
+        """
+        UPDATE job_posts AS p
+        SET requested_count = c.requested,
+            accepted_count = c.accepted,
+            rejected_count = c.rejected
+        FROM (
+            SELECT job_post_id,
+                   count(*) FILTER (WHERE status = 'REQUESTED') AS requested,
+                   count(*) FILTER (WHERE status = 'ACCEPTED') AS accepted,
+                   count(*) FILTER (WHERE status = 'REJECTED') AS rejected
+            FROM applications
+            GROUP BY job_post_id
+        ) AS c
+        WHERE p.id = c.job_post_id
+        """
+    )
+
+    # 3. 회사 대시보드 조회용 인덱스
+    op.create_index(
+        "ix_job_posts_company_created",
+        "job_posts",
+        ["company_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_posts_company_created", table_name="job_posts")
+    for column in ("rejected_count", "accepted_count", "requested_count"):
+        op.drop_column("job_posts", column)
@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import (  # 비동기 SQLAlchemy 구성요소
 )
 from sqlalchemy.orm import DeclarativeBase  # ORM 베이스 클래스
 
+from .sql_metrics import instrument_engine  # 요청 단위 SQL 계측
+
 load_dotenv()  # .env 파일에서 환경 변수 로드
 
 DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")  # 비동기 DB URL 읽기
@@ -18,6 +20,7 @@ engine = create_async_engine(  # 비동기 엔진 생성
     DATABASE_URL,  # DB 연결 문자열
     pool_pre_ping=True,  # 사용 전 커넥션 생존 확인
 )
+instrument_engine(engine)  # 쿼리 수/시간/느린 쿼리 훅 등록
 
 AsyncSessionLocal = async_sessionmaker(  # 요청 단위 세션 팩토리
     bind=engine,  # 엔진 연결
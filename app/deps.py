@@ -105,6 +105,55 @@ async def get_current_user_optional(
 
     return user
 
+# =========================
+# Lazy Optional User (익명 허용 엔드포인트용)
+# =========================
+class LazyUser:  # 필요할 때만 인증하는 사용자 핸들
+    """
+    Authorization 헤더만 보관하고, 핸들러가 await user.get()을 호출할 때
+    JWT 디코딩과 users 조회를 한 번 수행 (사용하지 않으면 DB 왕복 0회)
+    """  # 클래스 설명
+
+    def __init__(self, authorization: Optional[str]):  # 생성자
+        self._authorization = authorization  # 원본 헤더
+        self._resolved = False  # 조회 여부
+        self._user: Optional[User] = None  # 조회 결과
+
+    @property
+    def has_credentials(self) -> bool:  # 토큰 제공 여부(조회 없이 판단)
+        return bool(self._authorization and self._authorization.startswith("Bearer "))  # Bearer 헤더 여부
+
+    async def get(self, db: Optional[AsyncSession] = None) -> Optional[User]:  # 사용자 조회(요청당 1회)
+        if self._resolved:  # 이미 조회함
+            return self._user  # 캐시 반환
+        self._resolved = True  # 조회 표시
+
+        if not self.has_credentials:  # 토큰 없음
+            return None  # 익명
+        try:
+            payload = jwt.decode(  # 토큰 디코딩
+                self._authorization[len("Bearer "):].strip(), JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM]
+            )
+            user_id = int(payload.get("sub"))  # 사용자 ID 추출
+        except (JWTError, ValueError, TypeError):  # 디코딩 실패
+            return None  # 익명 취급
+
+        if db is not None:  # 요청 세션이 있으면 재사용
+            user = await db.get(User, user_id)  # 사용자 조회
+        else:  # 없으면 임시 세션
+            async with AsyncSessionLocal() as session:  # 임시 세션
+                user = await session.get(User, user_id)  # 사용자 조회
+
+        self._user = user if user and user.is_active else None  # 비활성은 익명 취급
+        return self._user  # 사용자 반환
+
+
+async def get_lazy_user(  # 지연 사용자 의존성
+        authorization: Optional[str] = Header(default=None),  # Authorization 헤더
+) -> LazyUser:
+    return LazyUser(authorization)  # 헤더만 보관(조회 없음)
+
+
 # =========================
 # Role Guard (ASYNC)
 # =========================
@@ -0,0 +1,127 @@
+"""
+요청 단위 일괄 로더 (DataLoader 방식)
+
+- BatchLoader.load(id): 같은 이벤트 루프 틱에 요청된 키를 모아 WHERE id = ANY(:ids) 한 번으로 조회
+- 요청 안에서 같은 키는 한 번만 조회(결과 캐시), 없는 키는 None
+- RequestLoaders: 요청 세션에 묶인 로더 모음, Depends(get_loaders)로 주입 (FastAPI가 요청마다 한 번 생성)
+- AsyncSession은 동시 사용이 불가하므로 로더들의 조회는 하나의 잠금으로 직렬화
+"""
+
+import asyncio  # 이벤트 루프/Future
+import os  # 환경 변수 접근
+from types import SimpleNamespace  # 컬럼 출처 묶음
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar  # 타입 힌트
+
+from fastapi import Depends, HTTPException  # 의존성/예외
+from sqlalchemy import BigInteger, any_, bindparam, select  # SQLAlchemy 조회/배열 조건
+from sqlalchemy.dialects.postgresql import ARRAY  # 배열 파라미터
+from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
+
+from .deps import get_async_db  # DB 의존성
+from .models import JobPost, StudentProfile, User  # 모델
+from .schemas import JobPostOut, UserPublic  # 응답 스키마
+from .serialization import RowShape  # 스키마 기준 컬럼/행 변환
+
+MAX_MULTI_GET_IDS = int(os.getenv("MAX_MULTI_GET_IDS", "100"))  # ids= 최대 개수
+
+K = TypeVar("K", bound=Hashable)  # 키 타입
+V = TypeVar("V")  # 값 타입
+
+JOB_POST_ROW = RowShape(JobPostOut, JobPost)  # 공고 응답 컬럼/행 변환
+USER_PUBLIC_ROW = RowShape(  # 사용자 공개 정보 컬럼/행 변환
+    UserPublic, SimpleNamespace(id=User.id, role=User.role, name=StudentProfile.name)  # 이름은 학생 프로필
+)
+
+
+class BatchLoader(Generic[K, V]):  # 키 일괄 조회기
+    def __init__(self, batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]], lock: asyncio.Lock):  # 생성자
+        self._batch_fn = batch_fn  # 키 목록 -> {키: 값}
+        self._lock = lock  # 세션 공유 로더 간 직렬화
+        self._futures: Dict[K, asyncio.Future] = {}  # 키별 결과(요청 내 캐시)
+        self._pending: List[K] = []  # 다음 일괄 조회 대기 키
+        self._tasks: Set[asyncio.Task] = set()  # 실행 중인 조회 태스크(이벤트 루프는 약한 참조만 유지)
+        self.batches = 0  # 실행한 조회 수(디버그/측정용)
+
+    def load(self, key: K) -> "asyncio.Future[Optional[V]]":  # 키 하나 조회
+        """
+        키를 대기 목록에 올리고 결과 Future 반환 (같은 틱의 다른 load와 한 번에 조회)
+        """  # 함수 설명
+        future = self._futures.get(key)  # 이미 요청된 키
+        if future is None:  # 첫 요청
+            future = self._futures[key] = asyncio.get_running_loop().create_future()  # 결과 자리
+            if not self._pending:  # 이번 배치 첫 키
+                task = asyncio.ensure_future(self._dispatch())  # 조회 태스크(현재 컨텍스트 상속 -> SQL 계측 귀속)
+                self._tasks.add(task)  # 끝나기 전 GC 방지
+                task.add_done_callback(self._tasks.discard)  # 끝나면 해제
+            self._pending.append(key)  # 대기 목록
+        return future  # 결과
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:  # 여러 키 조회(입력 순서)
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))  # 한 번의 조회로 합쳐짐
+
+    async def _dispatch(self):  # 대기 키 일괄 조회 후 Future 채우기
+        await asyncio.sleep(0)  # 같은 틱에 시작된 태스크(gather 등)의 load가 모이도록 한 번 양보
+        keys, self._pending = self._pending, []  # 대기 목록 비우기
+        try:
+            async with self._lock:  # 세션 동시 사용 방지
+                found = await self._batch_fn(keys)  # 한 번의 조회
+            self.batches += 1  # 통계
+        except Exception as exc:  # 조회 실패
+            for key in keys:  # 대기 중인 호출자 모두에게 전달
+                future = self._futures.pop(key)  # 실패 결과는 캐시하지 않음
+                if not future.done():  # 취소되지 않았으면
+                    future.set_exception(exc)  # 예외 전달
+            return  # 종료
+        for key in keys:  # 결과 분배
+            future = self._futures[key]  # 결과 자리
+            if not future.done():  # 취소되지 않았으면
+                future.set_result(found.get(key))  # 없으면 None
+
+
+def id_array(ids: List[int]):  # id = ANY(:ids) 배열 파라미터(지원 일괄 처리에서도 사용)
+    return any_(bindparam("ids", ids, type_=ARRAY(BigInteger)))  # 단일 배열 바인드
+
+
+class RequestLoaders:  # 요청 하나의 로더 모음
+    def __init__(self, db: AsyncSession):  # 생성자
+        self.db = db  # 요청 세션
+        lock = asyncio.Lock()  # 세션 공유 잠금
+        self.job_posts: BatchLoader[int, object] = BatchLoader(self._load_job_posts, lock)  # 공고(JobPostOut 컬럼 행)
+        self.users: BatchLoader[int, object] = BatchLoader(self._load_users, lock)  # 사용자 공개 정보 행
+
+    async def _load_job_posts(self, ids: List[int]) -> Dict[int, object]:  # 공고 일괄 조회
+        result = await self.db.execute(  # 한 번에 조회
+            select(*JOB_POST_ROW.columns).where(  # 응답 컬럼만
+                JobPost.id == id_array(ids),  # 대상 ID
+                JobPost.is_deleted == False,  # 삭제 제외  # noqa: E712
+            )
+        )
+        return {row.id: row for row in result}  # ID -> 행
+
+    async def _load_users(self, ids: List[int]) -> Dict[int, object]:  # 사용자 공개 정보 일괄 조회
+        result = await self.db.execute(  # 한 번에 조회
+            select(*USER_PUBLIC_ROW.columns)  # 공개 컬럼만
+            .outerjoin(StudentProfile, StudentProfile.user_id == User.id)  # 학생 이름(회사는 없음)
+            .where(User.id == id_array(ids), User.is_active == True)  # 대상 ID, 비활성 제외  # noqa: E712
+        )
+        return {row.id: row for row in result}  # ID -> 행
+
+
+async def get_loaders(db: AsyncSession = Depends(get_async_db)) -> RequestLoaders:  # 요청 단위 로더 의존성
+    return RequestLoaders(db)  # 같은 요청의 의존성끼리는 FastAPI 캐시로 공유
+
+
+def parse_ids(ids: str) -> List[int]:  # ids=1,2,3 파싱
+    """
+    쉼표 구분 ID 목록을 순서 유지/중복 제거해 반환 (형식 오류나 개수 초과는 400)
+    """  # 함수 설명
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]  # 정수 변환
+    except ValueError:  # 숫자가 아님
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")  # 잘못된 요청
+    parsed = list(dict.fromkeys(parsed))  # 순서 유지 중복 제거
+    if not parsed:  # 비어 있음
+        raise HTTPException(status_code=400, detail="ids must not be empty")  # 잘못된 요청
+    if len(parsed) > MAX_MULTI_GET_IDS:  # 개수 초과
+        raise HTTPException(status_code=400, detail=f"At most {MAX_MULTI_GET_IDS} ids per request")  # 잘못된 요청
+    return parsed  # ID 목록
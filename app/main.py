@@ -1,6 +1,14 @@
+import asyncio  # 백그라운드 태스크
+from contextlib import asynccontextmanager, suppress  # 수명 주기 컨텍스트/예외 무시
+
 from fastapi import FastAPI  # FastAPI 앱 클래스
 from .database import engine  # DB 엔진 로딩(환경 변수 검증용)
 from .models import Base  # ORM 베이스(모델 등록 보장)
+from .websocket_manager import manager as ws_manager  # WS 연결 관리자
+from .services import chat_partitions  # 채팅 메시지 파티션 관리
+from .services.notifications import notification_bus, notification_manager  # 사용자 알림
+from .services import recommender  # 공고 추천 인덱스
+from .services.job_snapshot import job_snapshot  # 챗봇 공고 스냅샷
 
 from .routers.auth_routers import router as auth_router  # 인증 라우터
 from .routers.users_router import router as users_router  # 사용자/프로필 라우터
@@ -9,18 +17,53 @@ from .routers.chat_router import router as chat_router  # 채팅 REST 라우터
 from .routers.chat_router import ws_router as chat_ws_router  # 채팅 WS 라우터
 from .routers.applications_router import router as applications_router  # 지원(신청) 라우터
 from .routers.chatbot_router import router as chatbot_router
+from .routers.companies_router import router as companies_router  # 회사 대시보드 라우터
+from .routers.students_router import router as students_router  # 학생 검색 라우터
+from .routers.notifications_router import ws_router as notifications_ws_router  # 알림 WS 라우터
+from .routers.metrics_router import router as metrics_router  # /metrics 라우터
+from .metrics import MetricsMiddleware  # 요청 지표 미들웨어
+from .sql_metrics import SqlTimingMiddleware  # 요청별 SQL 통계 미들웨어
+
+
+@asynccontextmanager  # 수명 주기 핸들러
+async def lifespan(app: FastAPI):  # 시작/종료 훅
+    ws_manager.start_heartbeat()  # WS 하트비트 시작
+    notification_manager.start_heartbeat()  # 알림 채널 하트비트 시작
+    notification_bus.start()  # 알림 디스패처 시작
+    index_task = asyncio.create_task(recommender.build_in_background())  # 추천 인덱스 빌드
+    partition_task = asyncio.create_task(chat_partitions.maintenance_loop())  # 미래 파티션 주기 생성
+    snapshot_task = asyncio.create_task(job_snapshot.refresh_loop())  # 공고 스냅샷 적재/변경분 반영
+    yield  # 서버 실행
+    index_task.cancel()  # 빌드 중이면 취소
+    snapshot_task.cancel()  # 스냅샷 갱신 취소
+    partition_task.cancel()  # 파티션 작업 취소
+    with suppress(asyncio.CancelledError):  # 정상 취소
+        await partition_task  # 종료 대기
+    with suppress(asyncio.CancelledError):  # 정상 취소
+        await index_task  # 종료 대기
+    with suppress(asyncio.CancelledError):  # 정상 취소
+        await snapshot_task  # 종료 대기
+    await notification_bus.stop()  # 알림 디스패처 종료
+    await notification_manager.stop_heartbeat()  # 알림 채널 하트비트 종료
+    await ws_manager.stop_heartbeat()  # WS 하트비트 종료
 
 
 def create_app() -> FastAPI:  # 앱 팩토리 함수
-    app = FastAPI(title="Job Platform API")  # FastAPI 인스턴스 생성
+    app = FastAPI(title="Job Platform API", lifespan=lifespan)  # FastAPI 인스턴스 생성
+    app.add_middleware(SqlTimingMiddleware)  # 요청별 쿼리 수/DB 시간(Server-Timing)
+    app.add_middleware(MetricsMiddleware)  # 라우트별 요청 수/지연 기록
 
     app.include_router(auth_router, prefix="/api")  # /api/auth 계열 라우트 등록
     app.include_router(users_router, prefix="/api")  # /api/users 계열 라우트 등록
     app.include_router(posts_router, prefix="/api")  # /api/job-posts 계열 라우트 등록
     app.include_router(chat_ws_router, prefix="/api")  # /api/ws 계열 라우트 등록
+    app.include_router(notifications_ws_router, prefix="/api")  # /api/ws/notifications 라우트 등록
     app.include_router(applications_router, prefix="/api")  # /api/applications 계열 라우트 등록
     app.include_router(chat_router, prefix="/api")  # /api/chat 계열 라우트 등록
     app.include_router(chatbot_router, prefix="/api")
+    app.include_router(companies_router, prefix="/api")  # /api/companies 계열 라우트 등록
+    app.include_router(students_router, prefix="/api")  # /api/students 계열 라우트 등록
+    app.include_router(metrics_router)  # /metrics (Prometheus 스크레이프)
 
     @app.get("/health")  # 헬스체크 엔드포인트
     def health():  # 간단한 상태 확인 핸들러
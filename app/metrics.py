@@ -0,0 +1,118 @@
+"""
+요청 지표 수집 (Prometheus 텍스트 형식)
+
+- MetricsMiddleware: 순수 ASGI 미들웨어, 라우트 템플릿/메서드/상태 코드별 요청 수와 지연 히스토그램
+- render_samples(): WebSocket 연결 관리자 등 요청 외 지표를 같은 형식으로 렌더링
+- 요청당 비용은 perf_counter 두 번 + bisect 한 번 + 딕셔너리 갱신
+"""
+
+import bisect  # 버킷 위치
+import time  # 지연 측정
+from typing import Dict, Iterable, List, Tuple  # 타입 힌트
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 히스토그램 경계(초)
+UNMATCHED_ROUTE = "<unmatched>"  # 라우트 없는 요청(404 등) - 경로별 라벨 폭증 방지
+
+Sample = Tuple[str, str, Dict[str, str], float]  # (이름, 타입, 라벨, 값)
+
+
+class RequestMetrics:  # 라우트별 요청 지표 저장소
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):  # 생성자
+        self.buckets = buckets  # 경계
+        self.series: Dict[Tuple[str, str, int], List] = {}  # (메서드, 라우트, 상태) -> [버킷별 수, 합, 개수]
+        self.in_progress = 0  # 처리 중 요청 수
+
+    def observe(self, method: str, route: str, status: int, seconds: float):  # 요청 1건 기록
+        key = (method, route, status)  # 시리즈 키
+        entry = self.series.get(key)  # 기존 시리즈
+        if entry is None:  # 첫 요청
+            entry = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]  # 초기화(+Inf 포함)
+        entry[0][bisect.bisect_left(self.buckets, seconds)] += 1  # 해당 버킷(비누적)
+        entry[1] += seconds  # 합계
+        entry[2] += 1  # 개수
+
+    def render(self) -> str:  # Prometheus 텍스트 형식
+        lines = [  # 요청 지표 헤더
+            "# HELP http_requests_total Total HTTP requests by route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), (_, _, count) in sorted(self.series.items()):  # 요청 수
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")  # 시리즈
+
+        lines += [  # 지연 히스토그램 헤더
+            "# HELP http_request_duration_seconds HTTP request latency by route template and status.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route, status), (counts, total, count) in sorted(self.series.items()):  # 히스토그램
+            cumulative = 0  # 누적 수
+            for bound, n in zip([*map(_fmt, self.buckets), "+Inf"], counts):  # 버킷
+                cumulative += n  # 누적
+                labels = _labels(method=method, route=route, status=status, le=bound)  # 라벨
+                lines.append(f"http_request_duration_seconds_bucket{labels} {cumulative}")  # 버킷 줄
+            labels = _labels(method=method, route=route, status=status)  # 라벨
+            lines.append(f"http_request_duration_seconds_sum{labels} {_fmt(total)}")  # 합계
+            lines.append(f"http_request_duration_seconds_count{labels} {count}")  # 개수
+
+        lines += [  # 처리 중 요청
+            "# HELP http_requests_in_progress HTTP requests currently being served.",
+            "# TYPE http_requests_in_progress gauge",
+            f"http_requests_in_progress {self.in_progress}",
+        ]
+        return "\n".join(lines) + "\n"  # 마지막 줄바꿈 포함
+
+
+def render_samples(samples: Iterable[Sample]) -> str:  # 추가 지표 렌더링
+    families: Dict[str, List[str]] = {}  # 이름 -> 줄(형식상 같은 이름은 한 묶음이어야 함)
+    for name, kind, labels, value in samples:  # 샘플
+        if name not in families:  # 첫 샘플
+            families[name] = [f"# TYPE {name} {kind}"]  # 타입 선언
+        families[name].append(f"{name}{_labels(**labels)} {_fmt(value)}")  # 샘플 줄
+    return "".join("\n".join(lines) + "\n" for lines in families.values())  # 이름별 묶음
+
+
+def _fmt(value: float) -> str:  # 숫자 표기
+    return repr(float(value)) if isinstance(value, float) else str(value)  # 정수는 그대로
+
+
+def _labels(**labels) -> str:  # 라벨 문자열
+    if not labels:  # 라벨 없음
+        return ""  # 빈 문자열
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"  # {k="v",...}
+
+
+def _escape(value) -> str:  # 라벨 값 이스케이프
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")  # \\, ", 줄바꿈
+
+
+class MetricsMiddleware:  # 순수 ASGI 미들웨어(BaseHTTPMiddleware보다 오버헤드 적음)
+    def __init__(self, app, metrics: "RequestMetrics" = None):  # 생성자
+        self.app = app  # 다음 ASGI 앱
+        self.metrics = metrics or request_metrics  # 저장소
+
+    async def __call__(self, scope, receive, send):  # ASGI 진입점
+        if scope["type"] != "http":  # WebSocket/lifespan은 통과
+            await self.app(scope, receive, send)  # 그대로 실행
+            return  # 종료
+
+        status = 500  # 응답 시작 전 예외면 500
+        metrics = self.metrics  # 지역 참조
+
+        async def send_wrapper(message):  # 상태 코드 캡처
+            nonlocal status  # 바깥 변수
+            if message["type"] == "http.response.start":  # 응답 시작
+                status = message["status"]  # 상태 코드
+            await send(message)  # 원래 전송
+
+        metrics.in_progress += 1  # 처리 중 증가
+        started = time.perf_counter()  # 시작
+        try:
+            await self.app(scope, receive, send_wrapper)  # 요청 처리
+        finally:
+            elapsed = time.perf_counter() - started  # 지연
+            metrics.in_progress -= 1  # 처리 중 감소
+            route = scope.get("route")  # 라우팅 후 매칭된 라우트(FastAPI가 설정)
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE  # /api/job-posts/{job_post_id} 형태
+            metrics.observe(scope["method"], template, status, elapsed)  # 기록
+
+
+request_metrics = RequestMetrics()  # 앱 전역 지표 저장소
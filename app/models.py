@@ -8,6 +8,7 @@ from sqlalchemy import (  # SQLAlchemy 컬럼/타입
     Boolean,  # 불리언 타입
     DateTime,  # 날짜/시간 타입
     ForeignKey,  # 외래키
+    Index,  # 인덱스
     Integer,  # 정수 타입
     String,  # 문자열 타입
     Text,  # 텍스트 타입
@@ -84,6 +85,10 @@ class StudentProfile(Base):  # 학생 프로필 모델
 
     updated_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 갱신 시각
 
+    __table_args__ = (  # 테이블 인덱스
+        Index("ix_student_profiles_skills", "skills", postgresql_using="gin"),  # 기술 포함(@>)/겹침(?|) 검색
+    )
+
     user: Mapped["User"] = relationship("User", back_populates="student_profile")  # 사용자 역참조
 
 
@@ -105,9 +110,18 @@ class JobPost(Base):  # 공고 모델
     )
     is_deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)  # 논리 삭제
 
+    requested_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")  # 대기 중 지원 수(증분 유지)
+    accepted_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")  # 수락된 지원 수(증분 유지)
+    rejected_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")  # 거절된 지원 수(증분 유지)
+
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 생성 시각
     updated_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 수정 시각
 
+    __table_args__ = (  # 테이블 인덱스
+        Index("ix_job_posts_company_created", "company_id", "created_at"),  # 회사별 공고(대시보드)
+        Index("ix_job_posts_updated_at", "updated_at"),  # 변경분 조회(챗봇 스냅샷)
+    )
+
     company: Mapped["User"] = relationship("User", back_populates="job_posts")  # 회사 역참조
     images: Mapped[List["JobPostImage"]] = relationship(  # 이미지 목록
         "JobPostImage", back_populates="job_post", cascade="all, delete-orphan"  # 자식 삭제 연쇄
@@ -185,6 +199,17 @@ class Application(Base):  # 지원 모델
             "student_id",  # 학생 기준
             name="uq_application_job_student",  # 제약 이름
         ),
+        Index(  # 회사 받은 지원 목록(상태 필터 + 최신순)
+            "ix_applications_company_status_created",  # 인덱스 이름
+            "company_id",  # 회사 ID
+            "status",  # 상태
+            "created_at",  # 생성 시각
+        ),
+        Index(  # 학생 내 지원 목록(최신순)
+            "ix_applications_student_created",  # 인덱스 이름
+            "student_id",  # 학생 ID
+            "created_at",  # 생성 시각
+        ),
     )
 
     job_post: Mapped["JobPost"] = relationship("JobPost", back_populates="applications")  # 공고 역참조
@@ -251,15 +276,39 @@ class ChatRoom(Base):  # 채팅방 모델
     )
 
 
+chat_room_activity_at = func.coalesce(ChatRoom.last_message_at, ChatRoom.created_at)  # 마지막 활동 시각(메시지 없으면 생성 시각)
+
+Index(  # 회사 기준 채팅방 목록 인덱스
+    "ix_chat_rooms_company_activity",  # 인덱스 이름
+    ChatRoom.company_id,  # 회사 ID
+    chat_room_activity_at.desc(),  # 최근 활동순
+    ChatRoom.id.desc(),  # 동시각 정렬 보조키
+)
+Index(  # 학생 기준 채팅방 목록 인덱스
+    "ix_chat_rooms_student_activity",  # 인덱스 이름
+    ChatRoom.student_id,  # 학생 ID
+    chat_room_activity_at.desc(),  # 최근 활동순
+    ChatRoom.id.desc(),  # 동시각 정렬 보조키
+)
+
+
 class ChatMessage(Base):  # 채팅 메시지 모델
     __tablename__ = "chat_messages"  # 테이블명
 
+    __table_args__ = (  # 테이블 인덱스/파티션
+        Index("ix_chat_messages_room_id", "chat_room_id", "id"),  # 방별 id 순 조회(재접속 재전송)
+        Index("ix_chat_messages_room_created", "chat_room_id", "created_at", "id"),  # 방별 최근 이력(최신 파티션만 스캔)
+        {"postgresql_partition_by": "RANGE (created_at)"},  # 월 단위 범위 파티션
+    )
+
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)  # PK
     chat_room_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("chat_rooms.id", ondelete="CASCADE"), nullable=False)  # 방 FK
     sender_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)  # 발신자 FK
 
     content: Mapped[str] = mapped_column(Text, nullable=False)  # 메시지 본문
-    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # 생성 시각
+    created_at: Mapped[str] = mapped_column(  # 생성 시각(파티션 키라 PK에 포함)
+        DateTime(timezone=True), server_default=func.now(), primary_key=True  # 서버 기본값
+    )
 
     chat_room: Mapped["ChatRoom"] = relationship("ChatRoom", back_populates="messages")  # 방 역참조
     sender: Mapped["User"] = relationship("User", back_populates="sent_messages")  # 발신자 역참조
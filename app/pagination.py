@@ -0,0 +1,59 @@
+import base64  # 커서 인코딩
+import binascii  # 디코딩 오류 타입
+from datetime import datetime  # 시간 타입
+from typing import Optional, Tuple, Union  # 타입 힌트
+
+from fastapi import HTTPException, Response  # 예외/응답
+from sqlalchemy import tuple_  # 행 비교
+
+DEFAULT_PAGE_SIZE = 20  # 기본 페이지 크기
+MAX_PAGE_SIZE = 100  # 최대 페이지 크기
+NEXT_CURSOR_HEADER = "X-Next-Cursor"  # 다음 페이지 커서 헤더
+
+
+def encode_cursor(sort_value: Union[datetime, int], row_id: int) -> str:  # 커서 생성
+    """
+    (정렬 값, ID) 키셋을 불투명한 커서 문자열로 인코딩 (정렬 값은 시각 또는 정수)
+    """  # 함수 설명
+    sort_part = sort_value.isoformat() if isinstance(sort_value, datetime) else str(sort_value)  # 정렬 값 문자열
+    raw = f"{sort_part}|{row_id}"  # 구분자로 연결
+    return base64.urlsafe_b64encode(raw.encode()).decode()  # URL 안전 문자열
+
+
+def decode_cursor(cursor: str, sort_type: type = datetime) -> Tuple[Union[datetime, int], int]:  # 커서 해석
+    """
+    encode_cursor로 만든 커서를 (정렬 값, ID)로 복원
+    """  # 함수 설명
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()  # 디코딩
+        sort_part, id_part = raw.rsplit("|", 1)  # 분리
+        sort_value = datetime.fromisoformat(sort_part) if sort_type is datetime else sort_type(sort_part)  # 정렬 값 복원
+        return sort_value, int(id_part)  # 값 복원
+    except (binascii.Error, UnicodeDecodeError, ValueError):  # 형식 오류
+        raise HTTPException(status_code=400, detail="Invalid cursor")  # 잘못된 요청
+
+
+def apply_keyset(stmt, sort_column, id_column, cursor: Optional[str], limit: int, descending: bool = True):  # 키셋 조건/정렬
+    """
+    (정렬 컬럼, ID) 키셋 기준으로 커서 이후 조건, 정렬, limit + 1을 적용
+    """  # 함수 설명
+    if cursor:  # 커서 이후만
+        key = tuple_(sort_column, id_column)  # 행 비교 대상
+        after = tuple_(*decode_cursor(cursor))  # 커서 값
+        stmt = stmt.where(key < after if descending else key > after)  # 정렬 방향에 맞는 비교
+    if descending:  # 최신순
+        stmt = stmt.order_by(sort_column.desc(), id_column.desc())  # 내림차순
+    else:  # 오래된 순
+        stmt = stmt.order_by(sort_column.asc(), id_column.asc())  # 오름차순
+    return stmt.limit(limit + 1)  # 다음 페이지 확인용 한 건 더
+
+
+def paginate(rows: list, limit: int, response: Response, sort_attr: str = "created_at") -> list:  # 페이지 자르기
+    """
+    limit + 1건 조회 결과를 현재 페이지로 자르고 다음 페이지가 있으면 커서 헤더 설정
+    """  # 함수 설명
+    if len(rows) > limit:  # 다음 페이지 존재
+        rows = rows[:limit]  # 현재 페이지만
+        last = rows[-1]  # 마지막 행
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(getattr(last, sort_attr), last.id)  # 다음 커서
+    return rows  # 현재 페이지
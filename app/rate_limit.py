@@ -0,0 +1,33 @@
+import time  # 단조 시간
+
+
+class TokenBucket:  # 토큰 버킷
+    """
+    초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷
+    """  # 클래스 설명
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")  # 버킷당 메모리 최소화
+
+    def __init__(self, rate: float, burst: float):  # 생성자
+        self.rate = rate  # 초당 충전량
+        self.burst = burst  # 최대 보유량
+        self.tokens = burst  # 시작 시 가득 참
+        self.updated_at = time.monotonic()  # 마지막 충전 시각
+
+    def _refill(self):  # 경과 시간만큼 충전
+        now = time.monotonic()  # 현재 시각
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)  # 충전
+        self.updated_at = now  # 시각 갱신
+
+    def has_token(self) -> bool:  # 소비 없이 확인
+        self._refill()  # 충전
+        return self.tokens >= 1  # 토큰 여부
+
+    def is_full(self) -> bool:  # 지금 가득 찼는지(새 버킷과 구분 불가)
+        return self.tokens + (time.monotonic() - self.updated_at) * self.rate >= self.burst  # 충전 계산만(갱신 없음)
+
+    def consume(self) -> bool:  # 토큰 1개 소비
+        if not self.has_token():  # 부족하면
+            return False  # 거부
+        self.tokens -= 1  # 소비
+        return True  # 허용
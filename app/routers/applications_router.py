@@ -1,8 +1,8 @@
-from datetime import datetime  # 시간
-from typing import List, Optional  # 타입 힌트
+from typing import List, Literal, Optional  # 타입 힌트
 
-from fastapi import APIRouter, Depends, HTTPException, Query  # 라우터/의존성/예외/쿼리
-from sqlalchemy import select  # SQLAlchemy 조회
+from fastapi import APIRouter, Depends, HTTPException, Query, Response  # 라우터/의존성/예외/쿼리/응답
+from sqlalchemy import func, select, update  # SQLAlchemy 조회/갱신
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # ON CONFLICT
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
 
 from app.models import (  # 모델
@@ -10,13 +10,26 @@ from app.models import (  # 모델
     ApplicationStatus,  # 지원 상태
     JobPost,  # 공고
     ChatRoom,  # 채팅방
+    StudentProfile,  # 학생 프로필
     UserRole,  # 사용자 역할
 )
 from app.schemas import (  # 스키마
+    ApplicationBulkAction,  # 일괄 처리 요청
+    ApplicationBulkResponse,  # 일괄 처리 응답
+    ApplicationBulkResult,  # 일괄 처리 결과
     ApplicationCreate,  # 생성 요청
+    ApplicationListItem,  # 목록 응답
     ApplicationOut,  # 응답
+    JobPostSummary,  # 공고 요약
+    RankedApplication,  # 순위 응답
 )
 from app.deps import get_current_user, get_async_db  # 의존성
+from app.loaders import id_array  # id = ANY(:ids) 배열 파라미터
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, apply_keyset, paginate  # 커서 페이지네이션
+from app.serialization import FastJSONResponse, RowShape, fast_json  # 목록 빠른 직렬화
+from app.services.application_counters import count_new_application, transition_counters_cte  # 공고별 지원 카운터
+from app.services.notifications import application_event, notification_bus  # 사용자 알림
+from app.services.recommender import job_index, post_text, profile_text, profile_vectors, score_vectors  # 유사도 점수
 
 router = APIRouter(  # 라우터 설정
     prefix="/applications",  # prefix
@@ -24,6 +37,115 @@ router = APIRouter(  # 라우터 설정
     dependencies=[],  # 전역 의존성 없음
 )
 
+APPLICATION_LIST_ROW = RowShape(  # 목록 응답 컬럼/행 변환
+    ApplicationListItem,  # 응답 스키마
+    Application,  # 컬럼 출처
+    nested={"job_post": (JobPostSummary, JobPost)},  # 공고 요약은 조인 컬럼
+    keep=("id", "created_at"),  # 커서 키는 fields=와 무관하게 SELECT
+)
+APPLICATION_FIELDS_DOC = "comma-separated ApplicationListItem fields, e.g. id,status,job_post"  # fields= 설명
+
+
+async def _respond_to_applications(  # 지원 상태 일괄 전이
+        db: AsyncSession,  # DB 세션
+        company_id: int,  # 처리하는 회사 ID
+        ids: List[int],  # 지원 ID 목록
+        new_status: ApplicationStatus,  # 목표 상태
+):
+    """
+    REQUESTED 상태인 내 지원만 조건부 UPDATE ... RETURNING으로 전이 (커밋은 호출자 몫)
+    - 공고별 지원 카운터와 (수락이면) 채팅방 INSERT까지 같은 문장의 CTE로 수행 (왕복 1회)
+    - 동시 요청은 행 잠금 후 조건을 다시 평가하므로 패자는 0행을 받고 롤백이 필요 없다
+    """  # 함수 설명
+    updated = (  # 조건부 전이 CTE
+        update(Application)  # 지원 갱신
+        .where(  # 전이 조건
+            Application.id == id_array(ids),  # 대상 ID
+            Application.company_id == company_id,  # 내 지원만
+            Application.status == ApplicationStatus.REQUESTED,  # 미처리 건만
+        )
+        .values(status=new_status, responded_at=func.now())  # 상태/응답 시각
+        .returning(  # 전이된 행
+            Application.id,  # 지원 ID
+            Application.job_post_id,  # 공고 ID
+            Application.company_id,  # 회사 ID
+            Application.student_id,  # 학생 ID
+        )
+        .cte("updated")  # CTE 이름
+    )
+    stmt = select(updated).add_cte(transition_counters_cte(updated, new_status))  # 전이된 행 반환 + 카운터 이동
+
+    if new_status == ApplicationStatus.ACCEPTED:  # 수락이면 채팅방 생성
+        rooms = (  # 채팅방 INSERT CTE
+            pg_insert(ChatRoom)  # 채팅방 INSERT
+            .from_select(  # 전이된 행에서
+                ["application_id", "job_post_id", "company_id", "student_id"],  # 대상 컬럼
+                select(updated.c.id, updated.c.job_post_id, updated.c.company_id, updated.c.student_id),  # 원본
+            )
+            .on_conflict_do_nothing(index_elements=[ChatRoom.application_id])  # 이미 있으면 무시
+            .cte("rooms")  # CTE 이름
+        )
+        stmt = stmt.add_cte(rooms)  # 같은 문장에 포함
+
+    result = await db.execute(stmt)  # 단일 문장 실행
+    return result.all()  # 전이된 행 목록
+
+
+def _publish_responses(rows, new_status: ApplicationStatus):  # 수락/거절 알림 발행
+    """
+    커밋된 전이 결과를 각 학생의 알림 채널로 발행 (대기 없이 큐에 적재)
+    """  # 함수 설명
+    event_type = "application.accepted" if new_status == ApplicationStatus.ACCEPTED else "application.rejected"  # 이벤트 종류
+    for r in rows:  # 전이된 지원
+        notification_bus.publish(  # 학생에게
+            r.student_id,  # 수신자
+            application_event(event_type, r.id, r.job_post_id, new_status.value),  # 이벤트
+        )
+
+
+async def _raise_not_transitioned(db: AsyncSession, company_id: int, application_id: int):  # 전이 실패 사유
+    """
+    조건부 전이가 0행일 때만 사유를 조회해 기존과 같은 오류로 응답
+    """  # 함수 설명
+    owner_id = await db.scalar(select(Application.company_id).where(Application.id == application_id))  # 소유 회사
+    if owner_id is None:  # 없으면
+        raise HTTPException(status_code=404, detail="Application not found")  # 404
+    if owner_id != company_id:  # 소유 확인
+        raise HTTPException(status_code=403, detail="Not your application")  # 권한 오류
+    raise HTTPException(status_code=400, detail="Application already processed")  # 이미 처리됨
+
+
+async def _list_applications(  # 지원 목록 공통 조회
+        db: AsyncSession,  # DB 세션
+        response: Response,  # 응답(커서 헤더)
+        owner_condition,  # 학생/회사 소유 조건
+        status: Optional[ApplicationStatus],  # 상태 필터
+        job_post_id: Optional[int],  # 공고 필터
+        cursor: Optional[str],  # 커서
+        limit: int,  # 페이지 크기
+        order: str,  # 정렬 방향
+        fields: Optional[str],  # 희소 필드셋
+):
+    """
+    공고 요약을 한 번의 조인으로 함께 읽는 커서 페이지네이션 목록
+    - 응답 컬럼만 Core 행으로 읽어 바로 JSON 인코딩 (ORM 엔티티/응답 재검증 생략)
+    - fields=가 있으면 해당 필드만 SELECT/응답, job_post가 빠지면 조인도 생략
+    """  # 함수 설명
+    selected = APPLICATION_LIST_ROW.parse_fields(fields)  # 요청 필드
+    shape = APPLICATION_LIST_ROW.narrow(selected)  # 요청 필드 규칙
+    stmt = select(*shape.columns).where(owner_condition)  # 기본 쿼리
+    if selected is None or "job_post" in selected:  # 공고 요약 필요
+        stmt = stmt.join(Application.job_post)  # 공고 조인
+    if status:  # 상태 필터
+        stmt = stmt.where(Application.status == status)  # 상태 조건
+    if job_post_id is not None:  # 공고 필터
+        stmt = stmt.where(Application.job_post_id == job_post_id)  # 공고 조건
+
+    stmt = apply_keyset(stmt, Application.created_at, Application.id, cursor, limit, descending=order == "desc")  # 커서/정렬
+    result = await db.execute(stmt)  # 조회 실행
+    rows = paginate(result.all(), limit, response)  # 현재 페이지(행의 id/created_at으로 커서)
+    return fast_json(shape.dump_all(rows), response)  # 커서 헤더 유지
+
 
 # =========================
 # 학생 → 채팅 요청 생성
@@ -60,88 +182,175 @@ async def create_application(  # 핸들러
     )
 
     db.add(application)  # 세션 추가
+    await count_new_application(db, job_post.id)  # 대기 카운터 증가
     await db.commit()  # 커밋
     await db.refresh(application)  # DB 반영
 
+    notification_bus.publish(  # 회사에 새 지원 알림
+        application.company_id,  # 수신자
+        application_event("application.created", application.id, application.job_post_id, application.status.value),  # 이벤트
+    )
+
     return application  # 지원 반환
 
 
 # =========================
 # 학생 → 내 Application 목록
 # =========================
-@router.get("/me", response_model=List[ApplicationOut])  # 내 지원 목록
+@router.get("/me", response_model=List[ApplicationListItem], response_class=FastJSONResponse)  # 내 지원 목록
 async def list_my_applications(  # 핸들러
+        response: Response,  # 응답(커서 헤더)
+        status: Optional[ApplicationStatus] = Query(None),  # 상태 필터
+        job_post_id: Optional[int] = Query(None),  # 공고 필터
+        cursor: Optional[str] = Query(None),  # 이전 페이지의 X-Next-Cursor
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),  # 페이지 크기
+        order: Literal["desc", "asc"] = Query("desc"),  # created_at 정렬 방향
+        fields: Optional[str] = Query(None, description=APPLICATION_FIELDS_DOC),  # 희소 필드셋
         db: AsyncSession = Depends(get_async_db),  # DB 세션
         me=Depends(get_current_user),  # 현재 사용자
 ):
     if me.role != UserRole.STUDENT:  # 학생만 가능
         raise HTTPException(status_code=403, detail="Only students can view this")  # 권한 오류
 
-    result = await db.execute(  # 조회
-        select(Application).where(Application.student_id == me.id)  # 내 지원
+    return await _list_applications(  # 공통 조회
+        db, response, Application.student_id == me.id, status, job_post_id, cursor, limit, order, fields  # 내 지원
     )
-    return result.scalars().all()  # 목록 반환
 
 
 # =========================
 # 회사 → 받은 Application 목록
 # =========================
-@router.get("", response_model=List[ApplicationOut])  # 회사 받은 목록
+@router.get("", response_model=List[ApplicationListItem], response_class=FastJSONResponse)  # 회사 받은 목록
 async def list_company_applications(  # 핸들러
+        response: Response,  # 응답(커서 헤더)
         status: Optional[ApplicationStatus] = Query(None),  # 상태 필터
+        job_post_id: Optional[int] = Query(None),  # 공고 필터
+        cursor: Optional[str] = Query(None),  # 이전 페이지의 X-Next-Cursor
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),  # 페이지 크기
+        order: Literal["desc", "asc"] = Query("desc"),  # created_at 정렬 방향
+        fields: Optional[str] = Query(None, description=APPLICATION_FIELDS_DOC),  # 희소 필드셋
         db: AsyncSession = Depends(get_async_db),  # DB 세션
         me=Depends(get_current_user),  # 현재 사용자
 ):
     if me.role != UserRole.COMPANY:  # 회사만 가능
         raise HTTPException(status_code=403, detail="Only companies can view this")  # 권한 오류
 
-    stmt = select(Application).where(Application.company_id == me.id)  # 회사 기준
+    return await _list_applications(  # 공통 조회
+        db, response, Application.company_id == me.id, status, job_post_id, cursor, limit, order, fields  # 회사 기준
+    )
+
+
+# =========================
+# 회사 → 공고별 지원자 순위
+# =========================
+@router.get("/ranked", response_model=List[RankedApplication])  # 지원자 순위
+async def rank_job_post_applicants(  # 핸들러
+        job_post_id: int = Query(...),  # 공고 ID
+        status: Optional[ApplicationStatus] = Query(ApplicationStatus.REQUESTED),  # 상태 필터(기본: 미처리)
+        limit: int = Query(100, ge=1, le=1000),  # 최대 개수
+        db: AsyncSession = Depends(get_async_db),  # DB 세션
+        me=Depends(get_current_user),  # 현재 사용자
+):
+    """
+    지원자 프로필(기술/전공/가능 시간)과 공고 텍스트의 유사도 순으로 지원 목록 반환
+    - 프로필 벡터는 캐시에서 읽고, 없는 학생의 프로필만 한 번에 조회해 계산
+    """  # 함수 설명
+    if me.role != UserRole.COMPANY:  # 회사만 가능
+        raise HTTPException(status_code=403, detail="Only companies can view this")  # 권한 오류
+
+    job = await db.get(JobPost, job_post_id)  # 공고 조회
+    if not job or job.is_deleted:  # 없으면
+        raise HTTPException(status_code=404, detail="Job post not found")  # 404
+    if job.company_id != me.id:  # 소유 확인
+        raise HTTPException(status_code=403, detail="Not your job post")  # 권한 오류
+
+    stmt = select(Application).where(Application.job_post_id == job_post_id)  # 공고의 지원
     if status:  # 상태 필터
         stmt = stmt.where(Application.status == status)  # 상태 조건
-
-    result = await db.execute(stmt)  # 조회 실행
-    return result.scalars().all()  # 목록 반환
+    applications = (await db.execute(stmt)).scalars().all()  # 지원 목록
+    if not applications:  # 지원 없음
+        return []  # 빈 목록
+
+    vectors = {a.student_id: profile_vectors.get(a.student_id) for a in applications}  # 캐시 조회
+    missing = [student_id for student_id, vector in vectors.items() if vector is None]  # 미적중 학생
+    if missing:  # 필요한 프로필만 조회
+        rows = await db.execute(  # 프로필 조회
+            select(  # 필요한 컬럼만
+                StudentProfile.user_id, StudentProfile.skills, StudentProfile.major, StudentProfile.available_time
+            ).where(StudentProfile.user_id == id_array(missing))  # 미적중 학생
+        )
+        for r in rows:  # 벡터 계산 후 캐시
+            vectors[r.user_id] = profile_vectors.put(r.user_id, profile_text(r.skills, r.major, r.available_time))  # 저장
+
+    await job_index.ensure_built()  # 문서 빈도(IDF) 준비
+    q = job_index.query_vector(post_text(job.title, job.description))  # 공고 질의 벡터
+    if q is None:  # 공고 텍스트에 토큰 없음
+        scores = [0.0] * len(applications)  # 모두 0점
+    else:  # 일괄 점수 계산
+        scores = score_vectors(q, [vectors.get(a.student_id) for a in applications]).tolist()  # 점수(프로필 없으면 0점)
+
+    ranked = sorted(  # 점수 높은 순, 동점은 먼저 지원한 순
+        zip(applications, scores), key=lambda pair: (-pair[1], pair[0].created_at, pair[0].id)
+    )
+    return [  # 응답
+        RankedApplication(**ApplicationOut.model_validate(a).model_dump(), score=score)  # 점수 포함
+        for a, score in ranked[:limit]
+    ]
 
 
 # =========================
-# 회사 → Application 수락
+# 회사 → Application 일괄 수락/거절
 # =========================
-@router.post("/{application_id}/accept")  # 수락
-async def accept_application(  # 핸들러
-        application_id: int,  # 지원 ID
+@router.post("/bulk", response_model=ApplicationBulkResponse)  # 일괄 처리
+async def bulk_respond_applications(  # 핸들러
+        data: ApplicationBulkAction,  # 요청 바디
         db: AsyncSession = Depends(get_async_db),  # DB 세션
         me=Depends(get_current_user),  # 현재 사용자
 ):
     if me.role != UserRole.COMPANY:  # 회사만 가능
-        raise HTTPException(status_code=403, detail="Only companies can accept applications")  # 권한 오류
+        raise HTTPException(status_code=403, detail="Only companies can respond to applications")  # 권한 오류
 
-    application = await db.get(Application, application_id)  # 지원 조회
-    if not application:  # 없으면
-        raise HTTPException(status_code=404, detail="Application not found")  # 404
+    ids = list(dict.fromkeys(data.ids))  # 순서 유지 중복 제거
+    new_status = ApplicationStatus.ACCEPTED if data.action == "accept" else ApplicationStatus.REJECTED  # 목표 상태
+    done = "accepted" if data.action == "accept" else "rejected"  # 성공 결과명
 
-    if application.company_id != me.id:  # 소유 확인
-        raise HTTPException(status_code=403, detail="Not your application")  # 권한 오류
+    rows = await _respond_to_applications(db, me.id, ids, new_status)  # 조건부 일괄 전이
+    outcomes = {r.id: done for r in rows}  # 성공 건
 
-    if application.status != ApplicationStatus.REQUESTED:  # 이미 처리됨
-        raise HTTPException(status_code=400, detail="Application already processed")  # 잘못된 요청
+    missing = [i for i in ids if i not in outcomes]  # 전이되지 않은 건
+    if missing:  # 실패 사유 조회
+        result = await db.execute(  # 한 번에 조회
+            select(Application.id, Application.company_id).where(Application.id == id_array(missing))  # 남은 ID
+        )
+        for app_id, company_id in result.all():  # 존재하는 건
+            outcomes[app_id] = "forbidden" if company_id != me.id else "already_processed"  # 사유
 
-    application.status = ApplicationStatus.ACCEPTED  # 상태 변경
-    application.responded_at = datetime.utcnow()  # 응답 시각
+    await db.commit()  # 한 트랜잭션으로 커밋
+    _publish_responses(rows, new_status)  # 커밋 후 알림
 
-    chat_room = ChatRoom(  # 채팅방 생성
-        application_id=application.id,  # 지원 ID
-        job_post_id=application.job_post_id,  # 공고 ID
-        company_id=application.company_id,  # 회사 ID
-        student_id=application.student_id,  # 학생 ID
+    return ApplicationBulkResponse(  # 응답
+        results=[ApplicationBulkResult(id=i, outcome=outcomes.get(i, "not_found")) for i in ids]  # 요청 순서대로
     )
-    db.add(chat_room)  # 세션 추가
 
-    try:
-        await db.commit()  # 커밋
-    except Exception:
-        await db.rollback()  # 롤백
-        raise HTTPException(status_code=400, detail="Chat room already exists")  # 중복 처리
 
+# =========================
+# 회사 → Application 수락
+# =========================
+@router.post("/{application_id}/accept")  # 수락
+async def accept_application(  # 핸들러
+        application_id: int,  # 지원 ID
+        db: AsyncSession = Depends(get_async_db),  # DB 세션
+        me=Depends(get_current_user),  # 현재 사용자
+):
+    if me.role != UserRole.COMPANY:  # 회사만 가능
+        raise HTTPException(status_code=403, detail="Only companies can accept applications")  # 권한 오류
+
+    rows = await _respond_to_applications(db, me.id, [application_id], ApplicationStatus.ACCEPTED)  # 조건부 전이 + 채팅방 생성
+    if not rows:  # 전이되지 않음
+        await _raise_not_transitioned(db, me.id, application_id)  # 사유별 오류
+
+    await db.commit()  # 커밋
+    _publish_responses(rows, ApplicationStatus.ACCEPTED)  # 커밋 후 알림
     return {"message": "Application accepted"}  # 응답
 
 
@@ -157,18 +366,10 @@ async def reject_application(  # 핸들러
     if me.role != UserRole.COMPANY:  # 회사만 가능
         raise HTTPException(status_code=403, detail="Only companies can reject applications")  # 권한 오류
 
-    application = await db.get(Application, application_id)  # 지원 조회
-    if not application:  # 없으면
-        raise HTTPException(status_code=404, detail="Application not found")  # 404
-
-    if application.company_id != me.id:  # 소유 확인
-        raise HTTPException(status_code=403, detail="Not your application")  # 권한 오류
-
-    if application.status != ApplicationStatus.REQUESTED:  # 이미 처리됨
-        raise HTTPException(status_code=400, detail="Application already processed")  # 잘못된 요청
-
-    application.status = ApplicationStatus.REJECTED  # 상태 변경
-    application.responded_at = datetime.utcnow()  # 응답 시각
+    rows = await _respond_to_applications(db, me.id, [application_id], ApplicationStatus.REJECTED)  # 조건부 전이
+    if not rows:  # 전이되지 않음
+        await _raise_not_transitioned(db, me.id, application_id)  # 사유별 오류
 
     await db.commit()  # 커밋
+    _publish_responses(rows, ApplicationStatus.REJECTED)  # 커밋 후 알림
     return {"message": "Application rejected"}  # 응답
@@ -1,17 +1,36 @@
+import os  # 환경 변수 접근
+from datetime import datetime, timedelta, timezone  # 시간
+
 from fastapi import (  # FastAPI 컴포넌트
     APIRouter,  # 라우터
     Depends,  # 의존성
     HTTPException,  # 예외
+    Query,  # 쿼리 파라미터
+    Response,  # 응답 헤더 설정
     WebSocket,  # WebSocket
     WebSocketDisconnect,  # WS 종료 예외
 )
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
-from sqlalchemy import select, or_  # SQLAlchemy 조회/조건
+from sqlalchemy import select, tuple_, union_all  # SQLAlchemy 조회/행 비교/합집합
 
-from ..deps import get_async_db, get_current_user, get_current_user_ws  # 의존성
-from ..models import ChatRoom, ChatMessage  # 모델
+from ..deps import get_async_db, get_current_user, get_current_user_ws, require_role  # 의존성/권한
+from ..models import ChatRoom, ChatMessage, UserRole, chat_room_activity_at  # 모델/활동 시각 식
+from ..pagination import (  # 커서 페이지네이션
+    DEFAULT_PAGE_SIZE,  # 기본 크기
+    MAX_PAGE_SIZE,  # 최대 크기
+    NEXT_CURSOR_HEADER,  # 다음 커서 헤더
+    decode_cursor,  # 커서 해석
+    encode_cursor,  # 커서 생성
+)
 from ..schemas import ChatRoomOut  # 스키마
-from ..websocket_manager import ConnectionManager  # WS 매니저
+from ..serialization import FastJSONResponse, RowShape, fast_json  # 목록 빠른 직렬화
+from ..services.chat_partitions import retention_cutoff  # 보존 기간 시작 월
+from ..websocket_manager import manager  # WS 연결 관리자
+
+WS_RESUME_MAX_REPLAY = int(os.getenv("WS_RESUME_MAX_REPLAY", "500"))  # DB 재전송 최대 건수
+WS_MAX_MESSAGE_LENGTH = int(os.getenv("WS_MAX_MESSAGE_LENGTH", "2000"))  # 메시지 최대 길이
+WS_RATE_LIMIT_POLICY = os.getenv("WS_RATE_LIMIT_POLICY", "reject")  # 위반 시 처리: reject(에러 프레임) | close(1008 종료)
+RESUME_CREATED_AT_SLACK = timedelta(minutes=5)  # 동시 트랜잭션의 id/created_at(트랜잭션 시작 시각) 역전 여유
 
 # =========================
 # REST Router
@@ -23,7 +42,7 @@ router = APIRouter(prefix="/chat", tags=["chat"])  # /chat 라우터
 # =========================
 ws_router = APIRouter(prefix="/ws", tags=["chat"])  # /ws 라우터
 
-manager = ConnectionManager()  # 연결 관리자
+CHAT_ROOM_ROW = RowShape(ChatRoomOut, ChatRoom, keep=("id",))  # 목록 응답 컬럼(입장별 조회용, 커서 키 포함)
 
 # -------------------------------------------------
 # REST: 채팅방 생성 차단 (Application 기반만 허용)
@@ -41,29 +60,153 @@ async def create_chat_room_disabled():  # 핸들러
 # REST: 내 채팅방 목록
 # GET /api/chat/rooms
 # -------------------------------------------------
-@router.get("/rooms", response_model=list[ChatRoomOut])  # 채팅방 목록
+@router.get("/rooms", response_model=list[ChatRoomOut], response_class=FastJSONResponse)  # 채팅방 목록
 async def list_my_chat_rooms(  # 핸들러
+    response: Response,  # 응답(커서 헤더)
+    cursor: str | None = Query(default=None),  # 이전 페이지의 X-Next-Cursor
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),  # 페이지 크기
+    fields: str | None = Query(default=None, description="comma-separated ChatRoomOut fields, e.g. id,last_message_at"),  # 희소 필드셋
     db: AsyncSession = Depends(get_async_db),  # DB 세션
     user=Depends(get_current_user),  # 현재 사용자
 ):
-    stmt = select(ChatRoom).where(  # 조회 조건
-        or_(  # OR 조건
-            ChatRoom.company_id == user.id,  # 회사 입장
-            ChatRoom.student_id == user.id,  # 학생 입장
+    """
+    최근 활동순 채팅방 목록 (키셋 커서 페이지네이션)
+
+    - OR 조건 대신 회사/학생 입장을 각각 인덱스 스캔한 뒤 UNION ALL로 합친다
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려준다
+    - 응답 컬럼만 Core 행으로 읽어 바로 JSON 인코딩 (ORM 엔티티/응답 재검증 생략)
+    - fields=가 있으면 해당 필드만 SELECT/응답
+    """  # 함수 설명
+    selected = CHAT_ROOM_ROW.parse_fields(fields)  # 요청 필드
+    inner = CHAT_ROOM_ROW.narrow(selected)  # 입장별 조회 컬럼
+    after = decode_cursor(cursor) if cursor else None  # 커서 위치
+
+    def _side(*conditions):  # 한쪽 입장 조회(인덱스 순서와 동일하게 정렬)
+        stmt = select(*inner.columns, chat_room_activity_at.label("activity_at")).where(*conditions)  # 기본 조건
+        if after:  # 커서 이후만
+            stmt = stmt.where(tuple_(chat_room_activity_at, ChatRoom.id) < tuple_(*after))  # 행 비교
+        return stmt.order_by(chat_room_activity_at.desc(), ChatRoom.id.desc()).limit(limit + 1)  # 한 건 더 조회
+
+    rooms = union_all(  # 두 인덱스 스캔 합치기
+        _side(ChatRoom.company_id == user.id),  # 회사 입장
+        _side(ChatRoom.student_id == user.id, ChatRoom.company_id != user.id),  # 학생 입장(중복 제외)
+    ).subquery("rooms")  # 서브쿼리
+    shape = RowShape(ChatRoomOut, rooms.c, fields=selected, keep=("id",))  # 서브쿼리 컬럼 기준 변환
+
+    stmt = (  # 최종 병합 정렬
+        select(*shape.columns, rooms.c.activity_at)  # 응답 컬럼 + 활동 시각
+        .order_by(rooms.c.activity_at.desc(), rooms.c.id.desc())  # 최근 활동순
+        .limit(limit + 1)  # 다음 페이지 확인용 한 건 더
+    )
+    rows = (await db.execute(stmt)).all()  # 조회 실행
+
+    if len(rows) > limit:  # 다음 페이지 존재
+        rows = rows[:limit]  # 현재 페이지만
+        last = rows[-1]  # 마지막 행
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.activity_at, last.id)  # 다음 커서
+
+    return fast_json(shape.dump_all(rows), response)  # 커서 헤더 유지
+
+
+# -------------------------------------------------
+# REST: WS 연결 통계 (관리자만)
+# GET /api/chat/stats
+# -------------------------------------------------
+@router.get("/stats")  # 연결 통계
+async def get_connection_stats(  # 핸들러
+    user=Depends(require_role(UserRole.ADMIN)),  # 관리자만
+):
+    return manager.stats()  # 통계 반환
+
+
+def _message_frame(msg: ChatMessage) -> dict:  # 메시지 프레임 생성
+    return {
+        "type": "message",  # 메시지 타입
+        "id": msg.id,  # 메시지 ID
+        "chat_room_id": msg.chat_room_id,  # 방 ID
+        "sender_id": msg.sender_id,  # 발신자 ID
+        "content": msg.content,  # 내용
+        "created_at": msg.created_at.isoformat(),  # 시각
+    }
+
+
+def recent_messages_query(chat_room_id: int, limit: int):  # 방 최근 메시지(버퍼 적재용)
+    """
+    보존 기간 안의 최신 메시지 limit건 (최신 파티션부터 순서대로 읽고 limit에서 멈춤)
+    """  # 함수 설명
+    return (
+        select(ChatMessage)  # 메시지
+        .where(
+            ChatMessage.chat_room_id == chat_room_id,  # 방 조건
+            ChatMessage.created_at >= retention_cutoff(),  # 보존 기간 밖 파티션 제외
         )
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())  # 최신순(정렬 Append)
+        .limit(limit)  # 개수 제한
     )
-    result = await db.execute(stmt)  # 조회 실행
-    return result.scalars().all()  # 목록 반환
+
+
+def missed_messages_query(chat_room_id: int, last_seen_id: int, since: datetime | None):  # 공백 구간 메시지
+    """
+    last_seen_id 이후 메시지 (since 이전 파티션은 계획 단계에서 제외)
+    - since: last_seen_id 메시지의 created_at, 모르면 보존 기간 시작
+    """  # 함수 설명
+    floor = retention_cutoff() if since is None else since - RESUME_CREATED_AT_SLACK  # created_at 하한
+    return (
+        select(ChatMessage)  # 메시지
+        .where(
+            ChatMessage.chat_room_id == chat_room_id,  # 방 조건
+            ChatMessage.id > last_seen_id,  # 공백 구간
+            ChatMessage.created_at >= floor,  # 파티션 제외용 하한
+        )
+        .order_by(ChatMessage.id)  # 오래된 순
+        .limit(WS_RESUME_MAX_REPLAY + 1)  # 잘림 확인용 한 건 더
+    )
+
+
+async def _missed_messages(db: AsyncSession, chat_room_id: int, last_seen_id: int):  # 놓친 메시지 조회
+    """
+    last_seen_id 이후 메시지 반환: (프레임 목록, 출처, 잘림 여부)
+    - 방 버퍼가 비어 있으면 최근 메시지로 한 번만 채운다
+    - 버퍼가 공백을 덮지 못할 때만 DB에서 직접 읽는다
+    """  # 함수 설명
+    missed = manager.replay_since(chat_room_id, last_seen_id)  # 버퍼 조회
+    if missed is not None:  # 버퍼 적중
+        return missed, "buffer", False  # 반환
+
+    if not manager.is_history_seeded(chat_room_id):  # 재시작 후 첫 재접속
+        result = await db.execute(recent_messages_query(chat_room_id, manager.resume_buffer_size))  # 최근 메시지 조회
+        recent = [_message_frame(m) for m in result.scalars().all()]  # 프레임 변환
+        manager.seed_history(  # 버퍼 적재
+            chat_room_id,  # 방 ID
+            recent,  # 최근 메시지
+            complete=len(recent) < manager.resume_buffer_size,  # 전체 이력 여부
+        )
+        missed = manager.replay_since(chat_room_id, last_seen_id)  # 다시 조회
+        if missed is not None:  # 적재 후 적중
+            return missed, "buffer", False  # 반환
+
+    since = await db.scalar(  # 마지막 메시지 시각(공백 구간 시작 파티션)
+        select(ChatMessage.created_at).where(
+            ChatMessage.chat_room_id == chat_room_id,  # 방 조건
+            ChatMessage.id == last_seen_id,  # 마지막으로 받은 메시지
+            ChatMessage.created_at >= retention_cutoff(),  # 보존 기간 파티션만
+        )
+    )
+    result = await db.execute(missed_messages_query(chat_room_id, last_seen_id, since))  # 버퍼보다 긴 공백은 DB에서
+    rows = result.scalars().all()  # 결과
+    truncated = len(rows) > WS_RESUME_MAX_REPLAY  # 잘림 여부
+    return [_message_frame(m) for m in rows[:WS_RESUME_MAX_REPLAY]], "database", truncated  # 반환
 
 
 # =================================================
 # WebSocket: 채팅 입장
-# ws://host/api/ws/chat/{chat_room_id}?token=...
+# ws://host/api/ws/chat/{chat_room_id}?token=...&last_seen_id=...
 # =================================================
 @ws_router.websocket("/chat/{chat_room_id}")  # WS 라우트
 async def chat_ws(  # WS 핸들러
     websocket: WebSocket,  # 소켓
     chat_room_id: int,  # 채팅방 ID
+    last_seen_id: int | None = None,  # 재접속 시 마지막으로 받은 메시지 ID
     db: AsyncSession = Depends(get_async_db),  # DB 세션
 ):
     await websocket.accept()  # 연결 수락
@@ -75,36 +218,63 @@ async def chat_ws(  # WS 핸들러
         await websocket.close(code=1008)  # 정책 위반 종료
         return  # 종료
 
-    await manager.connect(chat_room_id, websocket)  # 연결 등록
+    await manager.connect(chat_room_id, websocket, user_id=user.id)  # 연결 등록
 
     try:
+        if last_seen_id is not None:  # 재접속 재전송
+            missed, source, truncated = await _missed_messages(db, chat_room_id, last_seen_id)  # 놓친 메시지
+            for frame in missed:  # 순서대로
+                await websocket.send_json(frame)  # 전송
+            await websocket.send_json(  # 재전송 완료 알림
+                {"type": "resumed", "count": len(missed), "source": source, "truncated": truncated}
+            )
+
         while True:  # 메시지 루프
             data = await websocket.receive_json()  # JSON 수신
+            manager.touch(websocket)  # 생존 확인 시각 갱신
+
+            frame_type = data.get("type")  # 프레임 종류
+            if frame_type == "pong":  # 하트비트 응답
+                continue  # DB 접근 없이 무시
+            if frame_type == "ping":  # 클라이언트 ping
+                await websocket.send_json({"type": "pong"})  # pong 응답
+                continue  # 다음 프레임
+
             content = data.get("content")  # 메시지 내용
 
             if not content:  # 내용 없으면
                 continue  # 무시
 
+            violation = None  # 위반 사유
+            if not isinstance(content, str):  # 문자열 아님
+                violation = "invalid_content"  # 형식 위반
+            elif len(content) > WS_MAX_MESSAGE_LENGTH:  # 길이 초과
+                violation = "message_too_long"  # 길이 위반
+            elif not manager.allow_message(websocket):  # 속도 초과
+                violation = "rate_limited"  # 속도 위반
+
+            if violation:  # DB 접근 없이 처리
+                if WS_RATE_LIMIT_POLICY == "close":  # 종료 정책
+                    await websocket.close(code=1008)  # 정책 위반 종료
+                    return  # 핸들러 종료(finally에서 정리)
+                await websocket.send_json({"type": "error", "code": violation})  # 에러 프레임
+                continue  # 다음 프레임
+
             msg = ChatMessage(  # 메시지 생성
                 chat_room_id=chat_room_id,  # 방 ID
                 sender_id=user.id,  # 발신자
                 content=content,  # 내용
             )
             db.add(msg)  # 세션 추가
+            room.last_message_at = datetime.now(timezone.utc)  # 방 활동 시각 갱신(목록 정렬용)
             await db.commit()  # 커밋
             await db.refresh(msg)  # DB 반영
 
-            await manager.broadcast(  # 브로드캐스트
-                chat_room_id,  # 방 ID
-                {
-                    "type": "message",  # 메시지 타입
-                    "id": msg.id,  # 메시지 ID
-                    "chat_room_id": chat_room_id,  # 방 ID
-                    "sender_id": msg.sender_id,  # 발신자 ID
-                    "content": msg.content,  # 내용
-                    "created_at": msg.created_at.isoformat(),  # 시각
-                },
-            )
+            frame = _message_frame(msg)  # 메시지 프레임
+            manager.remember(chat_room_id, frame)  # 재전송 버퍼 기록
+            await manager.broadcast(chat_room_id, frame)  # 브로드캐스트
 
     except WebSocketDisconnect:
+        pass  # 정상 종료
+    finally:
         manager.disconnect(chat_room_id, websocket)  # 연결 해제
@@ -1,11 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from typing import Optional
-from ..deps import get_async_db, get_current_user, get_current_user_optional
-from ..models import User
+from ..deps import LazyUser, get_lazy_user
 from ..schemas import ChatbotRequest, ChatbotResponse
 from ..services.chatbot_services import chatbot
+from ..services.job_snapshot import job_snapshot
 
 router = APIRouter(prefix="/chatbot", tags=["chatbot"])
 
@@ -13,40 +12,41 @@ router = APIRouter(prefix="/chatbot", tags=["chatbot"])
 @router.post("/chat", response_model=ChatbotResponse)
 async def chat_with_bot(
         payload: ChatbotRequest,
-        user: Optional[User] = Depends(get_current_user_optional),
+        user: LazyUser = Depends(get_lazy_user),  # resolved only if awaited: no JWT/DB work otherwise
 ):
     """
-    rule based chatbot
+    rule based chatbot (job data slots, keywords, n-gram classifier, then fallback)
     """
     message = payload.message.strip()
 
     if not message:
         raise HTTPException(status_code=400, detail="메시지를 입력해주세요")
 
-    # Create a chatbot response
-    reply = chatbot.get_response(message)
+    # Create a chatbot response (source reports which stage answered)
+    # Region/wage questions read the in-memory job snapshot, never the database
+    answer = chatbot.answer(message, snapshot=job_snapshot)
 
     return ChatbotResponse(
-        reply=reply,
-        source="rule_based"
+        reply=answer.reply,
+        source=answer.source,
+        intent=answer.intent,
+        confidence=answer.confidence,
+        jobs=list(answer.jobs),
     )
 
 
 @router.get("/intents")
 async def get_available_intents(
-        user: Optional[User] = Depends(get_current_user_optional),
+        request: Request,
+        user: LazyUser = Depends(get_lazy_user),
 ):
     """
-    List of topics that chatbots can understand
+    List of topics that chatbots can understand (derived from the intents file)
     """
-    return {
-        "intents": [
-        { "name": "Greeting", "examples": ["hi", "hello", "hey"] },
-        { "name": "Job Search", "examples": ["job", "part-time", "hiring"] },
-        { "name": "Application Guide", "examples": ["apply", "application", "how"] },
-        { "name": "Wage Information", "examples": ["wage", "pay", "salary"] },
-        { "name": "Profile", "examples": ["profile", "resume", "information"] },
-        { "name": "Help", "examples": ["help", "support", "question"] }
-        ]
-
-    }
\ No newline at end of file
+    table = chatbot.current()
+    headers = {"ETag": table.etag, "Cache-Control": "public, max-age=60"}
+
+    if request.headers.get("if-none-match") == table.etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=table.payload, media_type="application/json", headers=headers)
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends  # 라우터/의존성
+from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
+from sqlalchemy import select  # SQLAlchemy 조회
+
+from ..deps import get_async_db, require_role  # DB 의존성/권한
+from ..models import User, UserRole, JobPost  # 모델
+from ..schemas import CompanyDashboard, JobPostApplicationStats  # 스키마
+
+router = APIRouter(prefix="/companies", tags=["companies"])  # /companies 라우터
+
+
+# -------------------------------------------------
+# 회사 대시보드: 공고별 지원 현황 (회사만 가능)
+# GET /api/companies/me/dashboard
+# -------------------------------------------------
+@router.get("/me/dashboard", response_model=CompanyDashboard)  # 대시보드
+async def get_my_dashboard(  # 핸들러
+    user: User = Depends(require_role(UserRole.COMPANY)),  # 회사만
+    db: AsyncSession = Depends(get_async_db),  # DB 세션
+):
+    """
+    증분 유지되는 공고별 카운터를 회사 인덱스로 한 번에 읽어 반환
+    """  # 함수 설명
+    result = await db.execute(  # 조회 실행
+        select(  # 필요한 컬럼만
+            JobPost.id,  # 공고 ID
+            JobPost.title,  # 제목
+            JobPost.status,  # 공고 상태
+            JobPost.requested_count,  # 대기
+            JobPost.accepted_count,  # 수락
+            JobPost.rejected_count,  # 거절
+        )
+        .where(JobPost.company_id == user.id, JobPost.is_deleted == False)  # 내 공고(삭제 제외)  # noqa: E712
+        .order_by(JobPost.created_at.desc())  # 최신순
+    )
+    posts = [JobPostApplicationStats.model_validate(row) for row in result.all()]  # 공고별 현황
+
+    return CompanyDashboard(  # 응답
+        requested_count=sum(p.requested_count for p in posts),  # 전체 대기
+        accepted_count=sum(p.accepted_count for p in posts),  # 전체 수락
+        rejected_count=sum(p.rejected_count for p in posts),  # 전체 거절
+        job_posts=posts,  # 공고별 현황
+    )
@@ -0,0 +1,39 @@
+import os  # 환경 변수 접근
+
+from fastapi import APIRouter, Header, HTTPException, Response  # 라우터/헤더/예외/응답
+
+from ..metrics import render_samples, request_metrics  # 요청 지표
+from ..services.notifications import notification_manager  # 알림 WS 연결 관리자
+from ..websocket_manager import manager as chat_manager  # 채팅 WS 연결 관리자
+
+router = APIRouter(tags=["metrics"])  # /metrics 라우터(prefix 없음)
+
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")  # 설정 시 Bearer 토큰 필요
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"  # Prometheus 텍스트 형식
+
+
+def _websocket_samples():  # WS 연결 관리자 지표
+    for channel, manager in (("chat", chat_manager), ("notifications", notification_manager)):  # 채널별
+        stats = manager.stats()  # 통계
+        labels = {"channel": channel}  # 채널 라벨
+        yield "ws_connections", "gauge", labels, stats["connections"]  # 활성 연결
+        yield "ws_users_online", "gauge", labels, stats["users_online"]  # 접속 사용자
+        yield "ws_rooms", "gauge", labels, stats["rooms"]  # 활성 방
+        yield "ws_messages_received_total", "counter", labels, stats["messages_received"]  # 수신(rate()로 초당)
+        yield "ws_frames_sent_total", "counter", labels, stats["frames_sent"]  # 전송(rate()로 초당)
+        yield "ws_rate_limited_total", "counter", labels, stats["rate_limited"]  # 속도 제한 거부
+        yield "ws_evicted_total", "counter", {**labels, "reason": "idle"}, stats["evicted_idle"]  # 무응답 정리
+        yield "ws_evicted_total", "counter", {**labels, "reason": "over_cap"}, stats["evicted_over_cap"]  # 상한 초과
+
+
+# -------------------------------------------------
+# Prometheus 스크레이프
+# GET /metrics
+# -------------------------------------------------
+@router.get("/metrics", include_in_schema=False)  # 지표 엔드포인트
+async def metrics(authorization: str | None = Header(default=None)):  # 핸들러
+    if METRICS_TOKEN and authorization != f"Bearer {METRICS_TOKEN}":  # 토큰 확인
+        raise HTTPException(status_code=401, detail="Not authenticated")  # 인증 실패
+
+    body = request_metrics.render() + render_samples(_websocket_samples())  # 요청 + WS 지표
+    return Response(content=body, media_type=PROMETHEUS_CONTENT_TYPE)  # 텍스트 응답
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect  # 라우터/WebSocket
+
+from ..deps import get_current_user_ws  # WS 인증
+from ..services.notifications import notification_manager  # 알림 연결 관리자
+
+ws_router = APIRouter(prefix="/ws", tags=["notifications"])  # /ws 라우터
+
+
+# =================================================
+# WebSocket: 사용자 알림 채널
+# ws://host/api/ws/notifications?token=...
+# =================================================
+@ws_router.websocket("/notifications")  # WS 라우트
+async def notifications_ws(  # WS 핸들러
+    websocket: WebSocket,  # 소켓
+):
+    await websocket.accept()  # 연결 수락
+
+    user = await get_current_user_ws(websocket)  # WS 사용자 인증
+
+    await notification_manager.connect(user.id, websocket, user_id=user.id)  # 사용자 채널 등록
+
+    try:
+        while True:  # 수신 루프(하트비트 응답/종료 감지)
+            data = await websocket.receive_json()  # JSON 수신
+            notification_manager.touch(websocket)  # 생존 확인 시각 갱신
+
+            if data.get("type") == "ping":  # 클라이언트 ping
+                await websocket.send_json({"type": "pong"})  # pong 응답
+
+    except WebSocketDisconnect:
+        pass  # 정상 종료
+    finally:
+        notification_manager.disconnect(user.id, websocket)  # 연결 해제
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query  # 라우터/의존성/예외/쿼리
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
-from sqlalchemy import select  # SQLAlchemy 조회
+from sqlalchemy import func, select  # SQLAlchemy 조회/함수
 
 from ..deps import get_async_db, require_role  # DB 의존성/권한
 from ..models import User, UserRole, JobPost, JobPostImage, JobPostStatus  # 모델
@@ -11,6 +11,10 @@ from ..schemas import (  # 스키마
     JobPostImageCreate,  # 이미지 생성
     JobPostImageOut,  # 이미지 응답
 )
+from ..services.recommender import index_job_post  # 추천 인덱스 반영
+from ..services.job_snapshot import apply_job_post  # 챗봇 공고 스냅샷 반영
+from ..serialization import FastJSONResponse  # 목록 빠른 직렬화
+from ..loaders import JOB_POST_ROW, RequestLoaders, get_loaders, parse_ids  # 요청 단위 일괄 로더
 
 router = APIRouter(prefix="/job-posts", tags=["job-posts"])  # /job-posts 라우터
 
@@ -37,21 +41,46 @@ async def create_job_post(  # 핸들러
     db.add(job)  # 세션 추가
     await db.commit()  # 커밋
     await db.refresh(job)  # DB 반영
+    index_job_post(job)  # 추천 인덱스 반영
+    apply_job_post(job)  # 챗봇 스냅샷 반영
     return job  # 공고 반환
 
 
 # -------------------------------------------------
-# 공고 목록 조회
+# 공고 목록 조회 / 다건 조회
 # GET /api/job-posts
+# GET /api/job-posts?ids=1,2,3
 # -------------------------------------------------
-@router.get("", response_model=list[JobPostOut])  # 공고 목록
+@router.get("", response_model=list[JobPostOut], response_class=FastJSONResponse)  # 공고 목록
 async def list_job_posts(  # 핸들러
     db: AsyncSession = Depends(get_async_db),  # DB 세션
     status: JobPostStatus | None = Query(default=None),  # 상태 필터
     region: str | None = Query(default=None),  # 지역 필터
+    fields: str | None = Query(default=None, description="comma-separated JobPostOut fields, e.g. title,wage,region"),  # 희소 필드셋
+    ids: str | None = Query(default=None, description="comma-separated job post ids, e.g. 1,2,3"),  # 다건 조회
+    loaders: RequestLoaders = Depends(get_loaders),  # 요청 단위 로더
 ):
+    """
+    응답 컬럼만 Core 행으로 읽어 바로 JSON 인코딩 (ORM 엔티티/응답 재검증 생략)
+    - fields=가 있으면 해당 필드만 SELECT/응답
+    - ids=가 있으면 해당 공고를 요청 순서대로 반환 (없거나 삭제된 ID는 제외, 한 번의 ANY 조회)
+    """  # 함수 설명
+    selected = JOB_POST_ROW.parse_fields(fields)  # 요청 필드
+    if ids is not None:  # 다건 조회
+        rows = [  # 요청 순서 유지
+            row for row in await loaders.job_posts.load_many(parse_ids(ids))  # 일괄 로더
+            if row is not None  # 없는 공고 제외
+            and (status is None or row.status == status)  # 상태 필터
+            and (region is None or row.region == region)  # 지역 필터
+        ]
+        items = JOB_POST_ROW.dump_all(rows)  # 전체 필드(로더 행은 다른 핸들러와 공유)
+        if selected is not None:  # 희소 필드셋
+            items = [{name: item[name] for name in selected} for item in items]  # 응답만 축소
+        return FastJSONResponse(items)  # 목록 반환
+
+    shape = JOB_POST_ROW.narrow(selected)  # 요청 필드 규칙
     stmt = (  # 기본 쿼리
-        select(JobPost)  # 공고 조회
+        select(*shape.columns)  # 응답 컬럼만
         .where(JobPost.is_deleted == False)  # 삭제 제외  # noqa: E712
         .order_by(JobPost.created_at.desc())  # 최신순
     )
@@ -62,7 +91,7 @@ async def list_job_posts(  # 핸들러
         stmt = stmt.where(JobPost.region == region)  # 지역 조건
 
     result = await db.execute(stmt)  # 조회 실행
-    return result.scalars().all()  # 목록 반환
+    return FastJSONResponse(shape.dump_all(result))  # 목록 반환
 
 
 # -------------------------------------------------
@@ -112,9 +141,12 @@ async def update_job_post(  # 핸들러
 
     for field, value in payload.model_dump(exclude_unset=True).items():  # 변경 필드 순회
         setattr(job, field, value)  # 값 반영
+    job.updated_at = func.now()  # 수정 시각(스냅샷 변경분 기준)
 
     await db.commit()  # 커밋
     await db.refresh(job)  # DB 반영
+    index_job_post(job)  # 추천 인덱스 반영
+    apply_job_post(job)  # 챗봇 스냅샷 반영
     return job  # 공고 반환
 
 
@@ -0,0 +1,73 @@
+import operator  # 덧셈 연산자
+from functools import reduce  # 식 누적
+from typing import List, Literal, Optional  # 타입 힌트
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response  # 라우터/의존성/예외/쿼리/응답
+from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
+from sqlalchemy import Integer, String, bindparam, cast, select, tuple_  # SQLAlchemy 조회/형변환/행 비교
+from sqlalchemy.dialects.postgresql import ARRAY  # 배열 파라미터
+
+from ..deps import get_async_db, require_role  # DB 의존성/권한
+from ..models import User, UserRole, StudentProfile  # 모델
+from ..pagination import (  # 커서 페이지네이션
+    DEFAULT_PAGE_SIZE,  # 기본 크기
+    MAX_PAGE_SIZE,  # 최대 크기
+    NEXT_CURSOR_HEADER,  # 다음 커서 헤더
+    decode_cursor,  # 커서 해석
+    encode_cursor,  # 커서 생성
+)
+from ..schemas import StudentProfileOut, StudentSearchResult  # 스키마
+
+router = APIRouter(prefix="/students", tags=["students"])  # /students 라우터
+
+MAX_SEARCH_SKILLS = 20  # 검색 기술 최대 개수
+
+
+# -------------------------------------------------
+# 기술 기반 학생 검색 (회사/관리자만 가능)
+# GET /api/students/search?skills=python,excel
+# -------------------------------------------------
+@router.get("/search", response_model=List[StudentSearchResult])  # 학생 검색
+async def search_students(  # 핸들러
+    response: Response,  # 응답(커서 헤더)
+    skills: str = Query(..., description="comma-separated skills"),  # 기술 목록
+    match: Literal["any", "all"] = Query("any"),  # any: 하나라도(?|), all: 모두(@>)
+    cursor: Optional[str] = Query(None),  # 이전 페이지의 X-Next-Cursor
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),  # 페이지 크기
+    user: User = Depends(require_role(UserRole.COMPANY, UserRole.ADMIN)),  # 회사/관리자만
+    db: AsyncSession = Depends(get_async_db),  # DB 세션
+):
+    """
+    GIN 인덱스(skills)로 후보를 좁힌 뒤 일치 기술 수 내림차순으로 정렬
+    """  # 함수 설명
+    terms = list(dict.fromkeys(t.strip() for t in skills.split(",") if t.strip()))  # 중복/공백 제거
+    if not terms:  # 검색어 없음
+        raise HTTPException(status_code=422, detail="skills required")  # 유효성 오류
+    if len(terms) > MAX_SEARCH_SKILLS:  # 너무 많음
+        raise HTTPException(status_code=422, detail=f"at most {MAX_SEARCH_SKILLS} skills")  # 유효성 오류
+
+    matched = reduce(operator.add, (cast(StudentProfile.skills.has_key(t), Integer) for t in terms))  # 일치 기술 수
+
+    if match == "all":  # 모두 포함
+        condition = StudentProfile.skills.contains(terms)  # skills @> '[...]'
+    else:  # 하나라도 포함
+        condition = StudentProfile.skills.has_any(bindparam("terms", terms, type_=ARRAY(String)))  # skills ?| array[...]
+
+    stmt = select(StudentProfile, matched.label("matched_skills")).where(condition)  # 후보 + 점수
+    if cursor:  # 커서 이후만
+        after = decode_cursor(cursor, sort_type=int)  # (점수, 사용자 ID)
+        stmt = stmt.where(tuple_(matched, StudentProfile.user_id) < tuple_(*after))  # 행 비교
+    stmt = stmt.order_by(matched.desc(), StudentProfile.user_id.desc()).limit(limit + 1)  # 점수순 + 한 건 더
+
+    rows = (await db.execute(stmt)).all()  # 조회 실행
+    if len(rows) > limit:  # 다음 페이지 존재
+        rows = rows[:limit]  # 현재 페이지만
+        last_profile, last_matched = rows[-1]  # 마지막 행
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_matched, last_profile.user_id)  # 다음 커서
+
+    results = []  # 응답 목록
+    for profile, matched_skills in rows:  # 행 순회
+        profile.skills = profile.skills or []  # null 방어
+        base = StudentProfileOut.model_validate(profile).model_dump()  # 프로필 필드
+        results.append(StudentSearchResult(**base, matched_skills=matched_skills))  # 점수 포함
+    return results  # 목록 반환
@@ -1,14 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException  # 라우터/의존성/예외
+from fastapi import APIRouter, Depends, HTTPException, Query  # 라우터/의존성/예외/쿼리
 from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
-from sqlalchemy import select  # SQLAlchemy 조회
 
 from ..deps import get_async_db, get_current_user, require_role  # 의존성/권한
-from ..models import User, UserRole, StudentProfile  # 모델
-from ..schemas import UserOut, StudentProfileUpsert, StudentProfileOut  # 스키마
+from ..loaders import USER_PUBLIC_ROW, RequestLoaders, get_loaders, parse_ids  # 요청 단위 일괄 로더
+from ..models import User, UserRole, StudentProfile, JobPostStatus  # 모델
+from ..schemas import (  # 스키마
+    UserOut,  # 내 정보
+    UserPublic,  # 공개 정보
+    StudentProfileUpsert,  # 프로필 요청
+    StudentProfileOut,  # 프로필 응답
+    JobPostOut,  # 공고 응답
+    JobPostRecommendation,  # 추천 응답
+)
+from ..serialization import FastJSONResponse  # 목록 빠른 직렬화
+from ..services.recommender import job_index, profile_text, profile_vectors  # 공고 추천 인덱스/프로필 벡터 캐시
 
 router = APIRouter(prefix="/users", tags=["users"])  # /users 라우터
 
 
+@router.get("", response_model=list[UserPublic], response_class=FastJSONResponse)  # 사용자 다건 조회
+async def get_users(  # 핸들러
+    ids: str = Query(..., description="comma-separated user ids, e.g. 1,2,3"),  # 사용자 ID 목록
+    user: User = Depends(get_current_user),  # 로그인 사용자만
+    loaders: RequestLoaders = Depends(get_loaders),  # 요청 단위 로더
+):
+    """
+    목록 화면용 사용자 공개 정보(역할, 학생 이름)를 요청 순서대로 반환
+    - 없거나 비활성인 ID는 제외, 한 번의 ANY 조회
+    """  # 함수 설명
+    rows = await loaders.users.load_many(parse_ids(ids))  # 일괄 로더
+    return FastJSONResponse(USER_PUBLIC_ROW.dump_all(row for row in rows if row is not None))  # 목록 반환
+
+
 @router.get("/me", response_model=UserOut)  # 내 정보
 async def me(  # 핸들러
     user: User = Depends(get_current_user),  # 현재 사용자
@@ -56,6 +79,36 @@ async def upsert_my_student_profile(  # 핸들러
 
     await db.commit()  # 커밋
     await db.refresh(profile)  # 갱신 반영
+    profile_vectors.invalidate(user.id)  # 지원자 순위용 캐시 무효화
 
     profile.skills = profile.skills or []  # null 방어
     return profile  # 프로필 반환
+
+
+@router.get("/me/recommendations", response_model=list[JobPostRecommendation])  # 추천 공고
+async def get_my_recommendations(  # 핸들러
+    k: int = Query(default=20, ge=1, le=100),  # 추천 개수
+    user: User = Depends(require_role(UserRole.STUDENT)),  # 학생만
+    db: AsyncSession = Depends(get_async_db),  # DB 세션
+    loaders: RequestLoaders = Depends(get_loaders),  # 요청 단위 로더
+):
+    """
+    내 프로필(기술/전공/가능 시간)과 열린 공고의 TF-IDF 유사도 상위 k개
+    """  # 함수 설명
+    profile = await db.get(StudentProfile, user.id)  # 프로필 조회
+    if not profile:  # 없으면
+        raise HTTPException(status_code=404, detail="Student profile not found")  # 404
+
+    await job_index.ensure_built()  # 인덱스 준비(최초 1회)
+    ranked = job_index.top_k(profile_text(profile.skills, profile.major, profile.available_time), k)  # 상위 k
+    if not ranked:  # 추천 없음
+        return []  # 빈 목록
+
+    rows = await loaders.job_posts.load_many([post_id for post_id, _ in ranked])  # 추천 공고 한 번에 조회
+    posts = {row.id: row for row in rows if row is not None and row.status == JobPostStatus.OPEN}  # 열린 공고만
+
+    return [  # 점수순 응답
+        JobPostRecommendation(**JobPostOut.model_validate(posts[post_id]).model_dump(), score=score)  # 점수 포함
+        for post_id, score in ranked
+        if post_id in posts  # 인덱스 반영 전 닫힌 공고 제외
+    ]
@@ -1,6 +1,6 @@
 from __future__ import annotations  # forward reference 허용
 
-from typing import List, Optional  # 타입 힌트
+from typing import List, Literal, Optional  # 타입 힌트
 from datetime import datetime  # 시간 타입
 from pydantic import BaseModel, Field  # Pydantic 기본/필드
 
@@ -42,6 +42,15 @@ class UserOut(BaseModel):  # 사용자 응답
         from_attributes = True  # ORM 객체 지원
 
 
+class UserPublic(BaseModel):  # 사용자 공개 정보(다른 사용자 조회용)
+    id: int  # 사용자 ID
+    role: UserRole  # 역할
+    name: Optional[str] = None  # 학생 이름(프로필 없거나 회사면 None)
+
+    class Config:  # Pydantic 설정
+        from_attributes = True  # ORM 객체 지원
+
+
 class StudentProfileUpsert(BaseModel):  # 학생 프로필 생성/수정
     name: str  # 이름
     school: Optional[str] = None  # 학교
@@ -57,6 +66,10 @@ class StudentProfileOut(StudentProfileUpsert):  # 학생 프로필 응답
         from_attributes = True  # ORM 객체 지원
 
 
+class StudentSearchResult(StudentProfileOut):  # 학생 검색 결과
+    matched_skills: int  # 일치한 기술 수
+
+
 # ---------- Job Posts ----------
 class JobPostCreate(BaseModel):  # 공고 생성 요청
     title: str  # 제목
@@ -102,6 +115,21 @@ class JobPostOut(BaseModel):  # 공고 응답
         from_attributes = True  # ORM 객체 지원
 
 
+class JobPostSummary(BaseModel):  # 공고 요약(목록 임베드용)
+    id: int  # 공고 ID
+    title: str  # 제목
+    wage: Optional[int]  # 시급/급여
+    region: str  # 지역
+    status: JobPostStatus  # 상태
+
+    class Config:  # Pydantic 설정
+        from_attributes = True  # ORM 객체 지원
+
+
+class JobPostRecommendation(JobPostOut):  # 추천 공고 응답
+    score: float  # 추천 점수
+
+
 # ---------- Application (채팅 요청) ----------
 class ApplicationCreate(BaseModel):  # 지원 생성 요청
     job_post_id: int  # 공고 ID
@@ -120,12 +148,55 @@ class ApplicationOut(BaseModel):  # 지원 응답
         from_attributes = True  # ORM 객체 지원
 
 
+class ApplicationListItem(ApplicationOut):  # 지원 목록 응답
+    job_post: JobPostSummary  # 공고 요약
+
+
+class RankedApplication(ApplicationOut):  # 지원자 순위 응답
+    score: float  # 프로필-공고 유사도
+
+
+class ApplicationBulkAction(BaseModel):  # 지원 일괄 처리 요청
+    ids: List[int] = Field(min_length=1, max_length=500)  # 지원 ID 목록
+    action: Literal["accept", "reject"]  # 처리 종류
+
+
+class ApplicationBulkResult(BaseModel):  # 지원 일괄 처리 결과(ID별)
+    id: int  # 지원 ID
+    outcome: Literal["accepted", "rejected", "not_found", "forbidden", "already_processed"]  # 처리 결과
+
+
+class ApplicationBulkResponse(BaseModel):  # 지원 일괄 처리 응답
+    results: List[ApplicationBulkResult]  # 요청 순서대로 결과
+
+
+# ---------- Company Dashboard ----------
+class JobPostApplicationStats(BaseModel):  # 공고별 지원 현황
+    id: int  # 공고 ID
+    title: str  # 제목
+    status: JobPostStatus  # 공고 상태
+    requested_count: int  # 대기 중 지원 수
+    accepted_count: int  # 수락된 지원 수
+    rejected_count: int  # 거절된 지원 수
+
+    class Config:  # Pydantic 설정
+        from_attributes = True  # ORM 객체 지원
+
+
+class CompanyDashboard(BaseModel):  # 회사 대시보드 응답
+    requested_count: int  # 전체 대기 중 지원 수
+    accepted_count: int  # 전체 수락된 지원 수
+    rejected_count: int  # 전체 거절된 지원 수
+    job_posts: List[JobPostApplicationStats]  # 공고별 현황
+
+
 # ---------- Chat ----------
 class ChatRoomOut(BaseModel):  # 채팅방 응답
     id: int  # 채팅방 ID
     job_post_id: int  # 공고 ID
     company_id: int  # 회사 ID
     student_id: int  # 학생 ID
+    last_message_at: Optional[datetime] = None  # 마지막 메시지 시각
 
     class Config:  # Pydantic 설정
         from_attributes = True  # ORM 객체 지원
@@ -144,10 +215,14 @@ class ChatMessageOut(BaseModel):  # 채팅 메시지 응답
     class Config:  # Pydantic 설정
         from_attributes = True  # ORM 객체 지원
 
+
 # -------------- Chatbot --------------
 class ChatbotRequest(BaseModel):
     message: str
 
 class ChatbotResponse(BaseModel):
     reply: str
-    source: str = "rule_based"
+    source: str = "rule_based"  # job_data | rule_based | classifier | fallback
+    intent: Optional[str] = None
+    confidence: Optional[float] = None
+    jobs: List[JobPostSummary] = []  # job_data answers only
@@ -0,0 +1,106 @@
+"""
+목록 엔드포인트 빠른 직렬화 경로
+
+- RowShape: 응답 스키마 필드 순서대로 필요한 컬럼만 SELECT하고, Core 행을 같은 순서의 dict로 변환
+  (ORM 엔티티/identity map 생성과 response_model 재검증을 건너뜀)
+- FastJSONResponse: orjson으로 인코딩, 기본 경로(pydantic JSON 모드 + json.dumps)와 같은 바이트를 생성
+  (UTC 시각은 "Z", Enum은 값, 공백 없는 구분자)
+- fields= 희소 필드셋: 스키마 필드 허용 목록으로 검증한 뒤 응답과 SELECT 컬럼을 함께 줄임
+- 동일성 검사: python -m benchmarks.serialization_contract
+"""
+
+from typing import Dict, List, Optional, Tuple, Type  # 타입 힌트
+
+import orjson  # 고속 JSON 인코더
+from fastapi import HTTPException, Response  # 필드 오류/핸들러 주입 응답
+from fastapi.responses import JSONResponse  # 기본 JSON 응답
+from pydantic import BaseModel  # 응답 스키마
+
+
+class FastJSONResponse(JSONResponse):  # orjson 응답
+    def render(self, content) -> bytes:  # 본문 인코딩
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)  # pydantic과 같은 UTC 표기(...Z)
+
+
+class RowShape:  # 스키마 기준 SELECT 컬럼/행 변환 규칙
+    def __init__(  # 생성자
+        self,
+        schema: Type[BaseModel],  # 응답 스키마
+        source,  # 컬럼 출처(모델 클래스 또는 서브쿼리의 .c)
+        nested: Optional[Dict[str, Tuple[Type[BaseModel], object]]] = None,  # 중첩 필드명 -> (스키마, 출처)
+        fields: Optional[Tuple[str, ...]] = None,  # 응답에 넣을 최상위 필드(None이면 전체)
+        keep: Tuple[str, ...] = (),  # 응답에는 없어도 SELECT할 필드(커서 계산용)
+    ):
+        """
+        스키마 필드 순서대로 컬럼을 모으고, 중첩 스키마 컬럼은 "필드__컬럼" 라벨로 평탄화
+        """  # 함수 설명
+        self.schema = schema  # 응답 스키마
+        self.source = source  # 컬럼 출처
+        self.nested = nested or {}  # 중첩 스키마
+        self.keep = keep  # 커서용 필드
+        self.allowed = tuple(schema.model_fields)  # fields= 허용 목록
+        self.columns: List = []  # SELECT 컬럼
+        self._plan = self._build(schema, source, self.nested, "", fields, keep)  # (필드명, 행 위치 또는 하위 계획)
+        self._narrowed: Dict[Tuple[str, ...], "RowShape"] = {}  # 필드 조합별 축소 규칙 캐시
+
+    def _build(self, schema, source, nested, prefix: str, fields=None, keep=()):  # 변환 계획
+        plan = []  # 필드별 계획
+        for name in schema.model_fields:  # 스키마 필드 순서(직렬화 순서와 동일)
+            dumped = fields is None or name in fields  # 응답 포함 여부
+            if not dumped and name not in keep:  # 요청되지 않은 필드
+                continue  # SELECT에서도 제외
+            if name in nested:  # 중첩 스키마
+                sub_schema, sub_source = nested[name]  # 하위 스키마/출처
+                plan.append((name, self._build(sub_schema, sub_source, {}, f"{prefix}{name}__")))  # 하위 계획
+                continue  # 다음 필드
+            column = getattr(source, name)  # 같은 이름의 컬럼
+            if dumped:  # 응답 필드
+                plan.append((name, len(self.columns)))  # 행 위치
+            self.columns.append(column.label(prefix + name) if prefix else column)  # 중첩이면 라벨로 충돌 방지
+        return plan  # 계획
+
+    def narrow(self, fields: Optional[Tuple[str, ...]]) -> "RowShape":  # fields= 적용 규칙
+        """
+        검증된 필드 조합의 축소 규칙 (조합별로 한 번만 생성)
+        """  # 함수 설명
+        if fields is None:  # 필드 지정 없음
+            return self  # 전체 응답
+        shape = self._narrowed.get(fields)  # 캐시 조회
+        if shape is None:  # 첫 조합
+            shape = self._narrowed[fields] = RowShape(self.schema, self.source, self.nested, fields, self.keep)  # 생성
+        return shape  # 축소 규칙
+
+    def parse_fields(self, fields: Optional[str]) -> Optional[Tuple[str, ...]]:  # fields= 검증
+        """
+        "title,wage,region" 형식을 허용 목록으로 검증해 스키마 순서의 튜플로 반환 (없으면 None)
+        """  # 함수 설명
+        if fields is None:  # 파라미터 없음
+            return None  # 전체 응답
+        requested = {f.strip() for f in fields.split(",") if f.strip()}  # 공백/중복 제거
+        unknown = sorted(requested.difference(self.allowed))  # 허용되지 않은 필드
+        if not requested or unknown:  # 비었거나 모르는 필드
+            raise HTTPException(  # 잘못된 요청
+                status_code=400,
+                detail=f"Invalid fields: {', '.join(unknown) or '(empty)'}. Allowed: {', '.join(self.allowed)}",
+            )
+        return tuple(name for name in self.allowed if name in requested)  # 스키마 순서(캐시 키 정규화)
+
+    def dump(self, row) -> dict:  # 행 1개 -> dict
+        return _dump(self._plan, row)  # 계획대로 변환
+
+    def dump_all(self, rows) -> List[dict]:  # 행 목록 -> dict 목록
+        plan = self._plan  # 지역 참조
+        return [_dump(plan, row) for row in rows]  # 변환
+
+
+def _dump(plan, row) -> dict:  # 계획대로 dict 생성
+    return {name: row[pos] if type(pos) is int else _dump(pos, row) for name, pos in plan}  # 위치 또는 중첩
+
+
+def fast_json(content, response: Response) -> FastJSONResponse:  # 주입 응답 헤더를 유지한 빠른 응답
+    """
+    핸들러가 Response를 직접 반환하면 주입받은 response의 헤더가 합쳐지지 않으므로
+    (X-Next-Cursor 등) 직접 옮겨 담는다
+    """  # 함수 설명
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}  # 빈 본문 길이 제외
+    return FastJSONResponse(content, headers=headers)  # 응답
@@ -0,0 +1,99 @@
+"""
+공고별 지원 상태 카운터 (job_posts.requested_count / accepted_count / rejected_count)
+
+- 지원 생성/수락/거절과 같은 트랜잭션에서 증분 갱신
+- 어긋났을 때 전체 재계산:
+
+    python -m app.services.application_counters reconcile
+"""
+
+import asyncio  # 비동기 실행
+
+from sqlalchemy import func, select, text, update  # SQLAlchemy 조회/갱신/원시 SQL
+from sqlalchemy.ext.asyncio import AsyncSession  # 비동기 세션
+
+from ..database import engine  # 비동기 엔진
+from ..models import Application, ApplicationStatus, JobPost  # 모델
+
+STATUS_COLUMNS = {  # 지원 상태 -> 카운터 컬럼
+    ApplicationStatus.REQUESTED: JobPost.requested_count,  # 대기
+    ApplicationStatus.ACCEPTED: JobPost.accepted_count,  # 수락
+    ApplicationStatus.REJECTED: JobPost.rejected_count,  # 거절
+}
+
+
+async def count_new_application(db: AsyncSession, job_post_id: int):  # 지원 생성 반영
+    """
+    새 지원 1건을 대기 카운터에 반영 (커밋은 호출자 몫)
+    """  # 함수 설명
+    await db.execute(  # 카운터 증가
+        update(JobPost)  # 공고 갱신
+        .where(JobPost.id == job_post_id)  # 대상 공고
+        .values(requested_count=JobPost.requested_count + 1)  # +1
+        .execution_options(synchronize_session=False)  # 세션 동기화 생략
+    )
+
+
+def transition_counters_cte(updated, new_status: ApplicationStatus):  # 상태 전이 반영 CTE
+    """
+    전이된 지원 행(CTE)을 공고별로 세어 대기 -> 목표 상태 카운터로 옮기는 UPDATE CTE
+    """  # 함수 설명
+    moved = (  # 공고별 전이 건수
+        select(updated.c.job_post_id, func.count().label("n"))  # 건수
+        .group_by(updated.c.job_post_id)  # 공고별
+        .subquery("moved")  # 서브쿼리
+    )
+    target = STATUS_COLUMNS[new_status]  # 목표 카운터
+    return (
+        update(JobPost)  # 공고 갱신
+        .where(JobPost.id == moved.c.job_post_id)  # 전이된 공고
+        .values({  # 카운터 이동
+            JobPost.requested_count: JobPost.requested_count - moved.c.n,  # 대기 감소
+            target: target + moved.c.n,  # 목표 증가
+        })
+        .cte("counters")  # CTE 이름
+    )
+
+
+async def reconcile_counters() -> int:  # 카운터 전체 재계산
+    """
+    applications 테이블을 집계해 모든 공고의 카운터를 다시 채우고 갱신된 공고 수 반환
+    """  # 함수 설명
+    counts = (  # 공고별 상태 집계
+        select(  # 집계 컬럼
+            Application.job_post_id,  # 공고 ID
+            *(
+                func.count().filter(Application.status == status).label(status.value.lower())  # 상태별 건수
+                for status in STATUS_COLUMNS
+            ),
+        )
+        .group_by(Application.job_post_id)  # 공고별
+        .subquery("counts")  # 서브쿼리
+    )
+    async with engine.begin() as conn:  # 트랜잭션
+        await conn.execute(text("LOCK TABLE applications IN SHARE MODE"))  # 재계산 중 지원 변경 차단
+        await conn.execute(  # 전체 초기화
+            update(JobPost).values(requested_count=0, accepted_count=0, rejected_count=0)  # 0으로
+        )
+        result = await conn.execute(  # 집계 반영
+            update(JobPost)  # 공고 갱신
+            .where(JobPost.id == counts.c.job_post_id)  # 지원이 있는 공고
+            .values(  # 집계값
+                requested_count=counts.c.requested,  # 대기
+                accepted_count=counts.c.accepted,  # 수락
+                rejected_count=counts.c.rejected,  # 거절
+            )
+        )
+        return result.rowcount  # 갱신된 공고 수
+
+
+async def _reconcile():  # CLI용 실행
+    try:
+        return await reconcile_counters()  # 재계산
+    finally:
+        await engine.dispose()  # 커넥션 풀 정리
+
+
+if __name__ == "__main__":  # 모듈 직접 실행
+    updated_posts = asyncio.run(_reconcile())  # 재계산 실행
+    print(f"reconciled counters for {updated_posts} job post(s)")  # 결과 출력
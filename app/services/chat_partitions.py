@@ -0,0 +1,156 @@
+"""
+chat_messages 월 파티션 관리
+
+- ensure: 앞으로 쓸 월 파티션을 미리 생성 (앱 실행 중에는 maintenance_loop가 주기 실행)
+  기본 파티션이 없으므로 파티션이 없는 달의 메시지는 저장되지 않는다
+- archive: 보존 기간이 지난 파티션을 gzip CSV로 내보낸 뒤 분리/삭제
+
+    python -m app.services.chat_partitions ensure
+    python -m app.services.chat_partitions archive --retention-months 12
+"""
+
+import argparse  # CLI 인자
+import asyncio  # 비동기 실행
+import gzip  # 압축 파일
+import logging  # 로깅
+import os  # 환경 변수/파일 경로
+import re  # 파티션 이름 파싱
+from datetime import datetime, timezone  # 시간
+from typing import List, Tuple  # 타입 힌트
+
+from sqlalchemy import text  # 원시 SQL
+
+from ..database import engine  # 비동기 엔진
+
+logger = logging.getLogger(__name__)  # 모듈 로거
+
+CHAT_PARTITION_MONTHS_AHEAD = int(os.getenv("CHAT_PARTITION_MONTHS_AHEAD", "3"))  # 미리 만들 개월 수
+CHAT_PARTITION_CHECK_INTERVAL = float(os.getenv("CHAT_PARTITION_CHECK_INTERVAL", "86400"))  # 주기 확인 간격(초)
+CHAT_RETENTION_MONTHS = int(os.getenv("CHAT_RETENTION_MONTHS", "12"))  # 보존 개월 수
+CHAT_ARCHIVE_DIR = os.getenv("CHAT_ARCHIVE_DIR", "archive/chat_messages")  # 보관 파일 디렉터리
+
+PARTITION_NAME = re.compile(r"^chat_messages_p(\d{4})(\d{2})$")  # 월 파티션 이름 형식
+
+
+async def ensure_partitions(months_ahead: int = CHAT_PARTITION_MONTHS_AHEAD) -> int:  # 미래 파티션 생성
+    """
+    이번 달부터 months_ahead개월 뒤까지 파티션이 없으면 생성하고 생성 개수 반환
+    """  # 함수 설명
+    async with engine.begin() as conn:  # 트랜잭션
+        result = await conn.execute(  # DB 함수 호출
+            text("SELECT ensure_chat_messages_partitions(now(), :ahead)"),  # 생성 함수
+            {"ahead": months_ahead},  # 개월 수
+        )
+        return result.scalar_one()  # 생성 개수
+
+
+async def list_month_partitions(conn) -> List[Tuple[str, datetime]]:  # 월 파티션 목록
+    result = await conn.execute(  # 파티션 조회
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'chat_messages'"
+        )
+    )
+    partitions = []  # 결과
+    for (name,) in result.all():  # 이름 순회
+        match = PARTITION_NAME.match(name)  # 월 파티션만(기본 파티션 제외)
+        if match:  # 형식 일치
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)  # 시작 월
+            partitions.append((name, month))  # 추가
+    return sorted(partitions, key=lambda p: p[1])  # 오래된 순
+
+
+def retention_cutoff(retention_months: int = CHAT_RETENTION_MONTHS) -> datetime:  # 보존 기준 월(이전 월은 보관 처리 대상)
+    now = datetime.now(timezone.utc)  # 현재 시각
+    months = now.year * 12 + (now.month - 1) - retention_months  # 기준 월(누적 개월)
+    return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)  # 기준 월 1일
+
+
+async def archive_partitions(  # 오래된 파티션 보관 처리
+    retention_months: int = CHAT_RETENTION_MONTHS,  # 보존 개월 수
+    archive_dir: str = CHAT_ARCHIVE_DIR,  # 보관 디렉터리
+) -> List[str]:
+    """
+    보존 기간 이전 월 파티션을 gzip CSV로 내보낸 뒤 분리/삭제하고 보관 파일 경로 목록 반환
+    - 파일 기록이 끝난 뒤에만 분리/삭제하므로 중간 실패 시 데이터는 남아 있다
+    """  # 함수 설명
+    cutoff = retention_cutoff(retention_months)  # 기준 월
+    os.makedirs(archive_dir, exist_ok=True)  # 디렉터리 준비
+    archived = []  # 결과
+
+    async with engine.connect() as conn:  # 단일 커넥션
+        partitions = await list_month_partitions(conn)  # 파티션 목록
+        await conn.commit()  # 조회 트랜잭션 종료
+
+        for name, month in partitions:  # 오래된 순
+            if month >= cutoff:  # 보존 대상
+                break  # 이후는 모두 보존
+
+            path = os.path.join(archive_dir, f"{name}.csv.gz")  # 보관 파일
+            tmp_path = path + ".tmp"  # 임시 파일
+            raw = await conn.get_raw_connection()  # asyncpg 커넥션
+            with gzip.open(tmp_path, "wb") as f:  # 압축 기록
+                await raw.driver_connection.copy_from_table(  # COPY TO STDOUT
+                    name, output=f, format="csv", header=True  # CSV 헤더 포함
+                )
+            os.replace(tmp_path, path)  # 기록 완료 후 확정
+
+            async with conn.begin():  # 분리/삭제 트랜잭션
+                await conn.execute(text(f'ALTER TABLE chat_messages DETACH PARTITION "{name}"'))  # 분리
+                await conn.execute(text(f'DROP TABLE "{name}"'))  # 삭제
+
+            logger.info("archived %s to %s", name, path)  # 기록
+            archived.append(path)  # 결과 추가
+
+    return archived  # 보관 파일 목록
+
+
+async def maintenance_loop(interval: float = CHAT_PARTITION_CHECK_INTERVAL):  # 주기 파티션 생성
+    """
+    앱 실행 중 주기적으로 미래 파티션을 생성 (실패해도 다음 주기에 재시도)
+    """  # 함수 설명
+    while True:  # 주기 실행
+        try:
+            created = await ensure_partitions()  # 파티션 생성
+            if created:  # 새로 만든 경우
+                logger.info("created %d chat_messages partitions", created)  # 기록
+        except Exception:
+            logger.exception("chat_messages partition maintenance failed")  # 실패 기록
+        await asyncio.sleep(interval)  # 대기
+
+
+async def _run(coro):  # CLI용 실행 래퍼
+    try:
+        return await coro  # 명령 실행
+    finally:
+        await engine.dispose()  # 커넥션 풀 정리
+
+
+def main():  # CLI 진입점
+    parser = argparse.ArgumentParser(description="chat_messages partition maintenance")  # 파서
+    sub = parser.add_subparsers(dest="command", required=True)  # 하위 명령
+
+    ensure_cmd = sub.add_parser("ensure", help="create upcoming monthly partitions")  # ensure 명령
+    ensure_cmd.add_argument("--months-ahead", type=int, default=CHAT_PARTITION_MONTHS_AHEAD)  # 개월 수
+
+    archive_cmd = sub.add_parser("archive", help="export, detach and drop expired partitions")  # archive 명령
+    archive_cmd.add_argument("--retention-months", type=int, default=CHAT_RETENTION_MONTHS)  # 보존 개월 수
+    archive_cmd.add_argument("--archive-dir", default=CHAT_ARCHIVE_DIR)  # 보관 디렉터리
+
+    args = parser.parse_args()  # 인자 파싱
+    logging.basicConfig(level=logging.INFO)  # 콘솔 로깅
+
+    if args.command == "ensure":  # 생성
+        created = asyncio.run(_run(ensure_partitions(args.months_ahead)))  # 실행
+        print(f"created {created} partition(s)")  # 결과 출력
+    else:  # 보관
+        paths = asyncio.run(_run(archive_partitions(args.retention_months, args.archive_dir)))  # 실행
+        print(f"archived {len(paths)} partition(s)")  # 결과 출력
+        for path in paths:  # 파일 목록
+            print(path)  # 경로 출력
+
+
+if __name__ == "__main__":  # 모듈 직접 실행
+    main()  # CLI 실행
@@ -1,72 +1,275 @@
-class RuleBasedChatbot:
-    """Rule-based chatbot - keyword matching"""
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from .intent_classifier import CHATBOT_CLASSIFIER_THRESHOLD, IntentClassifier, training_examples
+
+logger = logging.getLogger(__name__)
+
+CHATBOT_INTENTS_PATH = os.getenv(
+    "CHATBOT_INTENTS_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "chatbot_intents.json"),
+)
+CHATBOT_RELOAD_INTERVAL = float(os.getenv("CHATBOT_RELOAD_INTERVAL", "2"))  # seconds between mtime checks
+
+# Slot-aware questions ("jobs in <region>", "jobs paying over <wage>") are answered from
+# live job data only when the keyword stage found one of these intents, or nothing at all
+SLOT_INTENTS = {"job_search", "wage"}
+WAGE_SLOT_PATTERNS = [
+    re.compile(
+        r"(?:over|above|more than|at least|min(?:imum)?|paying|pays?)\s*(?:₩|krw\s*)?(\d[\d,]*)\s*(k|천|만)?",
+        re.IGNORECASE,
+    ),
+    re.compile(r"((?:\d[\d,]*\s*[만천]?\s*)+)원?\s*이상"),
+]
+WAGE_AMOUNT_PART = re.compile(r"(\d[\d,]*)\s*(k|천|만)?", re.IGNORECASE)
+WAGE_MULTIPLIERS = {"k": 1000, "천": 1000, "만": 10000}
+# A threshold below this (after k/천/만) or followed by a count noun is a count, not a wage ("over 5 jobs")
+WAGE_SLOT_MIN_AMOUNT = 1000
+WAGE_COUNT_NOUN = re.compile(
+    r"\s*(?:jobs?|posts?|postings?|openings?|positions?|places?|people|persons?|개|건|곳|명)(?![a-z])",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    intent: str
+    keyword: str
+    start: int
+    end: int
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation shaped like a prefix trie (no per-keyword backtracking)"""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy optional tail: the longest keyword wins, shorter ones are tried on backtrack
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Whole-word keyword matcher compiled once into a single regex"""
+
+    def __init__(self, intents: Dict[str, Iterable[str]]):
+        self.intent_order = {name: i for i, name in enumerate(intents)}
+        self.keyword_intents: Dict[str, List[str]] = {}
+        for name, keywords in intents.items():
+            for keyword in keywords:
+                keyword = keyword.strip().lower()
+                if keyword:
+                    self.keyword_intents.setdefault(keyword, []).append(name)
 
-    def __init__(self):
+        pattern = _trie_pattern(self.keyword_intents) if self.keyword_intents else "(?!)"
+        # (?<!\w)/(?![^\W가-힣]) instead of \b so keywords like "c++" or "part-time" still work,
+        # and Korean particles may follow a keyword ("서울에서")
+        self.regex = re.compile(r"(?<!\w)" + pattern + r"(?![^\W가-힣])", re.IGNORECASE)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """All keyword hits in text order (one pass over the message)"""
+        matches = []
+        for m in self.regex.finditer(text):
+            keyword = m.group().lower()
+            for intent in self.keyword_intents.get(keyword, ()):
+                matches.append(KeywordMatch(intent, keyword, m.start(), m.end()))
+        return matches
+
+    def best_intent(self, text: str) -> Optional[str]:
+        """
+        Intent with the most distinct keyword hits.
+        Ties go to the earliest hit, then to the intent declared first.
+        """
+        hits: Dict[str, set] = {}
+        first: Dict[str, int] = {}
+        for match in self.find_all(text):
+            hits.setdefault(match.intent, set()).add(match.keyword)
+            first.setdefault(match.intent, match.start)
+        if not hits:
+            return None
+        return min(hits, key=lambda name: (-len(hits[name]), first[name], self.intent_order[name]))
+
+
+@dataclass(frozen=True)
+class ChatbotAnswer:
+    reply: str
+    source: str  # "rule_based" (keyword), "classifier" or "fallback"
+    intent: Optional[str] = None
+    confidence: Optional[float] = None
+    jobs: tuple = ()
+
+
+def extract_min_wage(message: str) -> Optional[int]:
+    """Wage slot: "over 12000", "at least 12k", "1만2천원 이상" style thresholds"""
+    for pattern in WAGE_SLOT_PATTERNS:
+        for m in pattern.finditer(message):
+            if WAGE_COUNT_NOUN.match(message, m.end()):
+                continue
+            # Sum the parts so compound amounts like "1만2천" become 12000
+            amount = sum(
+                int(number.replace(",", "")) * WAGE_MULTIPLIERS.get(unit.lower(), 1)
+                for number, unit in WAGE_AMOUNT_PART.findall(m.group(0))
+            )
+            if amount >= WAGE_SLOT_MIN_AMOUNT:
+                return amount
+    return None
+
+
+class IntentTable:
+    """Immutable snapshot of one intents file: lookup table, compiled matcher and /intents payload"""
+
+    def __init__(self, data: dict, mtime: float):
         self.intents = {
-            "greeting": {
-                "keywords": ["hi", "hello", "hey"],
-                "responses": [
-                    "Hello! How can I help you today?",
-                    "Nice to meet you! What can I assist you with?",
-                ]
-            },
-            "job_search": {
-                "keywords": ["job", "part-time", "work", "hiring", "opening"],
-                "responses": [
-                    "You can search for job postings on the main page. You can filter by location, wage, and more!",
-                    "To view available part-time jobs, please check the job listings.",
-                ]
-            },
-            "apply": {
-                "keywords": ["apply", "application", "how", "method"],
-                "responses": [
-                    "On the job detail page, click the 'Chat Request' button to start a conversation with the company.",
-                    "If you find a job you like, apply by sending a chat request!",
-                ]
-            },
-            "wage": {
-                "keywords": ["wage", "pay", "salary", "money", "rate"],
-                "responses": [
-                    "Each job posting includes wage information. Please check the job details page.",
-                    "Wages vary by job. You can find the details on each job posting page.",
-                ]
-            },
-            "profile": {
-                "keywords": ["profile", "resume", "information", "education"],
-                "responses": [
-                    "You can complete your student profile in the 'My Profile' section. Please include your school, major, and skills.",
-                    "A well-written profile helps companies find you more easily.",
-                ]
-            },
-            "help": {
-                "keywords": ["help", "support", "question", "confused"],
-                "responses": [
-                    "I can help you with job searches, applications, and chats. What would you like to know?",
-                    "From finding a job to applying, I'm here to help. What do you need?",
+            item["name"]: {"title": item.get("title", item["name"]), **item}
+            for item in data["intents"]
+        }
+        self.default_responses = data["default_responses"]
+        self.matcher = KeywordMatcher({name: item["keywords"] for name, item in self.intents.items()})
+        self.classifier = IntentClassifier.train(training_examples(self.intents))
+        self.mtime = mtime
+
+        # Precomputed /api/chatbot/intents body, served as-is until the next reload
+        self.payload = json.dumps(
+            {
+                "intents": [
+                    {"name": item["title"], "examples": item.get("examples") or item["keywords"][:3]}
+                    for item in self.intents.values()
                 ]
             },
-        }
+            ensure_ascii=False,
+        ).encode()
+        self.etag = '"' + hashlib.sha1(self.payload).hexdigest() + '"'
 
-        self.default_responses = [
-            "Sorry, I didn't quite understand that. Could you please rephrase?",
-            "Could you be a bit more specific so I can assist you better?",
-            "You can ask about 'job search', 'how to apply', or 'profile setup'.",
-        ]
 
-    def get_response(self, message: str) -> str:
-        """Generate a response for the given message"""
-        import random
+def load_intent_file(path: str) -> IntentTable:
+    """Read a JSON or YAML intents file"""
+    mtime = os.stat(path).st_mtime
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # optional: only needed for YAML intent files
+
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return IntentTable(data, mtime)
+
+
+class RuleBasedChatbot:
+    """Rule-based chatbot - keyword matching, intents loaded from a file and hot-reloaded"""
 
-        message_lower = message.lower()
+    def __init__(
+            self,
+            path: str = CHATBOT_INTENTS_PATH,
+            reload_interval: float = CHATBOT_RELOAD_INTERVAL,
+            threshold: float = CHATBOT_CLASSIFIER_THRESHOLD,
+    ):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.threshold = threshold
+        self._region_matcher: Optional[KeywordMatcher] = None
+        self._region_version = -1
+        self._checked_at = time.monotonic()
+        self.table = load_intent_file(path)
 
-        # Match message against intent keywords
-        for intent, data in self.intents.items():
-            for keyword in data["keywords"]:
-                if keyword in message_lower:
-                    return random.choice(data["responses"])
+    def reload_if_changed(self) -> bool:
+        """Swap in a new table when the file's mtime changed (checked at most once per interval)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return False
+        self._checked_at = now
 
-        # Fallback response if no keywords match
-        return random.choice(self.default_responses)
+        try:
+            if os.stat(self.path).st_mtime == self.table.mtime:
+                return False
+            table = load_intent_file(self.path)
+        except Exception:
+            # Keep serving the last good table if the file is missing or half-written
+            logger.exception("failed to reload chatbot intents from %s", self.path)
+            return False
+
+        self.table = table
+        logger.info("reloaded %d chatbot intents from %s", len(table.intents), self.path)
+        return True
+
+    def current(self) -> IntentTable:
+        self.reload_if_changed()
+        return self.table
+
+    def _find_region(self, snapshot, message: str) -> Optional[str]:
+        """Longest known region named in the message (matcher recompiled only when regions change)"""
+        if snapshot.version != self._region_version:
+            self._region_matcher = KeywordMatcher({key: [key] for key in snapshot.region_names})
+            self._region_version = snapshot.version
+        matches = self._region_matcher.find_all(message)
+        return max(matches, key=lambda m: (m.end - m.start, -m.start)).intent if matches else None
+
+    def _job_data_answer(self, snapshot, message: str) -> Optional[ChatbotAnswer]:
+        """Counts and top postings for region/wage slots, read from the in-memory snapshot"""
+        region = self._find_region(snapshot, message)
+        min_wage = extract_min_wage(message)
+        if region is None and min_wage is None:
+            return None
+
+        count, top = snapshot.search(region=region, min_wage=min_wage, limit=3)
+        desc = "open job" + ("" if count == 1 else "s")
+        if region is not None:
+            desc += f" in {snapshot.region_names[region]}"
+        if min_wage is not None:
+            desc += f" paying {min_wage:,} won or more"
+
+        if not count:
+            return ChatbotAnswer(f"There are no {desc} right now.", "job_data")
+        listed = "; ".join(
+            f"{p.title} ({p.region}" + (f", {p.wage:,} won" if p.wage is not None else "") + ")" for p in top
+        )
+        verb = "is" if count == 1 else "are"
+        return ChatbotAnswer(f"There {verb} {count} {desc}. Top: {listed}", "job_data", jobs=tuple(top))
+
+    def answer(self, message: str, snapshot=None) -> ChatbotAnswer:
+        """
+        Keyword stage first, then the n-gram classifier, then the fallback.
+        With a ready job snapshot, region/wage questions are answered from live job data.
+        """
+        table = self.current()
+        intent = table.matcher.best_intent(message)
+
+        if snapshot is not None and snapshot.ready and (intent is None or intent in SLOT_INTENTS):
+            data_answer = self._job_data_answer(snapshot, message)
+            if data_answer:
+                return data_answer
+
+        if intent:
+            return ChatbotAnswer(random.choice(table.intents[intent]["responses"]), "rule_based", intent)
+
+        intent, confidence = table.classifier.predict(message)
+        if intent and confidence >= self.threshold:
+            return ChatbotAnswer(
+                random.choice(table.intents[intent]["responses"]), "classifier", intent, round(confidence, 3)
+            )
+
+        # Fallback response if neither stage is confident
+        return ChatbotAnswer(random.choice(table.default_responses), "fallback", None, round(confidence, 3))
+
+    def get_response(self, message: str) -> str:
+        """Generate a response for the given message"""
+        return self.answer(message).reply
 
 
 # Singleton instance
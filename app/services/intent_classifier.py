@@ -0,0 +1,143 @@
+"""
+Character n-gram intent classifier (NumPy nearest-centroid, no external services)
+
+Runs after the keyword matcher: it tolerates typos and paraphrases that exact
+keywords miss. Training is a single pass over the labelled utterances in the
+intents file, so it is redone whenever that file is reloaded.
+
+    python -m app.services.intent_classifier evaluate benchmarks/fixtures/chatbot_intent_eval.json
+"""
+
+import argparse
+import json
+import os
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+CLASSIFIER_DIM = 1 << 14  # hashed n-gram features
+NGRAM_RANGE = (2, 4)
+CHATBOT_CLASSIFIER_THRESHOLD = float(os.getenv("CHATBOT_CLASSIFIER_THRESHOLD", "0.2"))
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def char_ngrams(text: str) -> List[str]:
+    """Character n-grams over normalized text, padded so word edges become features"""
+    padded = " " + " ".join(WORD_PATTERN.findall(text.lower())) + " "
+    low, high = NGRAM_RANGE
+    return [padded[i:i + n] for n in range(low, high + 1) for i in range(len(padded) - n + 1)]
+
+
+def hashed_ngram_counts(text: str, dim: int = CLASSIFIER_DIM) -> Tuple[np.ndarray, np.ndarray]:
+    grams = char_ngrams(text)
+    if not grams:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    hashed = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.int64, count=len(grams)) & (dim - 1)
+    cols, counts = np.unique(hashed, return_counts=True)
+    return cols, counts.astype(np.float32)
+
+
+class IntentClassifier:
+    """TF-IDF over hashed character n-grams, one L2-normalized centroid per intent"""
+
+    def __init__(self, labels: List[str], centroids: np.ndarray, idf: np.ndarray):
+        self.labels = labels
+        self.centroids = centroids  # (n_intents, dim)
+        self.idf = idf
+        self.dim = centroids.shape[1]
+
+    @classmethod
+    def train(cls, examples: Iterable[Tuple[str, str]], dim: int = CLASSIFIER_DIM) -> "IntentClassifier":
+        """examples: (text, intent) pairs"""
+        docs = [(hashed_ngram_counts(text, dim), intent) for text, intent in examples]
+        labels = list(dict.fromkeys(intent for _, intent in docs))
+        index = {label: i for i, label in enumerate(labels)}
+
+        df = np.zeros(dim, dtype=np.float32)
+        for (cols, _), _ in docs:
+            df[cols] += 1
+        idf = (np.log((1.0 + len(docs)) / (1.0 + df)) + 1.0).astype(np.float32)
+
+        centroids = np.zeros((len(labels), dim), dtype=np.float32)
+        for (cols, counts), intent in docs:
+            centroids[index[intent], cols] += _normalize((1.0 + np.log(counts)) * idf[cols])
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroids /= np.where(norms == 0, 1.0, norms)
+        return cls(labels, centroids, idf)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity against every intent centroid"""
+        cols, counts = hashed_ngram_counts(text, self.dim)
+        if len(cols) == 0:
+            return np.zeros(len(self.labels), dtype=np.float32)
+        vals = _normalize((1.0 + np.log(counts)) * self.idf[cols])
+        return self.centroids[:, cols] @ vals
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """Best intent and its cosine score (argmax keeps the first declared intent on ties)"""
+        if not self.labels:
+            return None, 0.0
+        scores = self.scores(text)
+        best = int(np.argmax(scores))
+        return self.labels[best], float(scores[best])
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray:
+    norm = float(np.sqrt(np.dot(vec, vec)))
+    return vec / norm if norm else vec
+
+
+def training_examples(intents: Dict[str, dict]) -> List[Tuple[str, str]]:
+    """Utterances plus keywords of every intent in an intents table"""
+    return [
+        (text, name)
+        for name, item in intents.items()
+        for text in [*item.get("utterances", []), *item["keywords"]]
+    ]
+
+
+def evaluate(classifier: IntentClassifier, cases: List[dict], threshold: float) -> Dict[str, float]:
+    """
+    cases: {"text": ..., "intent": name or null}; null means the query should fall
+    below the threshold and be left to the fallback
+    """
+    correct = 0
+    for case in cases:
+        intent, confidence = classifier.predict(case["text"])
+        predicted = intent if confidence >= threshold else None
+        correct += predicted == case["intent"]
+    return {"cases": len(cases), "accuracy": correct / len(cases) if cases else 0.0}
+
+
+def main():
+    from .chatbot_services import CHATBOT_INTENTS_PATH, load_intent_file
+
+    parser = argparse.ArgumentParser(description="chatbot intent classifier")
+    sub = parser.add_subparsers(dest="command", required=True)
+    eval_cmd = sub.add_parser("evaluate", help="accuracy on a labelled fixture")
+    eval_cmd.add_argument("fixture")
+    eval_cmd.add_argument("--intents", default=CHATBOT_INTENTS_PATH)
+    eval_cmd.add_argument("--threshold", type=float, default=CHATBOT_CLASSIFIER_THRESHOLD)
+    eval_cmd.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    classifier = load_intent_file(args.intents).classifier
+    with open(args.fixture, encoding="utf-8") as f:
+        cases = json.load(f)
+
+    if args.verbose:
+        for case in cases:
+            intent, confidence = classifier.predict(case["text"])
+            predicted = intent if confidence >= args.threshold else None
+            mark = "ok " if predicted == case["intent"] else "ERR"
+            print(f"{mark} {confidence:.3f} {str(predicted):<12} {str(case['intent']):<12} {case['text']}")
+
+    result = evaluate(classifier, cases, args.threshold)
+    print(f"cases={result['cases']} accuracy={result['accuracy']:.3f} threshold={args.threshold}")
+
+
+if __name__ == "__main__":
+    main()
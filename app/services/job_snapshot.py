@@ -0,0 +1,144 @@
+"""
+열린 공고 메모리 스냅샷 (챗봇의 지역/시급 질문용)
+
+- 앱 시작 시 열린 공고를 한 번 읽고, 이후에는 updated_at 기준 변경분만 주기적으로 읽는다
+- 이 프로세스에서 생성/수정한 공고는 커밋 직후 apply_job_post()로 바로 반영
+- 챗봇 메시지 처리 중에는 DB를 조회하지 않는다
+"""
+
+import asyncio  # 주기 갱신
+import bisect  # 시급 정렬 목록
+import heapq  # 상위 N개
+import logging  # 로깅
+import os  # 환경 변수
+from datetime import datetime, timedelta  # 변경분 기준 시각
+from typing import Dict, List, NamedTuple, Optional, Tuple  # 타입 힌트
+
+from sqlalchemy import select  # SQLAlchemy 조회
+
+from ..database import AsyncSessionLocal  # 세션 팩토리
+from ..models import JobPost, JobPostStatus  # 모델
+
+logger = logging.getLogger(__name__)  # 모듈 로거
+
+JOB_SNAPSHOT_REFRESH_INTERVAL = float(os.getenv("JOB_SNAPSHOT_REFRESH_INTERVAL", "30"))  # 변경분 확인 간격(초)
+JOB_SNAPSHOT_OVERLAP = timedelta(seconds=float(os.getenv("JOB_SNAPSHOT_OVERLAP", "5")))  # 늦게 커밋된 변경 대비 겹침 구간
+
+
+class JobSummary(NamedTuple):  # 스냅샷 항목
+    id: int  # 공고 ID
+    title: str  # 제목
+    wage: Optional[int]  # 시급/급여
+    region: str  # 지역
+    status: JobPostStatus  # 상태(항상 OPEN)
+    created_at: datetime  # 생성 시각
+
+
+class JobSnapshot:  # 열린 공고 집계용 메모리 인덱스
+    def __init__(self):  # 생성자
+        self.posts: Dict[int, JobSummary] = {}  # 공고 ID -> 요약
+        self.by_region: Dict[str, Dict[int, JobSummary]] = {}  # 지역(소문자) -> 공고
+        self.region_names: Dict[str, str] = {}  # 지역(소문자) -> 표시 이름
+        self.by_wage: List[Tuple[int, int]] = []  # (시급, 공고 ID) 오름차순
+        self.version = 0  # 지역 목록 변경 버전(챗봇 매처 재컴파일 판단)
+        self.watermark: Optional[datetime] = None  # 마지막으로 읽은 updated_at
+        self.ready = False  # 최초 적재 완료 여부
+
+    def _remove(self, post_id: int):  # 기존 항목 제거
+        old = self.posts.pop(post_id, None)  # 기존 요약
+        if old is None:  # 없으면
+            return  # 종료
+        key = old.region.lower()  # 지역 키
+        bucket = self.by_region.get(key)  # 지역 버킷
+        if bucket is not None:  # 있으면
+            bucket.pop(post_id, None)  # 제거
+            if not bucket:  # 지역에 공고가 없으면
+                del self.by_region[key]  # 버킷 제거
+                self.region_names.pop(key, None)  # 이름 제거
+                self.version += 1  # 지역 목록 변경
+        if old.wage is not None:  # 시급 목록
+            i = bisect.bisect_left(self.by_wage, (old.wage, post_id))  # 위치
+            if i < len(self.by_wage) and self.by_wage[i] == (old.wage, post_id):  # 일치
+                del self.by_wage[i]  # 제거
+
+    def apply(self, summary: JobSummary, is_open: bool):  # 공고 1건 반영
+        """
+        열린 공고면 추가/갱신, 아니면 제거 (여러 번 적용해도 결과 동일)
+        """  # 함수 설명
+        self._remove(summary.id)  # 기존 항목 제거
+        if not is_open:  # 닫힘/삭제
+            return  # 제거만
+        self.posts[summary.id] = summary  # 추가
+        key = summary.region.lower()  # 지역 키
+        if key not in self.by_region:  # 새 지역
+            self.by_region[key] = {}  # 버킷 생성
+            self.region_names[key] = summary.region  # 표시 이름
+            self.version += 1  # 지역 목록 변경
+        self.by_region[key][summary.id] = summary  # 지역 버킷
+        if summary.wage is not None:  # 시급 있으면
+            bisect.insort(self.by_wage, (summary.wage, summary.id))  # 정렬 유지 삽입
+
+    def search(  # 조건별 개수/상위 공고
+        self,
+        region: Optional[str] = None,  # 지역
+        min_wage: Optional[int] = None,  # 최소 시급
+        limit: int = 3,  # 상위 개수
+    ) -> Tuple[int, List[JobSummary]]:
+        """
+        (조건에 맞는 열린 공고 수, 상위 공고) - 시급 조건이 있으면 시급순, 아니면 최신순
+        """  # 함수 설명
+        if region is not None:  # 지역 조건
+            candidates = self.by_region.get(region.lower(), {}).values()  # 지역 버킷
+            if min_wage is not None:  # 시급 조건도
+                candidates = [p for p in candidates if p.wage is not None and p.wage >= min_wage]  # 필터
+                return len(candidates), heapq.nlargest(limit, candidates, key=lambda p: (p.wage, p.id))  # 시급순
+            return len(candidates), heapq.nlargest(limit, candidates, key=lambda p: (p.created_at, p.id))  # 최신순
+
+        if min_wage is not None:  # 시급 조건만
+            i = bisect.bisect_left(self.by_wage, (min_wage, 0))  # 기준 위치
+            top = self.by_wage[max(i, len(self.by_wage) - limit):][::-1]  # 상위(시급 높은 순)
+            return len(self.by_wage) - i, [self.posts[post_id] for _, post_id in top]  # 개수/상위
+
+        return len(self.posts), heapq.nlargest(limit, self.posts.values(), key=lambda p: (p.created_at, p.id))  # 전체
+
+    async def refresh(self) -> int:  # 변경분 반영
+        """
+        updated_at이 기준 시각 이후인 공고만 읽어 반영 (기준 시각이 없으면 열린 공고 전체)
+        """  # 함수 설명
+        stmt = select(  # 필요한 컬럼만
+            JobPost.id, JobPost.title, JobPost.wage, JobPost.region, JobPost.status,
+            JobPost.is_deleted, JobPost.created_at, JobPost.updated_at,
+        )
+        if self.watermark is None:  # 최초 적재
+            stmt = stmt.where(JobPost.status == JobPostStatus.OPEN, JobPost.is_deleted == False)  # noqa: E712
+        else:  # 변경분(닫힘/삭제 포함)
+            stmt = stmt.where(JobPost.updated_at >= self.watermark - JOB_SNAPSHOT_OVERLAP)  # 겹침 구간 포함
+
+        async with AsyncSessionLocal() as db:  # 임시 세션
+            rows = (await db.execute(stmt)).all()  # 조회
+
+        for r in rows:  # 반영
+            is_open = r.status == JobPostStatus.OPEN and not r.is_deleted  # 열린 공고 여부
+            self.apply(JobSummary(r.id, r.title, r.wage, r.region, r.status, r.created_at), is_open)  # 적용
+            if self.watermark is None or r.updated_at > self.watermark:  # 기준 시각 갱신
+                self.watermark = r.updated_at  # 최신 updated_at
+        self.ready = True  # 준비 완료
+        return len(rows)  # 반영 건수
+
+    async def refresh_loop(self, interval: float = JOB_SNAPSHOT_REFRESH_INTERVAL):  # 주기 갱신
+        while True:  # 주기 실행
+            try:
+                await self.refresh()  # 변경분 반영
+            except Exception:
+                logger.exception("job snapshot refresh failed")  # 실패 기록(다음 주기 재시도)
+            await asyncio.sleep(interval)  # 대기
+
+
+def apply_job_post(post: JobPost):  # 커밋 직후 반영
+    is_open = post.status == JobPostStatus.OPEN and not post.is_deleted  # 열린 공고 여부
+    job_snapshot.apply(  # 반영
+        JobSummary(post.id, post.title, post.wage, post.region, post.status, post.created_at), is_open
+    )
+
+
+job_snapshot = JobSnapshot()  # 앱 전역 스냅샷
@@ -0,0 +1,75 @@
+"""
+사용자별 실시간 알림 (지원 생성/수락/거절)
+
+핸들러는 커밋 후 publish()로 큐에 넣기만 하고, 전송은 백그라운드 디스패처가
+/api/ws/notifications 연결로 처리하므로 요청 경로가 느려지지 않는다.
+"""
+
+import asyncio  # 이벤트 큐
+import logging  # 로깅
+import os  # 환경 변수 접근
+from typing import Optional, Tuple  # 타입 힌트
+
+from ..websocket_manager import ConnectionManager  # WS 연결 관리자
+
+logger = logging.getLogger(__name__)  # 모듈 로거
+
+NOTIFICATION_QUEUE_SIZE = int(os.getenv("NOTIFICATION_QUEUE_SIZE", "10000"))  # 대기 이벤트 최대 수
+
+notification_manager = ConnectionManager()  # 알림 채널 연결 관리자(room_id = user_id)
+
+
+class NotificationBus:  # 프로세스 내 비동기 알림 큐
+    def __init__(self, manager: ConnectionManager, maxsize: int = NOTIFICATION_QUEUE_SIZE):  # 생성자
+        self.manager = manager  # 전송 대상 연결 관리자
+        self.queue: asyncio.Queue[Tuple[int, dict]] = asyncio.Queue(maxsize=maxsize)  # (user_id, 이벤트)
+        self.published = 0  # 발행 수
+        self.dropped = 0  # 큐 초과로 버린 수
+        self._task: Optional[asyncio.Task] = None  # 디스패처 태스크
+
+    def publish(self, user_id: int, event: dict):  # 이벤트 발행
+        """
+        대기 없이 큐에 넣음 (접속하지 않은 사용자는 건너뜀, 큐가 가득 차면 버림)
+        """  # 함수 설명
+        if not self.manager.is_user_online(user_id):  # 받을 연결 없음
+            return  # 무시
+        try:
+            self.queue.put_nowait((user_id, event))  # 큐 적재
+            self.published += 1  # 통계
+        except asyncio.QueueFull:  # 큐 초과
+            self.dropped += 1  # 통계
+
+    async def _dispatch(self):  # 디스패처 루프
+        while True:  # 계속 처리
+            user_id, event = await self.queue.get()  # 이벤트 대기
+            try:
+                await self.manager.send_to_user(user_id, event)  # 사용자 연결로 전송
+            except Exception:
+                logger.exception("notification dispatch failed")  # 실패 기록
+            finally:
+                self.queue.task_done()  # 처리 완료
+
+    def start(self):  # 디스패처 시작
+        if self._task is None:  # 중복 시작 방지
+            self._task = asyncio.create_task(self._dispatch())  # 태스크 생성
+
+    async def stop(self):  # 디스패처 종료
+        if self._task is not None:  # 실행 중이면
+            self._task.cancel()  # 취소
+            try:
+                await self._task  # 종료 대기
+            except asyncio.CancelledError:
+                pass  # 정상 취소
+            self._task = None  # 초기화
+
+
+notification_bus = NotificationBus(notification_manager)  # 앱 전역 알림 큐
+
+
+def application_event(event_type: str, application_id: int, job_post_id: int, status: str) -> dict:  # 지원 이벤트
+    return {
+        "type": event_type,  # 이벤트 종류
+        "application_id": application_id,  # 지원 ID
+        "job_post_id": job_post_id,  # 공고 ID
+        "status": status,  # 지원 상태
+    }
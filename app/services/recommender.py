@@ -0,0 +1,301 @@
+"""
+학생 프로필 기반 공고 추천 (메모리 내 NumPy 희소 TF-IDF)
+
+- 공고 제목/설명을 해싱 트릭으로 고정 차원 희소 벡터(COO 배열)로 저장
+- IDF는 질의 쪽에서 곱하므로 공고 추가/수정 시 다른 행을 다시 계산할 필요가 없다
+- 점수 계산은 전체 행렬-벡터 곱 한 번 (np.bincount)
+- 지원자 순위: 학생 프로필 벡터를 캐시해 두고 공고 벡터와 한 번에 점수 계산
+"""
+
+import asyncio  # 빌드 잠금
+import logging  # 로깅
+import os  # 환경 변수
+import re  # 토큰화
+import zlib  # 안정적인 해시
+from collections import OrderedDict  # LRU 캐시
+from typing import Dict, Iterable, List, Optional, Tuple  # 타입 힌트
+
+import numpy as np  # 벡터 연산
+from sqlalchemy import select  # SQLAlchemy 조회
+
+from ..database import AsyncSessionLocal  # 세션 팩토리
+from ..models import JobPost, JobPostStatus  # 모델
+
+logger = logging.getLogger(__name__)  # 모듈 로거
+
+HASH_DIM = 1 << 18  # 해시 차원 수
+PROFILE_VECTOR_CACHE_SIZE = int(os.getenv("PROFILE_VECTOR_CACHE_SIZE", "50000"))  # 캐시할 프로필 벡터 수
+TOKEN_PATTERN = re.compile(r"\w+")  # 단어 토큰(한글 포함)
+EMPTY_VECTOR = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32))  # 빈 희소 벡터(프로필 없음 등, 0점)
+
+
+def tokenize(text: str) -> List[str]:  # 토큰화
+    return TOKEN_PATTERN.findall(text.lower())  # 소문자 단어 목록
+
+
+def hashed_term_counts(text: str, dim: int = HASH_DIM) -> Tuple[np.ndarray, np.ndarray]:  # 해시 열/빈도
+    """
+    텍스트를 (해시 열 인덱스, 빈도) 배열로 변환
+    """  # 함수 설명
+    tokens = tokenize(text)  # 토큰
+    if not tokens:  # 비어 있으면
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)  # 빈 배열
+    hashed = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.int64, count=len(tokens)) % dim  # 해시
+    cols, counts = np.unique(hashed, return_counts=True)  # 열별 빈도
+    return cols.astype(np.int32), counts.astype(np.float32)  # 반환
+
+
+def tf_vector(text: str, dim: int = HASH_DIM) -> Tuple[np.ndarray, np.ndarray]:  # 정규화 TF 희소 벡터
+    """
+    텍스트를 (해시 열 인덱스, L2 정규화 로그 TF) 배열로 변환
+    """  # 함수 설명
+    cols, counts = hashed_term_counts(text, dim)  # 열/빈도
+    weights = 1.0 + np.log(counts)  # 로그 TF
+    norm = float(np.sqrt(np.dot(weights, weights))) or 1.0  # L2 노름
+    return cols, weights / norm  # 반환
+
+
+def score_vectors(  # 일괄 점수
+    q: np.ndarray, vectors: List[Optional[Tuple[np.ndarray, np.ndarray]]]
+) -> np.ndarray:
+    """
+    희소 벡터 목록을 COO로 이어 붙여 밀집 질의 벡터와 한 번에 내적 (None은 빈 벡터, 0점)
+    """  # 함수 설명
+    if not vectors:  # 대상 없음
+        return np.zeros(0, dtype=np.float64)  # 빈 결과
+    vectors = [EMPTY_VECTOR if v is None else v for v in vectors]  # 벡터 없는 항목
+    lengths = np.fromiter((len(cols) for cols, _ in vectors), dtype=np.int64, count=len(vectors))  # 벡터별 항목 수
+    rows = np.repeat(np.arange(len(vectors)), lengths)  # 항목별 행 번호
+    cols = np.concatenate([cols for cols, _ in vectors])  # 열
+    vals = np.concatenate([vals for _, vals in vectors])  # 값
+    return np.bincount(rows, weights=vals * q[cols], minlength=len(vectors))  # 행렬-벡터 곱
+
+
+class JobPostIndex:  # 공고 희소 행렬 인덱스
+    def __init__(self, dim: int = HASH_DIM, capacity: int = 1 << 16):  # 생성자
+        self.dim = dim  # 해시 차원
+        self.rows = np.empty(capacity, dtype=np.int32)  # 항목별 행 번호
+        self.cols = np.empty(capacity, dtype=np.int32)  # 항목별 열(해시)
+        self.vals = np.empty(capacity, dtype=np.float32)  # 항목별 정규화 TF
+        self.nnz = 0  # 사용 중 항목 수
+        self.dead_nnz = 0  # 수정으로 무효화된 항목 수
+
+        self.df = np.zeros(dim, dtype=np.int32)  # 열별 문서 빈도(열린 공고 기준)
+        self.post_ids: List[int] = []  # 행 -> 공고 ID
+        self.row_of: Dict[int, int] = {}  # 공고 ID -> 행
+        self.row_span: List[Tuple[int, int]] = []  # 행 -> (시작, 끝) 항목 위치
+        self.alive = np.zeros(0, dtype=bool)  # 행별 추천 대상 여부(열린 공고)
+        self.n_alive = 0  # 추천 대상 공고 수
+
+        self.ready = False  # 초기 빌드 완료 여부
+        self._building = False  # 빌드 중 여부
+        self._pending: Dict[int, Tuple[str, bool]] = {}  # 빌드 중 들어온 변경
+        self._lock = asyncio.Lock()  # 빌드 잠금
+
+    def _reserve(self, extra: int):  # 항목 배열 확장
+        needed = self.nnz + extra  # 필요한 크기
+        if needed <= len(self.rows):  # 충분하면
+            return  # 종료
+        size = max(needed, len(self.rows) * 2)  # 두 배 확장
+        for name in ("rows", "cols", "vals"):  # 세 배열
+            old = getattr(self, name)  # 기존 배열
+            new = np.empty(size, dtype=old.dtype)  # 새 배열
+            new[: self.nnz] = old[: self.nnz]  # 복사
+            setattr(self, name, new)  # 교체
+
+    def _remove_row(self, row: int):  # 기존 행 무효화
+        start, end = self.row_span[row]  # 항목 위치
+        if self.alive[row]:  # 열린 공고였으면
+            self.df[self.cols[start:end]] -= 1  # 문서 빈도 감소
+            self.alive[row] = False  # 추천 대상 제외
+            self.n_alive -= 1  # 통계
+        self.vals[start:end] = 0.0  # 점수 기여 제거
+        self.dead_nnz += end - start  # 무효 항목 누적
+
+    def upsert(self, post_id: int, text: str, is_open: bool):  # 공고 추가/수정
+        """
+        공고 1건을 행렬에 반영 (기존 행은 무효화 후 새 항목을 뒤에 추가)
+        """  # 함수 설명
+        if self._building:  # 빌드 중이면
+            self._pending[post_id] = (text, is_open)  # 빌드 후 반영
+            return  # 종료
+
+        row = self.row_of.get(post_id)  # 기존 행
+        if row is None:  # 새 공고
+            row = len(self.post_ids)  # 새 행 번호
+            self.post_ids.append(post_id)  # 행 -> 공고
+            self.row_of[post_id] = row  # 공고 -> 행
+            self.row_span.append((self.nnz, self.nnz))  # 빈 위치
+            if row >= len(self.alive):  # 행 플래그 확장
+                grown = np.zeros(max(16, len(self.alive) * 2), dtype=bool)  # 두 배
+                grown[: len(self.alive)] = self.alive  # 복사
+                self.alive = grown  # 교체
+        else:  # 기존 공고
+            self._remove_row(row)  # 기존 항목 무효화
+
+        cols, weights = tf_vector(text, self.dim)  # 열/정규화 TF
+        self._reserve(len(cols))  # 공간 확보
+        start, end = self.nnz, self.nnz + len(cols)  # 항목 위치
+        self.rows[start:end] = row  # 행 번호
+        self.cols[start:end] = cols  # 열
+        self.vals[start:end] = weights  # 정규화 TF
+        self.nnz = end  # 사용량 갱신
+        self.row_span[row] = (start, end)  # 위치 기록
+
+        if is_open:  # 추천 대상이면
+            self.df[cols] += 1  # 문서 빈도 증가
+            self.alive[row] = True  # 대상 표시
+            self.n_alive += 1  # 통계
+
+        if self.dead_nnz > self.nnz // 2 and self.nnz > 1 << 16:  # 무효 항목이 절반 초과
+            self._compact()  # 압축
+
+    def _compact(self):  # 무효 항목 제거
+        """
+        행 순서대로 현재 항목만 모아 앞으로 당김
+        - 수정된 공고의 항목은 배열 뒤쪽에 있으므로 배열 위치 순서가 아니라 row_span 순서로 모아야
+          새 위치와 실제 항목이 일치한다
+        """  # 함수 설명
+        spans = []  # 새 위치
+        cursor = 0  # 새 위치 누적
+        for start, end in self.row_span:  # 행별 현재 항목
+            spans.append((cursor, cursor + end - start))  # 새 위치
+            cursor += end - start  # 누적
+        order = (  # 행 순서의 현재 항목 위치
+            np.concatenate([np.arange(start, end) for start, end in self.row_span])
+            if self.row_span else np.zeros(0, dtype=np.int64)
+        )
+        for name in ("rows", "cols", "vals"):  # 세 배열
+            arr = getattr(self, name)  # 배열
+            arr[:cursor] = arr[order]  # 팬시 인덱싱은 복사본이므로 제자리 덮어쓰기 안전
+        self.nnz = cursor  # 사용량
+        self.row_span = spans  # 위치 갱신
+        self.dead_nnz = 0  # 초기화
+
+    def query_vector(self, text: str) -> Optional[np.ndarray]:  # 질의 벡터
+        """
+        질의 텍스트를 IDF^2 가중 밀집 벡터로 변환 (문서 쪽은 TF만 저장하므로)
+        """  # 함수 설명
+        cols, counts = hashed_term_counts(text, self.dim)  # 열/빈도
+        if len(cols) == 0:  # 토큰 없음
+            return None  # 판단 불가
+        idf = np.log((1.0 + self.n_alive) / (1.0 + self.df[cols])) + 1.0  # 평활 IDF
+        q = np.zeros(self.dim, dtype=np.float32)  # 밀집 질의 벡터
+        q[cols] = (1.0 + np.log(counts)) * idf * idf  # 질의 TF x IDF^2
+        return q  # 반환
+
+    def top_k(self, text: str, k: int = 20) -> List[Tuple[int, float]]:  # 상위 k개
+        """
+        열린 공고 중 질의와 점수가 높은 k개를 (공고 ID, 점수)로 반환
+        """  # 함수 설명
+        q = self.query_vector(text)  # 질의 벡터
+        n_rows = len(self.post_ids)  # 행 수
+        if q is None or n_rows == 0:  # 질의/공고 없음
+            return []  # 빈 결과
+
+        nnz = self.nnz  # 사용 중 항목
+        scores = np.bincount(  # 희소 행렬 x 질의 벡터
+            self.rows[:nnz],  # 행 번호
+            weights=self.vals[:nnz] * q[self.cols[:nnz]],  # 항목별 기여
+            minlength=n_rows,  # 모든 행
+        )
+        scores[~self.alive[:n_rows]] = 0.0  # 닫힌 공고 제외
+
+        k = min(k, n_rows)  # 상한
+        top = np.argpartition(-scores, k - 1)[:k]  # 상위 k 후보
+        top = top[np.argsort(-scores[top], kind="stable")]  # 점수순 정렬
+        return [(self.post_ids[r], float(scores[r])) for r in top if scores[r] > 0]  # 양수만
+
+    def load(self, posts: Iterable[Tuple[int, str, bool]]):  # 주어진 공고로 빌드(벤치마크용)
+        for post_id, text, is_open in posts:  # 공고 순회
+            self.upsert(post_id, text, is_open)  # 반영
+        self.ready = True  # 완료
+
+    async def ensure_built(self):  # DB에서 최초 빌드
+        """
+        열린 공고 전체로 행렬을 한 번 빌드 (동시 호출은 잠금으로 한 번만)
+        """  # 함수 설명
+        if self.ready:  # 이미 빌드됨
+            return  # 종료
+        async with self._lock:  # 중복 빌드 방지
+            if self.ready:  # 대기 중 완료됨
+                return  # 종료
+            self._building = True  # 변경은 보류
+            try:
+                async with AsyncSessionLocal() as db:  # 임시 세션
+                    result = await db.stream(  # 스트리밍 조회
+                        select(JobPost.id, JobPost.title, JobPost.description)  # 필요한 컬럼만
+                        .where(JobPost.status == JobPostStatus.OPEN, JobPost.is_deleted == False)  # 열린 공고  # noqa: E712
+                    )
+                    posts = [(row.id, post_text(row.title, row.description)) async for row in result]  # 공고 텍스트
+            finally:
+                self._building = False  # 보류 해제
+
+            for post_id, text in posts:  # DB 스냅샷 반영
+                if post_id not in self._pending:  # 더 최신 변경이 없을 때만
+                    self.upsert(post_id, text, True)  # 반영
+            pending, self._pending = self._pending, {}  # 보류분
+            for post_id, (text, is_open) in pending.items():  # 빌드 중 변경
+                self.upsert(post_id, text, is_open)  # 반영
+
+            self.ready = True  # 완료
+            logger.info("job recommendation index built: %d posts", self.n_alive)  # 기록
+
+
+def post_text(title: str, description: str) -> str:  # 공고 색인 텍스트
+    return f"{title} {title} {description}"  # 제목 가중(두 번)
+
+
+def profile_text(skills: Iterable[str], major: Optional[str], available_time: Optional[str]) -> str:  # 프로필 질의 텍스트
+    return " ".join([*(skills or []), major or "", available_time or ""])  # 기술/전공/가능 시간
+
+
+def index_job_post(post: JobPost):  # 공고 변경 반영
+    """
+    생성/수정 커밋 후 호출: 열린 공고면 추천 대상, 아니면 제외
+    """  # 함수 설명
+    is_open = post.status == JobPostStatus.OPEN and not post.is_deleted  # 추천 대상 여부
+    job_index.upsert(post.id, post_text(post.title, post.description), is_open)  # 반영
+
+
+class ProfileVectorCache:  # 학생 프로필 벡터 LRU 캐시
+    """
+    학생 ID -> 정규화 TF 희소 벡터 (프로필 수정 시 invalidate, 프로세스 로컬)
+    """  # 클래스 설명
+
+    def __init__(self, max_size: int = PROFILE_VECTOR_CACHE_SIZE):  # 생성자
+        self.max_size = max_size  # 최대 항목 수
+        self._vectors: "OrderedDict[int, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()  # 캐시
+        self.hits = 0  # 적중 수
+        self.misses = 0  # 미적중 수
+
+    def get(self, user_id: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:  # 조회
+        vector = self._vectors.get(user_id)  # 캐시 조회
+        if vector is None:  # 없음
+            self.misses += 1  # 통계
+            return None  # 미적중
+        self._vectors.move_to_end(user_id)  # 최근 사용 표시
+        self.hits += 1  # 통계
+        return vector  # 적중
+
+    def put(self, user_id: int, text: str) -> Tuple[np.ndarray, np.ndarray]:  # 계산 후 저장
+        vector = tf_vector(text)  # 벡터 계산
+        self._vectors[user_id] = vector  # 저장
+        self._vectors.move_to_end(user_id)  # 최근 사용 표시
+        while len(self._vectors) > self.max_size:  # 상한 초과
+            self._vectors.popitem(last=False)  # 가장 오래된 항목 제거
+        return vector  # 반환
+
+    def invalidate(self, user_id: int):  # 프로필 변경 시 제거
+        self._vectors.pop(user_id, None)  # 제거
+
+
+async def build_in_background():  # 앱 시작 시 빌드
+    try:
+        await job_index.ensure_built()  # 빌드
+    except Exception:
+        logger.exception("job recommendation index build failed")  # 실패 기록(첫 요청 시 재시도)
+
+
+job_index = JobPostIndex()  # 앱 전역 추천 인덱스
+profile_vectors = ProfileVectorCache()  # 앱 전역 프로필 벡터 캐시
@@ -0,0 +1,108 @@
+"""
+요청 단위 SQL 계측
+
+- 엔진 이벤트(before/after_cursor_execute)가 실행된 문장을 현재 요청(contextvar)에 귀속
+- 요청별 쿼리 수/DB 시간을 Server-Timing 헤더로 반환
+- 임계값을 넘는 느린 쿼리는 경고 로그
+- SQL_DEBUG=1이면 같은 문장이 요청 안에서 반복되는 경우(N+1)를 경고 로그
+"""
+
+import logging  # 로깅
+import os  # 환경 변수 접근
+import time  # 시간 측정
+from collections import Counter  # 문장별 실행 횟수
+from contextvars import ContextVar  # 요청 컨텍스트
+from typing import Optional  # 타입 힌트
+
+from sqlalchemy import event  # 엔진 이벤트
+from sqlalchemy.ext.asyncio import AsyncEngine  # 비동기 엔진
+
+logger = logging.getLogger(__name__)  # 모듈 로거
+
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))  # 느린 쿼리 기준(ms)
+SQL_DEBUG = os.getenv("SQL_DEBUG", "0") == "1"  # N+1 감지 모드
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))  # 같은 문장 반복 경고 기준
+
+
+class RequestSqlStats:  # 요청 하나의 SQL 통계
+    __slots__ = ("path", "count", "seconds", "statements")  # 요청마다 생성되므로 가볍게
+
+    def __init__(self, path: str, track_statements: bool):  # 생성자
+        self.path = path  # 요청 경로(로그용)
+        self.count = 0  # 실행 문장 수
+        self.seconds = 0.0  # DB 시간 합계
+        self.statements: Optional[Counter] = Counter() if track_statements else None  # 문장별 횟수(디버그)
+
+
+current_sql_stats: ContextVar[Optional[RequestSqlStats]] = ContextVar("current_sql_stats", default=None)  # 현재 요청 통계
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # 실행 직전
+    context._sql_metrics_start = time.perf_counter()  # 시작 시각(문장별 컨텍스트라 실패해도 커넥션에 남지 않음)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # 실행 직후
+    elapsed = time.perf_counter() - context._sql_metrics_start  # 실행 시간
+    stats = current_sql_stats.get()  # 현재 요청(greenlet이 컨텍스트를 이어받음)
+    if stats is not None:  # 요청 안에서 실행된 문장
+        stats.count += 1  # 문장 수
+        stats.seconds += elapsed  # DB 시간
+        if stats.statements is not None:  # 디버그 모드
+            stats.statements[statement] += 1  # 문장별 횟수(파라미터 제외한 SQL 기준)
+
+    if elapsed * 1000 >= SQL_SLOW_QUERY_MS:  # 느린 쿼리
+        logger.warning(  # 경고 로그
+            "slow query %.1fms path=%s: %s",
+            elapsed * 1000,
+            stats.path if stats is not None else "-",
+            " ".join(statement.split())[:1000],  # 공백 정리 + 길이 제한
+        )
+
+
+def instrument_engine(engine: AsyncEngine):  # 엔진에 계측 훅 등록
+    sync_engine = engine.sync_engine  # 이벤트는 동기 엔진에 등록
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):  # 중복 등록 방지
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)  # 실행 직전
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)  # 실행 직후
+
+
+def server_timing(stats: RequestSqlStats) -> bytes:  # Server-Timing 헤더 값
+    return f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"'.encode()  # 예: db;dur=3.2;desc="4 queries"
+
+
+def report_repeats(stats: RequestSqlStats):  # N+1 의심 문장 로그
+    for statement, count in stats.statements.most_common():  # 많이 반복된 순
+        if count < SQL_N_PLUS_ONE_THRESHOLD:  # 기준 미만
+            break  # 이후도 모두 미만
+        logger.warning(  # 경고 로그
+            "possible N+1: %d identical statements path=%s: %s",
+            count,
+            stats.path,
+            " ".join(statement.split())[:1000],  # 공백 정리 + 길이 제한
+        )
+
+
+class SqlTimingMiddleware:  # 요청별 SQL 통계 ASGI 미들웨어
+    def __init__(self, app, debug: bool = SQL_DEBUG):  # 생성자
+        self.app = app  # 다음 ASGI 앱
+        self.debug = debug  # N+1 감지 여부
+
+    async def __call__(self, scope, receive, send):  # ASGI 진입점
+        if scope["type"] != "http":  # WebSocket/lifespan은 통과
+            await self.app(scope, receive, send)  # 그대로 실행
+            return  # 종료
+
+        stats = RequestSqlStats(scope["path"], self.debug)  # 요청 통계
+        token = current_sql_stats.set(stats)  # 컨텍스트 등록
+
+        async def send_wrapper(message):  # 응답 헤더에 통계 추가
+            if message["type"] == "http.response.start":  # 응답 시작(이후 쿼리는 헤더에 반영 불가)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", server_timing(stats))]  # 헤더 추가
+            await send(message)  # 원래 전송
+
+        try:
+            await self.app(scope, receive, send_wrapper)  # 요청 처리
+        finally:
+            current_sql_stats.reset(token)  # 컨텍스트 해제
+            if stats.statements:  # 디버그 모드에서 실행된 문장이 있으면
+                report_repeats(stats)  # N+1 의심 로그
@@ -1,35 +1,208 @@
-from typing import Dict, List  # 타입 힌트
+import asyncio  # 하트비트 태스크
+import os  # 환경 변수 접근
+import sys  # 메모리 크기 추정
+import time  # 단조 시간
+from collections import OrderedDict, deque  # LRU/링 버퍼
+from typing import Deque, Dict, Iterable, List, Optional, Set  # 타입 힌트
 from fastapi import WebSocket  # WebSocket 타입
 
+from .rate_limit import TokenBucket  # 토큰 버킷
+
+WS_HEARTBEAT_INTERVAL = float(os.getenv("WS_HEARTBEAT_INTERVAL", "30"))  # ping 주기(초)
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "90"))  # 무응답 허용 시간(초)
+WS_MAX_CONNECTIONS_PER_USER = int(os.getenv("WS_MAX_CONNECTIONS_PER_USER", "5"))  # 사용자당 최대 연결 수
+WS_RESUME_BUFFER_SIZE = int(os.getenv("WS_RESUME_BUFFER_SIZE", "200"))  # 방별 재전송 버퍼 크기
+WS_RESUME_MAX_ROOMS = int(os.getenv("WS_RESUME_MAX_ROOMS", "10000"))  # 재전송 버퍼를 유지할 최대 방 수(LRU)
+WS_CONNECTION_RATE = float(os.getenv("WS_CONNECTION_RATE", "5"))  # 연결당 초당 메시지 수
+WS_CONNECTION_BURST = float(os.getenv("WS_CONNECTION_BURST", "10"))  # 연결당 순간 허용량
+WS_USER_RATE = float(os.getenv("WS_USER_RATE", "10"))  # 사용자당 초당 메시지 수(모든 연결 합산)
+WS_USER_BURST = float(os.getenv("WS_USER_BURST", "20"))  # 사용자당 순간 허용량
+WS_USER_BUCKET_MAX = int(os.getenv("WS_USER_BUCKET_MAX", "100000"))  # 보관할 사용자 버킷 최대 수(LRU)
+
+
+class ConnectionInfo:  # 연결 메타데이터
+    __slots__ = ("room_id", "user_id", "connected_at", "last_seen", "bucket")  # 연결당 메모리 최소화
+
+    def __init__(self, room_id: int, user_id: Optional[int], bucket: TokenBucket):  # 생성자
+        now = time.monotonic()  # 현재 시각
+        self.bucket = bucket  # 연결당 메시지 버킷
+        self.room_id = room_id  # 채팅방 ID
+        self.user_id = user_id  # 사용자 ID
+        self.connected_at = now  # 연결 시각
+        self.last_seen = now  # 마지막 수신 시각
+
+
+class RoomHistory:  # 방별 최근 메시지 링 버퍼
+    __slots__ = ("messages", "seeded", "complete")  # 방당 메모리 최소화
+
+    def __init__(self, maxlen: int):  # 생성자
+        self.messages: Deque[dict] = deque(maxlen=maxlen)  # 최근 메시지(id 오름차순)
+        self.seeded = False  # DB에서 초기 적재 완료 여부
+        self.complete = False  # 방 전체 이력을 담고 있는지 여부
+
+    def append(self, message: dict):  # 메시지 추가
+        if len(self.messages) == self.messages.maxlen:  # 가장 오래된 메시지가 밀려남
+            self.complete = False  # 더 이상 전체 이력 아님
+        self.messages.append(message)  # 추가
+
+    def seed(self, messages: Iterable[dict], complete: bool):  # DB 결과로 초기 적재
+        merged = {m["id"]: m for m in messages}  # DB 결과
+        merged.update((m["id"], m) for m in self.messages)  # 적재 전 도착한 메시지 병합
+        ordered = sorted(merged.values(), key=lambda m: m["id"])  # id 오름차순
+        self.messages = deque(ordered, maxlen=self.messages.maxlen)  # 버퍼 교체
+        self.complete = complete and len(ordered) <= self.messages.maxlen  # 전체 이력 여부
+        self.seeded = True  # 적재 완료
+
+    def since(self, last_seen_id: int) -> Optional[List[dict]]:  # 놓친 메시지
+        if not self.seeded:  # 적재 전이면
+            return None  # 판단 불가
+        if not self.complete and (not self.messages or last_seen_id < self.messages[0]["id"]):  # 버퍼 밖 공백
+            return None  # DB 필요
+        missed = []  # 결과
+        for m in reversed(self.messages):  # 최신부터 역순
+            if m["id"] <= last_seen_id:  # 이미 본 메시지
+                break  # 중단
+            missed.append(m)  # 추가
+        missed.reverse()  # 오름차순 복원
+        return missed  # 반환
+
 
 class ConnectionManager:  # WS 연결 관리 클래스
-    def __init__(self):  # 생성자
-        self.active_connections: Dict[int, List[WebSocket]] = {}  # room_id -> 소켓 목록
+    def __init__(  # 생성자
+        self,
+        heartbeat_interval: float = WS_HEARTBEAT_INTERVAL,  # ping 주기
+        idle_timeout: float = WS_IDLE_TIMEOUT,  # 무응답 허용 시간
+        max_connections_per_user: int = WS_MAX_CONNECTIONS_PER_USER,  # 사용자당 최대 연결 수
+        resume_buffer_size: int = WS_RESUME_BUFFER_SIZE,  # 방별 재전송 버퍼 크기
+        resume_max_rooms: int = WS_RESUME_MAX_ROOMS,  # 재전송 버퍼 최대 방 수
+        user_bucket_max: int = WS_USER_BUCKET_MAX,  # 사용자 버킷 최대 수
+    ):
+        self.active_connections: Dict[int, Set[WebSocket]] = {}  # room_id -> 소켓 집합
+        self.user_connections: Dict[int, Set[WebSocket]] = {}  # user_id -> 소켓 집합
+        self.connection_info: Dict[WebSocket, ConnectionInfo] = {}  # 소켓 -> 메타데이터
+        self.room_history: "OrderedDict[int, RoomHistory]" = OrderedDict()  # room_id -> 최근 메시지 버퍼(최근 사용 순)
+        self.user_buckets: "OrderedDict[int, TokenBucket]" = OrderedDict()  # user_id -> 사용자 메시지 버킷(연결 해제 후에도 유지)
+
+        self.heartbeat_interval = heartbeat_interval  # ping 주기
+        self.idle_timeout = idle_timeout  # 무응답 허용 시간
+        self.max_connections_per_user = max_connections_per_user  # 사용자당 최대 연결 수
+        self.resume_buffer_size = resume_buffer_size  # 방별 재전송 버퍼 크기
+        self.resume_max_rooms = resume_max_rooms  # 재전송 버퍼 최대 방 수
+        self.user_bucket_max = user_bucket_max  # 사용자 버킷 최대 수
 
-    async def connect(self, room_id: int, websocket: WebSocket):  # 연결 추가
+        self.evicted_idle = 0  # 무응답 정리 횟수
+        self.evicted_over_cap = 0  # 연결 수 초과 정리 횟수
+        self.evicted_history = 0  # 방 수 상한으로 제거한 재전송 버퍼 수
+        self.rate_limited = 0  # 속도 제한으로 거부된 메시지 수
+        self.messages_received = 0  # 수신 메시지 수(속도 제한 검사 대상)
+        self.frames_sent = 0  # 전송 성공 프레임 수(ping 포함)
+        self._heartbeat_task: Optional[asyncio.Task] = None  # 하트비트 태스크
+
+    async def connect(self, room_id: int, websocket: WebSocket, user_id: Optional[int] = None):  # 연결 추가
         """
         채팅방에 WebSocket 연결 추가
+        - 사용자 연결 수가 상한에 도달하면 가장 오래된 연결을 끊는다
         """  # 함수 설명
+        if user_id is not None:  # 사용자 식별 가능하면
+            user_sockets = self.user_connections.get(user_id, set())  # 사용자 연결들
+            while len(user_sockets) >= self.max_connections_per_user:  # 상한 도달
+                oldest = min(user_sockets, key=lambda ws: self.connection_info[ws].connected_at)  # 가장 오래된 연결
+                self.evicted_over_cap += 1  # 통계
+                await self._evict(oldest, code=1008)  # 정책 위반 종료
 
-        if room_id not in self.active_connections:  # 방이 없으면
-            self.active_connections[room_id] = []  # 목록 생성
-
-        self.active_connections[room_id].append(websocket)  # 소켓 추가
+        self.active_connections.setdefault(room_id, set()).add(websocket)  # 방 집합에 추가
+        if user_id is not None:  # 사용자 인덱스
+            self.user_connections.setdefault(user_id, set()).add(websocket)  # 사용자 집합에 추가
+        self.connection_info[websocket] = ConnectionInfo(  # 메타데이터 등록
+            room_id, user_id, TokenBucket(WS_CONNECTION_RATE, WS_CONNECTION_BURST)  # 연결당 버킷
+        )
 
     def disconnect(self, room_id: int, websocket: WebSocket):  # 연결 제거
         """
-        채팅방에서 WebSocket 연결 제거
+        채팅방에서 WebSocket 연결 제거 (O(1))
         """  # 함수 설명
-        if room_id not in self.active_connections:  # 방이 없으면
-            return  # 종료
+        info = self.connection_info.pop(websocket, None)  # 메타데이터 제거
+
+        connections = self.active_connections.get(room_id)  # 현재 방의 소켓들
+        if connections is not None:  # 방이 있으면
+            connections.discard(websocket)  # 집합에서 제거
+            if not connections:  # 방이 비었으면
+                del self.active_connections[room_id]  # 방 자체 제거
+
+        if info is not None and info.user_id is not None:  # 사용자 인덱스 정리
+            user_sockets = self.user_connections.get(info.user_id)  # 사용자 연결들
+            if user_sockets is not None:  # 있으면
+                user_sockets.discard(websocket)  # 집합에서 제거
+                if not user_sockets:  # 비었으면
+                    del self.user_connections[info.user_id]  # 사용자 제거(버킷은 재접속 대비 유지)
+
+    def touch(self, websocket: WebSocket):  # 수신 시각 갱신
+        """
+        클라이언트로부터 프레임(메시지/pong)을 받았음을 기록
+        """  # 함수 설명
+        info = self.connection_info.get(websocket)  # 메타데이터
+        if info is not None:  # 등록된 연결이면
+            info.last_seen = time.monotonic()  # 마지막 수신 시각
 
-        connections = self.active_connections[room_id]  # 현재 방의 소켓들
+    def allow_message(self, websocket: WebSocket) -> bool:  # 메시지 속도 제한
+        """
+        연결 버킷과 사용자 버킷 모두 토큰이 있을 때만 소비하고 허용
+        """  # 함수 설명
+        info = self.connection_info.get(websocket)  # 메타데이터
+        if info is None:  # 등록되지 않은 연결
+            return False  # 거부
+        self.messages_received += 1  # 통계
 
-        if websocket in connections:  # 소켓이 존재하면
-            connections.remove(websocket)  # 목록에서 제거
+        user_bucket = None  # 사용자 버킷
+        if info.user_id is not None:  # 사용자 식별 가능하면
+            user_bucket = self._user_bucket(info.user_id)  # 재접속해도 같은 버킷
 
-        if not connections:  # 방이 비었으면
-            del self.active_connections[room_id]  # 방 자체 제거
+        if not info.bucket.has_token() or (user_bucket is not None and not user_bucket.has_token()):  # 한쪽이라도 부족
+            self.rate_limited += 1  # 통계
+            return False  # 거부
+
+        info.bucket.consume()  # 연결 토큰 소비
+        if user_bucket is not None:  # 사용자 버킷
+            user_bucket.consume()  # 사용자 토큰 소비
+        return True  # 허용
+
+    def _user_bucket(self, user_id: int) -> TokenBucket:  # 사용자 버킷(LRU 갱신)
+        """
+        사용자 버킷을 최근 사용으로 표시해 반환 (없으면 생성)
+        - 연결이 끊겨도 유지하므로 재접속으로 순간 허용량이 다시 채워지지 않는다
+        - 상한을 넘으면 가장 오래 쓰지 않은 버킷부터 제거
+        """  # 함수 설명
+        bucket = self.user_buckets.get(user_id)  # 기존 버킷
+        if bucket is not None:  # 있으면
+            self.user_buckets.move_to_end(user_id)  # 최근 사용
+            return bucket  # 반환
+        bucket = self.user_buckets[user_id] = TokenBucket(WS_USER_RATE, WS_USER_BURST)  # 버킷 생성
+        while len(self.user_buckets) > self.user_bucket_max:  # 상한 초과
+            self.user_buckets.popitem(last=False)  # 가장 오래 쓰지 않은 버킷
+        return bucket  # 반환
+
+    def prune_user_buckets(self) -> int:  # 가득 찬 사용자 버킷 정리
+        """
+        다시 가득 찬(새로 만든 것과 같은) 버킷을 오래 쓰지 않은 순으로 제거하고 제거 수 반환
+        """  # 함수 설명
+        pruned = 0  # 제거 수
+        while self.user_buckets:  # 오래 쓰지 않은 순
+            user_id, bucket = next(iter(self.user_buckets.items()))  # 가장 오래된 버킷
+            if not bucket.is_full():  # 아직 충전 중
+                break  # 나머지는 다음 주기에
+            del self.user_buckets[user_id]  # 제거
+            pruned += 1  # 통계
+        return pruned  # 제거 수
+
+    def is_user_online(self, user_id: int) -> bool:  # 접속 여부
+        return user_id in self.user_connections  # 사용자 인덱스 확인
+
+    async def send_to_user(self, user_id: int, message: dict):  # 사용자 대상 전송
+        """
+        특정 사용자의 모든 연결에 메시지 전송
+        """  # 함수 설명
+        for ws in list(self.user_connections.get(user_id, ())):  # 복사본으로 순회
+            await self._send(ws, message)  # 전송
 
     async def broadcast(self, room_id: int, message: dict):  # 브로드캐스트
         """
@@ -39,7 +212,131 @@ class ConnectionManager:  # WS 연결 관리 클래스
             return  # 종료
 
         for ws in list(self.active_connections[room_id]):  # 복사본으로 순회
+            await self._send(ws, message)  # 전송
+
+    def _history(self, room_id: int, create: bool = False) -> Optional[RoomHistory]:  # 방 버퍼(LRU 갱신)
+        """
+        방 버퍼를 최근 사용으로 표시해 반환
+        - create: 없으면 만들고, 방 수 상한을 넘으면 가장 오래 쓰지 않은 방 버퍼 제거
+          (제거된 방은 다음 재접속 때 DB에서 다시 적재)
+        """  # 함수 설명
+        history = self.room_history.get(room_id)  # 방 버퍼
+        if history is not None:  # 있으면
+            self.room_history.move_to_end(room_id)  # 최근 사용
+        elif create:  # 생성
+            history = self.room_history[room_id] = RoomHistory(self.resume_buffer_size)  # 버퍼 생성
+            while len(self.room_history) > self.resume_max_rooms:  # 상한 초과
+                self.room_history.popitem(last=False)  # 가장 오래 쓰지 않은 방
+                self.evicted_history += 1  # 통계
+        return history  # 반환
+
+    def remember(self, room_id: int, message: dict):  # 재전송 버퍼 기록
+        """
+        방에 전송된 메시지를 재접속 재전송용 링 버퍼에 기록
+        """  # 함수 설명
+        self._history(room_id, create=True).append(message)  # 기록(없으면 생성, DB 적재 전)
+
+    def is_history_seeded(self, room_id: int) -> bool:  # 초기 적재 여부
+        history = self.room_history.get(room_id)  # 방 버퍼
+        return history is not None and history.seeded  # 적재 완료 여부
+
+    def seed_history(self, room_id: int, messages: List[dict], complete: bool):  # 초기 적재
+        """
+        DB에서 읽은 방의 최근 메시지로 버퍼를 채움
+        - complete: 방의 전체 이력을 읽었는지 여부
+        """  # 함수 설명
+        self._history(room_id, create=True).seed(messages, complete)  # 적재(없으면 생성)
+
+    def replay_since(self, room_id: int, last_seen_id: int) -> Optional[List[dict]]:  # 놓친 메시지 조회
+        """
+        last_seen_id 이후 메시지를 버퍼에서 반환
+        - 버퍼가 공백을 덮지 못하면 None (DB 조회 필요)
+        """  # 함수 설명
+        history = self._history(room_id)  # 방 버퍼
+        if history is None:  # 없으면
+            return None  # 판단 불가
+        return history.since(last_seen_id)  # 버퍼 조회
+
+    async def _send(self, websocket: WebSocket, message: dict):  # 단일 전송
+        try:
+            await websocket.send_json(message)  # JSON 전송
+            self.frames_sent += 1  # 통계
+        except Exception:
+            info = self.connection_info.get(websocket)  # 메타데이터
+            if info is not None:  # 등록된 연결이면
+                self.disconnect(info.room_id, websocket)  # 실패 소켓 정리
+
+    async def _evict(self, websocket: WebSocket, code: int):  # 강제 종료
+        info = self.connection_info.get(websocket)  # 메타데이터
+        if info is not None:  # 등록된 연결이면
+            self.disconnect(info.room_id, websocket)  # 레지스트리에서 제거
+        try:
+            await websocket.close(code=code)  # 소켓 종료
+        except Exception:
+            pass  # 이미 끊긴 소켓
+
+    async def heartbeat_once(self):  # 하트비트 1회
+        """
+        무응답 연결을 정리하고 나머지에 ping 전송 (가득 찬 사용자 버킷도 정리)
+        """  # 함수 설명
+        self.prune_user_buckets()  # 버킷 정리
+        deadline = time.monotonic() - self.idle_timeout  # 허용 기준 시각
+        for ws, info in list(self.connection_info.items()):  # 복사본으로 순회
+            if info.last_seen < deadline:  # 무응답
+                self.evicted_idle += 1  # 통계
+                await self._evict(ws, code=1001)  # Going Away 종료
+            else:
+                await self._send(ws, {"type": "ping"})  # ping 전송
+
+    async def _heartbeat_loop(self):  # 하트비트 루프
+        while True:  # 주기 실행
+            await asyncio.sleep(self.heartbeat_interval)  # 대기
+            await self.heartbeat_once()  # 1회 실행
+
+    def start_heartbeat(self):  # 하트비트 시작
+        if self._heartbeat_task is None:  # 중복 시작 방지
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())  # 태스크 생성
+
+    async def stop_heartbeat(self):  # 하트비트 종료
+        if self._heartbeat_task is not None:  # 실행 중이면
+            self._heartbeat_task.cancel()  # 취소
             try:
-                await ws.send_json(message)  # JSON 전송
-            except Exception:
-                self.disconnect(room_id, ws)  # 실패 소켓 정리
+                await self._heartbeat_task  # 종료 대기
+            except asyncio.CancelledError:
+                pass  # 정상 취소
+            self._heartbeat_task = None  # 초기화
+
+    def stats(self) -> dict:  # 연결 통계
+        """
+        연결 수와 레지스트리 메모리 사용량(추정치) 반환
+        """  # 함수 설명
+        connections = len(self.connection_info)  # 전체 연결 수
+        registry_bytes = (  # 레지스트리 구조체 크기(소켓 객체 자체는 제외)
+            sys.getsizeof(self.active_connections)  # 방 딕셔너리
+            + sum(sys.getsizeof(s) for s in self.active_connections.values())  # 방 집합들
+            + sys.getsizeof(self.user_connections)  # 사용자 딕셔너리
+            + sum(sys.getsizeof(s) for s in self.user_connections.values())  # 사용자 집합들
+            + sys.getsizeof(self.connection_info)  # 메타데이터 딕셔너리
+            + sum(sys.getsizeof(i) for i in self.connection_info.values())  # 메타데이터 객체들
+        )
+        return {
+            "connections": connections,  # 전체 연결 수
+            "rooms": len(self.active_connections),  # 활성 방 수
+            "buffered_rooms": len(self.room_history),  # 재전송 버퍼 보유 방 수
+            "max_buffered_rooms": self.resume_max_rooms,  # 재전송 버퍼 방 수 상한
+            "buffered_messages": sum(len(h.messages) for h in self.room_history.values()),  # 버퍼 메시지 수
+            "evicted_history": self.evicted_history,  # 상한으로 제거한 방 버퍼 수
+            "users_online": len(self.user_connections),  # 접속 사용자 수
+            "user_buckets": len(self.user_buckets),  # 보관 중인 사용자 버킷 수
+            "registry_bytes": registry_bytes,  # 레지스트리 바이트
+            "bytes_per_connection": registry_bytes // connections if connections else 0,  # 연결당 바이트
+            "max_connections_per_user": self.max_connections_per_user,  # 사용자당 상한
+            "evicted_idle": self.evicted_idle,  # 무응답 정리 횟수
+            "evicted_over_cap": self.evicted_over_cap,  # 상한 초과 정리 횟수
+            "rate_limited": self.rate_limited,  # 속도 제한 거부 수
+            "messages_received": self.messages_received,  # 수신 메시지 수
+            "frames_sent": self.frames_sent,  # 전송 프레임 수
+        }
+
+
+manager = ConnectionManager()  # 앱 전역 연결 관리자
@@ -0,0 +1,69 @@
+"""
+챗봇 키워드 매칭 벤치마크 (기존 중첩 루프 부분 문자열 검색 vs 컴파일된 단일 정규식)
+
+    python -m benchmarks.chatbot_matcher_bench --sizes 10 100 1000 5000 --messages 2000
+"""
+
+import argparse  # CLI 인자
+import random  # 합성 데이터
+import string  # 합성 키워드
+import time  # 시간 측정
+
+from app.services.chatbot_services import KeywordMatcher  # 컴파일된 매처
+
+
+def synthetic_intents(n_keywords: int, rng: random.Random, per_intent: int = 10):  # 합성 인텐트 표
+    words = set()  # 중복 없는 키워드
+    while len(words) < n_keywords:  # 필요한 개수까지
+        words.add("".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))))  # 무작위 단어
+    words = sorted(words)  # 결정적 순서
+    return {  # 인텐트 -> 키워드
+        f"intent_{i // per_intent}": words[i:i + per_intent]
+        for i in range(0, len(words), per_intent)
+    }
+
+
+def naive_match(intents, message: str):  # 기존 방식(첫 부분 문자열 일치)
+    message_lower = message.lower()  # 소문자
+    for intent, keywords in intents.items():  # 인텐트 순회
+        for keyword in keywords:  # 키워드 순회
+            if keyword in message_lower:  # 부분 문자열 검색
+                return intent  # 첫 일치
+    return None  # 없음
+
+
+def throughput(fn, messages) -> float:  # 초당 처리 메시지 수
+    started = time.perf_counter()  # 시작
+    for message in messages:  # 메시지 순회
+        fn(message)  # 매칭
+    return len(messages) / (time.perf_counter() - started)  # 처리량
+
+
+def main():  # 진입점
+    parser = argparse.ArgumentParser(description="chatbot keyword matcher benchmark")  # 파서
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])  # 키워드 수
+    parser.add_argument("--messages", type=int, default=2000)  # 메시지 수
+    parser.add_argument("--seed", type=int, default=0)  # 난수 시드
+    args = parser.parse_args()  # 인자 파싱
+
+    print(f"{'keywords':>9} {'compile ms':>11} {'naive msg/s':>12} {'matcher msg/s':>14}")  # 헤더
+    for size in args.sizes:  # 표 크기별
+        rng = random.Random(args.seed)  # 난수 생성기
+        intents = synthetic_intents(size, rng)  # 인텐트 표
+        keywords = [k for ks in intents.values() for k in ks]  # 전체 키워드
+        messages = [  # 키워드가 섞인 합성 메시지(평균 12단어)
+            " ".join(rng.choice(keywords) if rng.random() < 0.2 else "filler" for _ in range(12))
+            for _ in range(args.messages)
+        ]
+
+        started = time.perf_counter()  # 컴파일 시작
+        matcher = KeywordMatcher(intents)  # 컴파일
+        compile_ms = (time.perf_counter() - started) * 1000  # 컴파일 시간
+
+        naive = throughput(lambda m: naive_match(intents, m), messages)  # 기존 방식
+        compiled = throughput(matcher.best_intent, messages)  # 컴파일 매처
+        print(f"{size:>9} {compile_ms:>11.1f} {naive:>12.0f} {compiled:>14.0f}")  # 결과
+
+
+if __name__ == "__main__":  # 모듈 직접 실행
+    main()  # 벤치마크 실행
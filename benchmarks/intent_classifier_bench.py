@@ -0,0 +1,52 @@
+"""
+챗봇 n-gram 의도 분류기 지연 시간/정확도 벤치마크
+
+    python -m benchmarks.intent_classifier_bench --repeat 2000
+"""
+
+import argparse  # CLI 인자
+import json  # 픽스처 읽기
+import os  # 경로
+import time  # 시간 측정
+
+import numpy as np  # 백분위 계산
+
+from app.services.chatbot_services import CHATBOT_INTENTS_PATH, load_intent_file  # 의도 파일
+from app.services.intent_classifier import CHATBOT_CLASSIFIER_THRESHOLD, evaluate  # 분류기 평가
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "chatbot_intent_eval.json")  # 정확도 픽스처
+
+
+def main():  # 진입점
+    parser = argparse.ArgumentParser(description="chatbot intent classifier benchmark")  # 파서
+    parser.add_argument("--repeat", type=int, default=2000)  # 반복 횟수
+    parser.add_argument("--fixture", default=FIXTURE)  # 픽스처 경로
+    parser.add_argument("--threshold", type=float, default=CHATBOT_CLASSIFIER_THRESHOLD)  # 신뢰도 기준
+    args = parser.parse_args()  # 인자 파싱
+
+    started = time.perf_counter()  # 학습 시작
+    table = load_intent_file(CHATBOT_INTENTS_PATH)  # 의도 파일 로드(학습 포함)
+    load_ms = (time.perf_counter() - started) * 1000  # 로드 시간
+
+    with open(args.fixture, encoding="utf-8") as f:  # 픽스처
+        cases = json.load(f)  # 평가 사례
+
+    classifier = table.classifier  # 분류기
+    latencies = []  # 분류 지연(us)
+    for i in range(args.repeat):  # 반복
+        text = cases[i % len(cases)]["text"]  # 질의
+        started = time.perf_counter()  # 시작
+        classifier.predict(text)  # 분류
+        latencies.append((time.perf_counter() - started) * 1e6)  # 기록
+
+    result = evaluate(classifier, cases, args.threshold)  # 정확도
+    print(f"intents={len(classifier.labels)} load+train={load_ms:.1f}ms")  # 학습 결과
+    print(  # 지연 결과
+        f"predict p50={np.percentile(latencies, 50):.0f}us p99={np.percentile(latencies, 99):.0f}us "
+        f"max={max(latencies):.0f}us"
+    )
+    print(f"accuracy={result['accuracy']:.3f} on {result['cases']} cases (threshold={args.threshold})")  # 정확도 결과
+
+
+if __name__ == "__main__":  # 모듈 직접 실행
+    main()  # 벤치마크 실행
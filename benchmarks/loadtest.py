@@ -0,0 +1,339 @@
+"""
+전체 사용자 여정 부하 테스트 (asyncio + httpx + websockets)
+
+가상 사용자(VU)가 회사/학생 역할로 회원가입 → 로그인 → 역할별 작업 묶음을 반복한다.
+- 회사: 공고 등록, 받은 지원 목록, 수락, 채팅방 목록, WS 채팅
+- 학생: 프로필 등록, 공고 목록/지역 검색, 추천, 지원, 채팅방 목록, WS 채팅
+
+단계별 처리량, p50/p95/p99 지연, 오류 분류를 JSON 리포트로 저장한다 (커밋 간 diff 용도로 키 정렬).
+클라이언트 의존성(httpx, websockets)은 requirement-dev.txt에 있다.
+
+    pip install -r requirement-dev.txt
+
+    # 이미 떠 있는 서버 대상
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 --concurrency 50 --duration 60 --out report.json
+
+    # 로컬 서버를 직접 띄워서 (ASYNC_DATABASE_URL 등 환경 변수는 현재 셸 기준)
+    python -m benchmarks.loadtest --spawn --concurrency 20 --duration 30
+"""
+
+import argparse  # CLI 인자
+import asyncio  # 비동기 실행
+import json  # 리포트
+import os  # 환경 변수/프로세스
+import random  # 작업 선택
+import subprocess  # 서버/커밋 정보
+import sys  # 인터프리터 경로
+import time  # 시간 측정
+import uuid  # 고유 계정
+from collections import Counter, defaultdict  # 집계
+from datetime import datetime, timezone  # 리포트 시각
+from typing import Dict, List, Optional  # 타입 힌트
+
+import httpx  # HTTP 클라이언트
+import websockets  # WS 클라이언트
+
+REGIONS = ["Seoul", "Busan", "Incheon", "Daegu", "Daejeon", "Gwangju"]  # 합성 지역
+SKILLS = ["python", "excel", "design", "serving", "english", "coding", "marketing"]  # 합성 기술
+
+COMPANY_MIX = {  # 회사 세션 내 작업 가중치
+    "create_post": 2,
+    "list_applications": 4,
+    "accept": 3,
+    "list_rooms": 2,
+    "chat": 3,
+}
+STUDENT_MIX = {  # 학생 세션 내 작업 가중치
+    "list_posts": 5,
+    "search_posts": 3,
+    "recommendations": 1,
+    "apply": 3,
+    "list_rooms": 2,
+    "chat": 2,
+}
+
+
+class Recorder:  # 단계별 결과 수집
+    def __init__(self):  # 생성자
+        self.latencies: Dict[str, List[float]] = defaultdict(list)  # 단계 -> 지연(초)
+        self.errors: Counter = Counter()  # "단계:사유" -> 횟수
+        self.step_errors: Counter = Counter()  # 단계 -> 오류 수
+
+    def ok(self, step: str, seconds: float):  # 성공 기록
+        self.latencies[step].append(seconds)  # 지연
+
+    def fail(self, step: str, seconds: float, reason: str):  # 실패 기록
+        self.latencies[step].append(seconds)  # 실패도 지연에 포함
+        self.errors[f"{step}:{reason}"] += 1  # 사유별
+        self.step_errors[step] += 1  # 단계별
+
+    def report(self, elapsed: float) -> dict:  # 리포트 생성
+        steps = {}  # 단계별 요약
+        for step, values in sorted(self.latencies.items()):  # 단계 순회
+            ordered = sorted(values)  # 정렬
+            steps[step] = {  # 요약
+                "count": len(ordered),  # 횟수
+                "errors": self.step_errors[step],  # 오류 수
+                "rps": round(len(ordered) / elapsed, 2),  # 초당 처리
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),  # 평균
+                "p50_ms": _percentile_ms(ordered, 50),  # 중앙값
+                "p95_ms": _percentile_ms(ordered, 95),  # p95
+                "p99_ms": _percentile_ms(ordered, 99),  # p99
+                "max_ms": round(ordered[-1] * 1000, 2),  # 최대
+            }
+        total = sum(s["count"] for s in steps.values())  # 전체 요청
+        errors = sum(s["errors"] for s in steps.values())  # 전체 오류
+        return {
+            "totals": {  # 전체 요약
+                "requests": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "rps": round(total / elapsed, 2),
+            },
+            "steps": steps,  # 단계별
+            "errors": dict(sorted(self.errors.items())),  # 오류 분류
+        }
+
+
+def _percentile_ms(ordered: List[float], pct: float) -> float:  # 최근접 순위 백분위(ms)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))  # 순위
+    return round(ordered[index] * 1000, 2)  # ms
+
+
+class Shared:  # VU 간 공유 상태
+    def __init__(self):  # 생성자
+        self.post_ids: List[int] = []  # 지원 가능한 공고 ID
+
+
+class VirtualUser:  # 가상 사용자 1명
+    def __init__(self, client: httpx.AsyncClient, ws_base: str, rec: Recorder, shared: Shared, rng: random.Random):  # 생성자
+        self.client = client  # HTTP 클라이언트(연결 재사용)
+        self.ws_base = ws_base  # ws://host
+        self.rec = rec  # 결과 수집
+        self.shared = shared  # 공유 상태
+        self.rng = rng  # 난수
+        self.token: Optional[str] = None  # JWT
+        self.room_ids: List[int] = []  # 내 채팅방
+
+    @property
+    def headers(self) -> dict:  # 인증 헤더
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}  # Bearer
+
+    async def call(self, step: str, method: str, path: str, ok=(200,), **kwargs) -> Optional[httpx.Response]:  # 요청 1건
+        started = time.perf_counter()  # 시작
+        try:
+            response = await self.client.request(method, path, headers=self.headers, **kwargs)  # 요청
+        except httpx.HTTPError as exc:  # 연결/타임아웃
+            self.rec.fail(step, time.perf_counter() - started, type(exc).__name__)  # 실패
+            return None  # 결과 없음
+        elapsed = time.perf_counter() - started  # 지연
+        if response.status_code in ok:  # 기대 상태
+            self.rec.ok(step, elapsed)  # 성공
+        else:  # 그 외
+            self.rec.fail(step, elapsed, str(response.status_code))  # 상태 코드별
+        return response  # 응답
+
+    async def start_session(self, role: str) -> bool:  # 회원가입 + 로그인
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"  # 고유 이메일
+        password = "load-test-password"  # 비밀번호
+        r = await self.call("signup", "POST", "/api/auth/signup", json={"email": email, "password": password, "role": role})  # 가입
+        if r is None or r.status_code != 200:  # 실패
+            return False  # 세션 중단
+        r = await self.call("login", "POST", "/api/auth/login", json={"email": email, "password": password})  # 로그인
+        if r is None or r.status_code != 200:  # 실패
+            return False  # 세션 중단
+        self.token = r.json()["access_token"]  # 토큰
+        self.room_ids = []  # 초기화
+        return True  # 성공
+
+    async def chat(self):  # WS 연결 + 메시지 왕복
+        if not self.room_ids:  # 채팅방 없음
+            await self.list_rooms()  # 목록 갱신
+            if not self.room_ids:  # 여전히 없음
+                return  # 건너뜀
+        room_id = self.rng.choice(self.room_ids)  # 방 선택
+        url = f"{self.ws_base}/api/ws/chat/{room_id}?token={self.token}"  # WS 주소
+
+        started = time.perf_counter()  # 연결 시작
+        step = "ws_connect"  # 실패 시 귀속 단계
+        try:
+            async with websockets.connect(url, open_timeout=10) as ws:  # 연결
+                self.rec.ok("ws_connect", time.perf_counter() - started)  # 연결 지연
+                step = "chat_message"  # 연결 이후 실패는 메시지 단계
+                for _ in range(self.rng.randint(1, 3)):  # 메시지 1~3개
+                    content = f"load {uuid.uuid4().hex[:8]}"  # 고유 내용
+                    sent = time.perf_counter()  # 전송 시각
+                    await ws.send(json.dumps({"content": content}))  # 전송
+                    while True:  # 내 메시지 에코 대기(resumed/ping 등 건너뜀)
+                        frame = json.loads(await asyncio.wait_for(ws.recv(), timeout=10))  # 수신
+                        if frame.get("type") == "error":  # 서버 거부(속도 제한 등)
+                            self.rec.fail("chat_message", time.perf_counter() - sent, frame.get("code", "error"))  # 실패
+                            break  # 다음 메시지
+                        if frame.get("type") == "message" and frame.get("content") == content:  # 에코
+                            self.rec.ok("chat_message", time.perf_counter() - sent)  # 왕복 지연
+                            break  # 다음 메시지
+        except Exception as exc:  # 연결 거부/타임아웃/끊김
+            self.rec.fail(step, time.perf_counter() - started, type(exc).__name__)  # 실패
+
+    async def list_rooms(self):  # 채팅방 목록
+        r = await self.call("list_rooms", "GET", "/api/chat/rooms", params={"limit": 20})  # 조회
+        if r is not None and r.status_code == 200:  # 성공
+            self.room_ids = [room["id"] for room in r.json()]  # 방 ID
+
+    async def company_action(self, action: str):  # 회사 작업
+        if action == "create_post":  # 공고 등록
+            r = await self.call("create_post", "POST", "/api/job-posts", json={  # 등록
+                "title": f"Load test {self.rng.choice(SKILLS)} job",
+                "wage": self.rng.randrange(9860, 30000, 10),
+                "description": " ".join(self.rng.choices(SKILLS, k=8)),
+                "region": self.rng.choice(REGIONS),
+            })
+            if r is not None and r.status_code == 200:  # 성공
+                self.shared.post_ids.append(r.json()["id"])  # 학생이 지원할 수 있게 공유
+        elif action == "list_applications":  # 받은 지원 목록
+            await self.call("list_applications", "GET", "/api/applications", params={"status": "REQUESTED", "limit": 20})  # 조회
+        elif action == "accept":  # 수락
+            r = await self.call("list_applications", "GET", "/api/applications", params={"status": "REQUESTED", "limit": 5})  # 대기 건
+            if r is not None and r.status_code == 200 and r.json():  # 대기 건 있음
+                application_id = r.json()[0]["id"]  # 첫 건
+                await self.call("accept", "POST", f"/api/applications/{application_id}/accept", ok=(200, 400))  # 경합 시 400 허용
+        elif action == "list_rooms":  # 채팅방 목록
+            await self.list_rooms()  # 조회
+        elif action == "chat":  # 채팅
+            await self.chat()  # WS
+
+    async def student_action(self, action: str):  # 학생 작업
+        if action == "list_posts":  # 공고 목록
+            await self.call("list_posts", "GET", "/api/job-posts", params={"status": "OPEN"})  # 조회
+        elif action == "search_posts":  # 지역 검색
+            await self.call("search_posts", "GET", "/api/job-posts", params={"region": self.rng.choice(REGIONS)})  # 조회
+        elif action == "recommendations":  # 추천
+            await self.call("recommendations", "GET", "/api/users/me/recommendations", params={"k": 10})  # 조회
+        elif action == "apply":  # 지원
+            if self.shared.post_ids:  # 공고 있음
+                post_id = self.rng.choice(self.shared.post_ids)  # 무작위 공고
+                await self.call("apply", "POST", "/api/applications", ok=(200, 400, 409), json={"job_post_id": post_id})  # 중복 지원 허용
+        elif action == "list_rooms":  # 채팅방 목록
+            await self.list_rooms()  # 조회
+        elif action == "chat":  # 채팅
+            await self.chat()  # WS
+
+    async def run(self, deadline: float, role: str, actions_per_session: int):  # VU 루프
+        mix = COMPANY_MIX if role == "COMPANY" else STUDENT_MIX  # 작업 가중치
+        names, weights = list(mix), list(mix.values())  # 선택용
+        while time.monotonic() < deadline:  # 종료 시각까지
+            if not await self.start_session(role):  # 새 계정 세션
+                await asyncio.sleep(0.5)  # 실패 시 잠시 대기
+                continue  # 재시도
+            if role == "STUDENT":  # 학생은 프로필 먼저
+                await self.call("upsert_profile", "PUT", "/api/users/me/student-profile", json={  # 프로필
+                    "name": "Load Tester",
+                    "skills": self.rng.sample(SKILLS, 3),
+                    "available_time": "weekends",
+                })
+            for _ in range(actions_per_session):  # 세션 작업
+                if time.monotonic() >= deadline:  # 종료 시각
+                    return  # 종료
+                action = self.rng.choices(names, weights)[0]  # 가중 선택
+                if role == "COMPANY":  # 회사
+                    await self.company_action(action)  # 실행
+                else:  # 학생
+                    await self.student_action(action)  # 실행
+
+
+def _git_commit() -> Optional[str]:  # 현재 커밋(리포트 비교용)
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()  # 짧은 해시
+    except Exception:
+        return None  # git 없음
+
+
+async def _wait_healthy(base_url: str, timeout: float = 30.0):  # 서버 준비 대기
+    deadline = time.monotonic() + timeout  # 제한 시간
+    async with httpx.AsyncClient(base_url=base_url) as client:  # 임시 클라이언트
+        while time.monotonic() < deadline:  # 대기
+            try:
+                if (await client.get("/health")).status_code == 200:  # 준비됨
+                    return  # 종료
+            except httpx.HTTPError:
+                pass  # 아직 기동 중
+            await asyncio.sleep(0.5)  # 재시도
+    raise RuntimeError(f"server at {base_url} did not become healthy")  # 실패
+
+
+async def run_load(args) -> dict:  # 부하 실행
+    await _wait_healthy(args.base_url)  # 서버 확인
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")  # 시작 시각
+    rec, shared = Recorder(), Shared()  # 수집/공유 상태
+    rng = random.Random(args.seed)  # 시드
+    ws_base = args.base_url.replace("http://", "ws://").replace("https://", "wss://")  # WS 주소
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)  # 연결 풀
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:  # 공유 클라이언트
+        n_companies = max(1, round(args.concurrency * args.company_ratio))  # 회사 VU 수
+        started = time.monotonic()  # 시작
+        deadline = started + args.duration  # 종료 시각
+        tasks = []  # VU 태스크
+        for i in range(args.concurrency):  # VU 생성
+            role = "COMPANY" if i < n_companies else "STUDENT"  # 역할
+            vu = VirtualUser(client, ws_base, rec, shared, random.Random(rng.random()))  # VU
+            tasks.append(asyncio.create_task(vu.run(deadline, role, args.actions_per_session)))  # 실행
+            if args.ramp_up:  # 점진 증가
+                await asyncio.sleep(args.ramp_up / args.concurrency)  # 간격
+        await asyncio.gather(*tasks)  # 완료 대기
+        elapsed = time.monotonic() - started  # 실제 소요
+
+    report = rec.report(elapsed)  # 리포트
+    report["meta"] = {  # 실행 조건
+        "base_url": args.base_url,
+        "commit": _git_commit(),
+        "concurrency": args.concurrency,
+        "company_ratio": args.company_ratio,
+        "duration_s": args.duration,
+        "elapsed_s": round(elapsed, 2),
+        "seed": args.seed,
+        "started_at": started_at,
+    }
+    return report  # 반환
+
+
+def main():  # 진입점
+    parser = argparse.ArgumentParser(description="end-to-end load test")  # 파서
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")  # 대상 서버
+    parser.add_argument("--concurrency", type=int, default=20)  # VU 수
+    parser.add_argument("--duration", type=float, default=30)  # 실행 시간(초)
+    parser.add_argument("--ramp-up", type=float, default=5)  # VU 증가 시간(초)
+    parser.add_argument("--company-ratio", type=float, default=0.2)  # 회사 VU 비율
+    parser.add_argument("--actions-per-session", type=int, default=20)  # 세션당 작업 수(이후 새 계정)
+    parser.add_argument("--timeout", type=float, default=30)  # 요청 타임아웃(초)
+    parser.add_argument("--seed", type=int, default=0)  # 난수 시드
+    parser.add_argument("--out", default="loadtest_report.json")  # 리포트 경로
+    parser.add_argument("--spawn", action="store_true", help="start uvicorn app.main:app locally")  # 서버 직접 기동
+    args = parser.parse_args()  # 인자 파싱
+
+    server = None  # 기동한 서버
+    if args.spawn:  # 로컬 서버 기동
+        port = args.base_url.rsplit(":", 1)[-1].strip("/")  # 포트
+        server = subprocess.Popen(  # uvicorn 실행
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", port, "--log-level", "warning"],
+            env=os.environ.copy(),
+        )
+    try:
+        report = asyncio.run(run_load(args))  # 부하 실행
+    finally:
+        if server is not None:  # 기동한 서버 종료
+            server.terminate()  # 종료 신호
+            server.wait(timeout=10)  # 대기
+
+    with open(args.out, "w", encoding="utf-8") as f:  # 리포트 저장
+        json.dump(report, f, indent=2, sort_keys=True)  # 키 정렬(diff 용이)
+        f.write("\n")  # 마지막 줄바꿈
+
+    totals = report["totals"]  # 요약
+    print(f"requests={totals['requests']} errors={totals['errors']} rps={totals['rps']} -> {args.out}")  # 요약 출력
+    for step, s in report["steps"].items():  # 단계별
+        print(f"  {step:<18} n={s['count']:<6} err={s['errors']:<4} p50={s['p50_ms']}ms p95={s['p95_ms']}ms p99={s['p99_ms']}ms")  # 출력
+
+
+if __name__ == "__main__":  # 모듈 직접 실행
+    main()  # 부하 테스트 실행
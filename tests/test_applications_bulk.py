@@ -0,0 +1,110 @@
+"""
+지원 일괄 수락/거절 (Postgres 필요: TEST_DATABASE_URL)
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import create_access_token
+from app.models import Application, ApplicationStatus, ChatRoom, JobPost, User, UserRole
+
+pytestmark = pytest.mark.anyio
+
+MISSING_ID = 999_999  # 없는 지원 ID
+
+
+async def _seed(sessions):  # 회사 A의 대기 2건/처리 1건, 회사 B의 대기 1건
+    async with sessions() as db:
+        company, other = (User(email=f"{n}@test", password_hash="x", role=UserRole.COMPANY, is_active=True) for n in "ab")
+        students = [User(email=f"s{i}@test", password_hash="x", role=UserRole.STUDENT, is_active=True) for i in range(4)]
+        db.add_all([company, other, *students])
+        await db.flush()
+        job = JobPost(company_id=company.id, title="t", description="d", region="r", requested_count=2, accepted_count=1)
+        other_job = JobPost(company_id=other.id, title="t", description="d", region="r", requested_count=1)
+        db.add_all([job, other_job])
+        await db.flush()
+
+        def _application(post, student, status):
+            return Application(job_post_id=post.id, student_id=student.id, company_id=post.company_id, status=status)
+
+        apps = {
+            "first": _application(job, students[0], ApplicationStatus.REQUESTED),
+            "second": _application(job, students[1], ApplicationStatus.REQUESTED),
+            "done": _application(job, students[2], ApplicationStatus.ACCEPTED),
+            "foreign": _application(other_job, students[3], ApplicationStatus.REQUESTED),
+        }
+        db.add_all(apps.values())
+        await db.commit()
+        return company.id, job.id, other_job.id, {name: a.id for name, a in apps.items()}
+
+
+async def _state(sessions, *job_ids):  # (공고별 카운터, 지원별 상태, 채팅방이 있는 지원 ID)
+    async with sessions() as db:
+        counters = [
+            tuple(r) for r in await db.execute(
+                select(JobPost.requested_count, JobPost.accepted_count, JobPost.rejected_count)
+                .where(JobPost.id.in_(job_ids)).order_by(JobPost.id)
+            )
+        ]
+        statuses = dict((await db.execute(select(Application.id, Application.status))).all())
+        rooms = set(await db.scalars(select(ChatRoom.application_id)))
+        return counters, statuses, rooms
+
+
+async def test_bulk_accept_reports_each_id_in_request_order(pg_client, pg_sessions):
+    company_id, job_id, other_job_id, ids = await _seed(pg_sessions)
+    request_ids = [ids["foreign"], ids["first"], MISSING_ID, ids["done"], ids["first"], ids["second"]]
+
+    response = await pg_client.post(
+        "/api/applications/bulk",
+        json={"ids": request_ids, "action": "accept"},
+        headers={"Authorization": f"Bearer {create_access_token(company_id)}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [  # 중복 제거, 요청 순서 유지
+        {"id": ids["foreign"], "outcome": "forbidden"},
+        {"id": ids["first"], "outcome": "accepted"},
+        {"id": MISSING_ID, "outcome": "not_found"},
+        {"id": ids["done"], "outcome": "already_processed"},
+        {"id": ids["second"], "outcome": "accepted"},
+    ]
+    counters, statuses, rooms = await _state(pg_sessions, job_id, other_job_id)
+    assert counters == [(0, 3, 0), (1, 0, 0)]  # 다른 회사 공고는 그대로
+    assert statuses[ids["foreign"]] == ApplicationStatus.REQUESTED
+    assert rooms == {ids["first"], ids["second"]}
+
+
+async def test_bulk_reject_moves_counters_without_rooms(pg_client, pg_sessions):
+    company_id, job_id, other_job_id, ids = await _seed(pg_sessions)
+
+    response = await pg_client.post(
+        "/api/applications/bulk",
+        json={"ids": [ids["first"], ids["second"]], "action": "reject"},
+        headers={"Authorization": f"Bearer {create_access_token(company_id)}"},
+    )
+
+    assert [r["outcome"] for r in response.json()["results"]] == ["rejected", "rejected"]
+    counters, _, rooms = await _state(pg_sessions, job_id, other_job_id)
+    assert counters == [(0, 1, 2), (1, 0, 0)]
+    assert rooms == set()
+
+
+async def test_bulk_accept_writes_nothing_when_commit_fails(pg_client, pg_sessions, monkeypatch):
+    company_id, job_id, other_job_id, ids = await _seed(pg_sessions)
+    before = await _state(pg_sessions, job_id, other_job_id)
+
+    async def _fail(self):
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(AsyncSession, "commit", _fail)  # 상태 전이/카운터/채팅방 문장 실행 후 커밋만 실패
+    with pytest.raises(RuntimeError):
+        await pg_client.post(
+            "/api/applications/bulk",
+            json={"ids": [ids["first"], ids["second"]], "action": "accept"},
+            headers={"Authorization": f"Bearer {create_access_token(company_id)}"},
+        )
+    monkeypatch.undo()
+
+    assert await _state(pg_sessions, job_id, other_job_id) == before  # 한 트랜잭션이라 모두 롤백
@@ -0,0 +1,76 @@
+"""
+지원 수락/거절 동시성 (Postgres 필요: TEST_DATABASE_URL)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.deps import create_access_token
+from app.models import Application, ApplicationStatus, ChatRoom, JobPost, User, UserRole
+
+pytestmark = pytest.mark.anyio
+
+N = 20  # 동시 요청 수
+
+
+async def _seed(sessions):  # 회사/학생/공고/대기 지원 1건
+    async with sessions() as db:
+        company = User(email="company@test", password_hash="x", role=UserRole.COMPANY, is_active=True)
+        student = User(email="student@test", password_hash="x", role=UserRole.STUDENT, is_active=True)
+        db.add_all([company, student])
+        await db.flush()
+        job = JobPost(company_id=company.id, title="t", description="d", region="r", requested_count=1)
+        db.add(job)
+        await db.flush()
+        application = Application(
+            job_post_id=job.id, student_id=student.id, company_id=company.id, status=ApplicationStatus.REQUESTED
+        )
+        db.add(application)
+        await db.commit()
+        return company.id, job.id, application.id
+
+
+async def _state(sessions, job_id, application_id):  # 경쟁 후 DB 상태
+    async with sessions() as db:
+        job = await db.get(JobPost, job_id)
+        rooms = await db.scalar(select(func.count()).select_from(ChatRoom).where(ChatRoom.application_id == application_id))
+        status = await db.scalar(select(Application.status).where(Application.id == application_id))
+        return job, rooms, status
+
+
+async def test_concurrent_accepts_have_one_winner(pg_client, pg_sessions):
+    company_id, job_id, application_id = await _seed(pg_sessions)
+    headers = {"Authorization": f"Bearer {create_access_token(company_id)}"}
+
+    responses = await asyncio.gather(
+        *(pg_client.post(f"/api/applications/{application_id}/accept", headers=headers) for _ in range(N))
+    )
+
+    codes = sorted(r.status_code for r in responses)
+    assert codes == [200] + [400] * (N - 1)
+    assert all(r.json()["detail"] == "Application already processed" for r in responses if r.status_code == 400)
+    job, rooms, status = await _state(pg_sessions, job_id, application_id)
+    assert status == ApplicationStatus.ACCEPTED
+    assert rooms == 1
+    assert (job.requested_count, job.accepted_count, job.rejected_count) == (0, 1, 0)
+
+
+async def test_concurrent_accept_and_reject_have_one_winner(pg_client, pg_sessions):
+    company_id, job_id, application_id = await _seed(pg_sessions)
+    headers = {"Authorization": f"Bearer {create_access_token(company_id)}"}
+
+    actions = ["accept", "reject"] * (N // 2)
+    responses = await asyncio.gather(
+        *(pg_client.post(f"/api/applications/{application_id}/{a}", headers=headers) for a in actions)
+    )
+
+    winners = [a for a, r in zip(actions, responses) if r.status_code == 200]
+    assert len(winners) == 1
+    assert sum(r.status_code == 400 for r in responses) == N - 1
+    job, rooms, status = await _state(pg_sessions, job_id, application_id)
+    accepted = winners[0] == "accept"
+    assert status == (ApplicationStatus.ACCEPTED if accepted else ApplicationStatus.REJECTED)
+    assert rooms == (1 if accepted else 0)
+    assert (job.requested_count, job.accepted_count, job.rejected_count) == (0, int(accepted), int(not accepted))
@@ -0,0 +1,195 @@
+"""
+채팅 조회 실행 계획 (Postgres 필요: TEST_DATABASE_URL)
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.deps import create_access_token
+from app.models import Application, ApplicationStatus, ChatRoom, JobPost, User, UserRole
+from app.pagination import NEXT_CURSOR_HEADER
+from app.routers.chat_router import missed_messages_query, recent_messages_query
+from app.services.chat_partitions import retention_cutoff
+
+pytestmark = pytest.mark.anyio
+
+PER_MONTH = 50  # 월별 방 메시지 수
+USERS = 100  # 회사/학생 각각
+ROOMS = 5000  # 채팅방 수(사용자당 50개)
+
+
+def _add_months(month: datetime, n: int) -> datetime:  # 월 이동
+    months = month.year * 12 + month.month - 1 + n
+    return datetime(months // 12, months % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _partition(month: datetime) -> str:
+    return f"chat_messages_p{month:%Y%m}"
+
+
+async def _seed(engine):  # 보존 기간 2개월 전 ~ 다음 달 월 파티션 + 월별 메시지
+    cutoff = retention_cutoff()
+    months = []
+    month = _add_months(cutoff, -2)  # 아직 보관 처리되지 않은 만료 파티션
+    last = _add_months(datetime.now(timezone.utc).replace(day=1), 1)
+    while month <= last:
+        months.append(month)
+        month = _add_months(month, 1)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:  # 방 2개(기본값은 모델에서)
+        company = User(email="company@test", password_hash="x", role=UserRole.COMPANY, is_active=True)
+        student = User(email="student@test", password_hash="x", role=UserRole.STUDENT, is_active=True)
+        db.add_all([company, student])
+        await db.flush()
+        for _ in range(2):
+            job = JobPost(company_id=company.id, title="t", description="d", region="r")
+            db.add(job)
+            await db.flush()
+            application = Application(
+                job_post_id=job.id, student_id=student.id, company_id=company.id, status=ApplicationStatus.ACCEPTED
+            )
+            db.add(application)
+            await db.flush()
+            db.add(ChatRoom(application_id=application.id, job_post_id=job.id, company_id=company.id, student_id=student.id))
+        await db.commit()
+
+    async with engine.begin() as conn:
+        for month in months:
+            await conn.execute(text(
+                f"CREATE TABLE {_partition(month)} PARTITION OF chat_messages "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+            ))
+        for month in months[:-1]:  # 다음 달은 비어 있음
+            await conn.execute(
+                text(
+                    "INSERT INTO chat_messages (chat_room_id, sender_id, content, created_at) "
+                    "SELECT 1 + g % 2, :sender, 'm', CAST(:start AS timestamptz) + interval '1 hour' + g * interval '1 second' "
+                    "FROM generate_series(1, :n) g"
+                ),
+                {"start": month, "n": PER_MONTH * 2, "sender": company.id},
+            )
+        await conn.execute(text("ANALYZE chat_messages"))
+    return cutoff, months
+
+
+async def _plan(engine, stmt) -> str:  # EXPLAIN ANALYZE 결과 텍스트
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    async with engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))  # 작은 테스트 테이블에서도 인덱스 계획
+        result = await conn.execute(text(f"EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF, SUMMARY OFF) {sql}"))
+        return "\n".join(row[0] for row in result)
+
+
+async def test_recent_messages_use_ordered_append(pg_engine):
+    cutoff, months = await _seed(pg_engine)
+
+    plan = await _plan(pg_engine, recent_messages_query(1, PER_MONTH))
+
+    assert "Merge Append" not in plan
+    assert "Sort" not in plan
+    for month in months:
+        if month < cutoff:  # 보존 기간 밖은 계획에서 제외
+            assert _partition(month) not in plan
+    previous = next(line for line in plan.splitlines() if _partition(months[-3]) in line)
+    assert "never executed" in previous  # 이번 달에서 LIMIT을 채우고 멈춤
+
+
+async def test_recent_messages_merge_append_with_default_partition(pg_engine):
+    _, months = await _seed(pg_engine)
+    async with pg_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE chat_messages_default PARTITION OF chat_messages DEFAULT"))
+
+    plan = await _plan(pg_engine, recent_messages_query(1, PER_MONTH))
+
+    assert "Merge Append" in plan  # 기본 파티션이 정렬 Append를 막는 이유(마이그레이션 d5a8c3f1e927)
+
+
+async def test_missed_messages_prune_before_last_seen(pg_engine):
+    _, months = await _seed(pg_engine)
+    seen_month = months[-3]  # 지난달 메시지를 마지막으로 받음
+    async with pg_engine.connect() as conn:
+        last_seen_id, since = (await conn.execute(text(
+            "SELECT id, created_at FROM chat_messages WHERE chat_room_id = 1 AND created_at >= :start "
+            "ORDER BY id LIMIT 1"
+        ), {"start": seen_month})).one()
+
+    plan = await _plan(pg_engine, missed_messages_query(1, last_seen_id, since))
+
+    assert "Seq Scan" not in plan
+    for month in months:
+        assert (_partition(month) in plan) == (month >= seen_month)
+
+
+async def test_missed_messages_without_last_seen_row_start_at_retention(pg_engine):
+    cutoff, months = await _seed(pg_engine)
+
+    plan = await _plan(pg_engine, missed_messages_query(1, 0, None))
+
+    for month in months:
+        assert (_partition(month) in plan) == (month >= cutoff)
+
+
+async def _seed_rooms(engine):  # 회사 1..USERS, 학생 USERS+1..2*USERS, 공고/지원/방 ROOMS개
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        await conn.execute(insert(User), [
+            {"id": i, "email": f"u{i}@test", "password_hash": "x", "role": UserRole.COMPANY if i <= USERS else UserRole.STUDENT}
+            for i in range(1, 2 * USERS + 1)
+        ])
+        await conn.execute(insert(JobPost), [
+            {"id": i, "company_id": i % USERS + 1, "title": "t", "description": "d", "region": "r"}
+            for i in range(1, ROOMS + 1)
+        ])
+        await conn.execute(insert(Application), [
+            {"id": i, "job_post_id": i, "student_id": USERS + i % USERS + 1, "company_id": i % USERS + 1,
+             "status": ApplicationStatus.ACCEPTED}
+            for i in range(1, ROOMS + 1)
+        ])
+        await conn.execute(insert(ChatRoom), [
+            {"id": i, "application_id": i, "job_post_id": i, "company_id": i % USERS + 1,
+             "student_id": USERS + i % USERS + 1,
+             "last_message_at": None if i % 3 == 0 else now - timedelta(minutes=i)}
+            for i in range(1, ROOMS + 1)
+        ])
+        await conn.execute(text("ANALYZE"))
+
+
+async def _room_list_plans(engine, client, user_id: int):  # 목록 첫 페이지/다음 페이지 쿼리의 실행 계획
+    sent = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if "UNION ALL" in statement:
+            sent.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+    try:
+        headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+        first = await client.get("/api/chat/rooms", params={"limit": 5}, headers=headers)
+        assert first.status_code == 200 and len(first.json()) == 5
+        cursor = first.headers[NEXT_CURSOR_HEADER]
+        second = await client.get("/api/chat/rooms", params={"limit": 5, "cursor": cursor}, headers=headers)
+        assert second.status_code == 200 and len(second.json()) == 5
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+
+    assert len(sent) == 2
+    plans = []
+    async with engine.connect() as conn:
+        for statement, parameters in sent:
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plans.append("\n".join(row[0] for row in result))
+    return plans
+
+
+@pytest.mark.parametrize("user_id", [1, USERS + 1], ids=["company", "student"])
+async def test_chat_room_list_scans_both_activity_indexes(pg_engine, pg_client, user_id):
+    await _seed_rooms(pg_engine)
+
+    for plan in await _room_list_plans(pg_engine, pg_client, user_id):
+        assert "ix_chat_rooms_company_activity" in plan
+        assert "ix_chat_rooms_student_activity" in plan
+        assert "Seq Scan" not in plan
@@ -0,0 +1,57 @@
+"""
+챗봇 라우트는 유효한 토큰이 있어도 DB에 접근하지 않는다 (DB 불필요)
+"""
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+from app.database import engine
+from app.deps import create_access_token
+from app.main import create_app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def db_calls():  # 앱 엔진의 커넥션 대여/SQL 실행 횟수
+    calls = {"checkout": 0, "execute": 0}
+
+    def _checkout(*args):
+        calls["checkout"] += 1
+
+    def _execute(*args):
+        calls["execute"] += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", _checkout)
+    event.listen(engine.sync_engine, "before_cursor_execute", _execute)
+    yield calls
+    event.remove(engine.sync_engine, "before_cursor_execute", _execute)
+    event.remove(engine.sync_engine.pool, "checkout", _checkout)
+
+
+@pytest.fixture
+async def client():  # lifespan 없이(스냅샷 갱신 루프 미실행)
+    app = create_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.parametrize("message", ["안녕하세요", "서울 시급 만원 이상 알바 있어?"])
+async def test_chat_with_token_runs_no_queries(client, db_calls, message):
+    headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+
+    response = await client.post("/api/chatbot/chat", json={"message": message}, headers=headers)
+
+    assert response.status_code == 200
+    assert db_calls == {"checkout": 0, "execute": 0}
+
+
+async def test_intents_with_token_runs_no_queries(client, db_calls):
+    headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+
+    first = await client.get("/api/chatbot/intents", headers=headers)
+    cached = await client.get("/api/chatbot/intents", headers={**headers, "If-None-Match": first.headers["ETag"]})
+
+    assert (first.status_code, cached.status_code) == (200, 304)
+    assert db_calls == {"checkout": 0, "execute": 0}
@@ -0,0 +1,77 @@
+"""
+챗봇 키워드 매칭/슬롯 추출 (DB 불필요)
+"""
+
+import pytest
+
+from app.services.chatbot_services import KeywordMatcher, chatbot, extract_min_wage
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("jobs paying over 12000", 12000),
+        ("at least 12k", 12000),
+        ("paying ₩11,000", 11000),
+        ("over 12,000 won", 12000),
+        ("1만2천원 이상", 12000),
+        ("시급 12000원 이상 알바", 12000),
+        ("more than 3 postings paying over 11000", 11000),  # 개수 뒤의 금액
+        ("over 5 jobs", None),
+        ("jobs over 5", None),
+        ("more than 2000 openings", None),
+        ("공고 5 이상", None),
+        ("hello", None),
+    ],
+)
+def test_extract_min_wage(message, expected):
+    assert extract_min_wage(message) == expected
+
+
+@pytest.mark.parametrize(
+    "text, keywords",
+    [
+        ("show me jobs", []),  # "how"는 단어 안에서 매칭되지 않음
+        ("this is high", []),  # "hi"도 마찬가지
+        ("Hi, how are you", ["hi", "how"]),
+        ("who is hiring", ["hiring"]),  # 긴 키워드 우선
+        ("c++ or part-time?", ["c++", "part-time"]),  # 기호 포함 키워드
+    ],
+)
+def test_keyword_matcher_whole_words(text, keywords):
+    matcher = KeywordMatcher({"a": ["how", "hi", "c++"], "b": ["hiring", "part-time"]})
+
+    assert [m.keyword for m in matcher.find_all(text)] == keywords
+
+
+@pytest.mark.parametrize(
+    "text, intent",
+    [
+        ("pay and wage for this job", "wage"),  # 서로 다른 키워드 수가 많은 쪽
+        ("job job job pay wage", "wage"),  # 같은 키워드 반복은 한 번
+        ("pay for this job", "wage"),  # 동률이면 먼저 나온 쪽
+        ("job pay", "job"),
+        ("work", "job"),  # 같은 키워드면 먼저 선언된 쪽
+        ("nothing here", None),
+    ],
+)
+def test_keyword_matcher_tie_break(text, intent):
+    matcher = KeywordMatcher({"job": ["job", "work"], "wage": ["pay", "wage", "work"]})
+
+    assert matcher.best_intent(text) == intent
+
+
+@pytest.mark.parametrize(
+    "message, intent",
+    [
+        ("salaries?", "wage"),
+        ("what wages do cafes offer", "wage"),
+        ("any jobs near me", "job_search"),
+        ("new openings this week", "job_search"),
+        ("applying to a cafe", "apply"),
+    ],
+)
+def test_inflected_keywords_answer_at_keyword_stage(message, intent):
+    answer = chatbot.answer(message)
+
+    assert (answer.source, answer.intent) == ("rule_based", intent)
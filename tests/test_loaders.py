@@ -0,0 +1,29 @@
+"""
+요청 단위 일괄 로더 (DB 불필요)
+"""
+
+import asyncio
+
+import pytest
+
+from app.loaders import BatchLoader
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_loads_in_one_tick_share_a_batch_and_task():
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(list(keys))
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader(batch_fn, asyncio.Lock())
+    futures = [loader.load(key) for key in (1, 2, 3, 1)]
+    assert len(loader._tasks) == 1  # 조회 태스크를 참조로 유지
+
+    assert await asyncio.gather(*futures) == [10, 20, None, 10]
+    await asyncio.sleep(0)  # 완료 콜백 실행
+    assert calls == [[1, 2, 3]]
+    assert loader.batches == 1
+    assert not loader._tasks  # 끝나면 해제
@@ -0,0 +1,51 @@
+import numpy as np
+
+from app.services.recommender import EMPTY_VECTOR, JobPostIndex, score_vectors
+
+
+def _consistent(index: JobPostIndex):  # 행렬 상태 검증
+    for row, (start, end) in enumerate(index.row_span):  # 행별 항목
+        assert (index.rows[start:end] == row).all()  # 위치가 자기 행을 가리킴
+    assert (index.df >= 0).all()  # 문서 빈도는 음수가 될 수 없음
+
+
+def test_upsert_after_compact_keeps_other_rows():  # 압축 후 재수정
+    index = JobPostIndex(dim=1 << 12, capacity=8)
+    index.load([(1, "cafe part time weekend", True), (2, "barista coffee", True)])
+    index.upsert(1, "cafe part time weekday", True)  # 1번 항목이 배열 끝으로 이동
+    index._compact()
+    _consistent(index)
+    index.upsert(1, "cafe part time evening", True)  # 압축 후 다시 수정
+
+    _consistent(index)
+    assert [post_id for post_id, _ in index.top_k("coffee barista")] == [2]
+    cols = np.unique(index.cols[slice(*index.row_span[index.row_of[2]])])
+    assert (index.df[cols] >= 1).all()  # 2번 공고 열의 문서 빈도 유지
+
+
+def test_compact_matches_fresh_build():  # 압축 결과 = 새로 빌드한 결과
+    posts = {i: (f"job {i} skill{i % 5} region{i % 3}", i % 4 != 0) for i in range(40)}
+    index = JobPostIndex(dim=1 << 12, capacity=8)
+    index.load((i, text, is_open) for i, (text, is_open) in posts.items())
+    for i in range(0, 40, 3):  # 일부 수정(열림/닫힘 포함)
+        posts[i] = (f"job {i} updated skill{i % 7}", i % 2 == 0)
+        index.upsert(i, *posts[i])
+    index._compact()
+    assert index.dead_nnz == 0
+
+    fresh = JobPostIndex(dim=1 << 12, capacity=8)
+    fresh.load((i, text, is_open) for i, (text, is_open) in posts.items())
+    _consistent(index)
+    assert (index.df == fresh.df).all()
+    for query in ("skill3", "job 12 updated", "region1"):
+        assert index.top_k(query, 10) == fresh.top_k(query, 10)
+
+
+def test_score_vectors_treats_missing_profiles_as_zero():
+    q = np.zeros(8)
+    q[[1, 3]] = [0.5, 2.0]
+    vector = (np.array([1, 3], dtype=np.int32), np.array([1.0, 1.0], dtype=np.float32))
+
+    scores = score_vectors(q, [vector, None, EMPTY_VECTOR])
+
+    assert scores.tolist() == [2.5, 0.0, 0.0]
@@ -0,0 +1,16 @@
+"""
+빠른 직렬화 경로가 기존 경로와 같은 바이트를 내는지 (DB 불필요)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.serialization_contract import CASES, build_app
+
+
+@pytest.mark.parametrize("name", [case[0] for case in CASES])
+def test_fast_path_matches_response_model(name):
+    app, _ = build_app(200)
+    client = TestClient(app)
+
+    assert client.get(f"/fast/{name}").content == client.get(f"/orm/{name}").content
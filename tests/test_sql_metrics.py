@@ -0,0 +1,31 @@
+"""
+요청 단위 SQL 계측 (Postgres 필요: TEST_DATABASE_URL)
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.sql_metrics import RequestSqlStats, current_sql_stats, instrument_engine
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failed_statement_leaves_no_state(pg_engine):
+    instrument_engine(pg_engine)
+    stats = RequestSqlStats("/test", track_statements=True)
+    token = current_sql_stats.set(stats)
+    try:
+        async with pg_engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(ProgrammingError):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.rollback()
+            assert (await conn.execute(text("SELECT 1"))).scalar_one() == 1
+            info = dict((await conn.get_raw_connection()).info)
+    finally:
+        current_sql_stats.reset(token)
+
+    assert info == {}  # 실패한 문장의 시작 시각이 커넥션에 쌓이지 않음
+    assert stats.count == 1  # 완료된 문장만 집계
+    assert list(stats.statements) == ["SELECT 1"]
@@ -0,0 +1,60 @@
+"""
+ConnectionManager 메모리 상한
+"""
+
+import pytest
+
+from app.websocket_manager import WS_USER_BURST, WS_USER_RATE, ConnectionManager
+
+pytestmark = pytest.mark.anyio
+
+
+def _frame(message_id: int) -> dict:
+    return {"type": "message", "id": message_id}
+
+
+def test_room_history_is_bounded_lru():
+    manager = ConnectionManager(resume_buffer_size=3, resume_max_rooms=2)
+    manager.seed_history(1, [_frame(1)], complete=True)
+    manager.seed_history(2, [_frame(2)], complete=True)
+    assert manager.replay_since(1, 0) == [_frame(1)]  # 방 1을 최근 사용으로
+
+    manager.remember(3, _frame(3))  # 상한 초과 -> 가장 오래 쓰지 않은 방 2 제거
+
+    assert list(manager.room_history) == [1, 3]
+    assert manager.replay_since(2, 0) is None  # DB에서 다시 적재
+    assert not manager.is_history_seeded(2)
+    stats = manager.stats()
+    assert (stats["buffered_rooms"], stats["max_buffered_rooms"], stats["evicted_history"]) == (2, 2, 1)
+    assert stats["buffered_messages"] == 2
+
+
+
+async def test_user_bucket_survives_reconnect():
+    manager = ConnectionManager()
+    first = object()
+    await manager.connect(1, first, user_id=7)
+    allowed = 0
+    while manager.allow_message(first):  # 사용자 순간 허용량 소진
+        allowed += 1
+        manager.connection_info[first].bucket.tokens = 1  # 연결 버킷은 제한하지 않음
+    manager.disconnect(1, first)
+
+    second = object()
+    await manager.connect(1, second, user_id=7)
+
+    assert allowed == WS_USER_BURST
+    assert not manager.allow_message(second)  # 재접속해도 다시 채워지지 않음
+    assert manager.stats()["user_buckets"] == 1
+
+
+def test_full_user_buckets_are_pruned():
+    manager = ConnectionManager(user_bucket_max=2)
+    for user_id in (1, 2, 3):  # 상한 초과 -> 가장 오래 쓰지 않은 1 제거
+        manager._user_bucket(user_id).consume()
+    assert list(manager.user_buckets) == [2, 3]
+
+    manager.user_buckets[2].updated_at -= WS_USER_BURST / WS_USER_RATE  # 다 충전될 만큼 경과
+
+    assert manager.prune_user_buckets() == 1
+    assert list(manager.user_buckets) == [3]